@@ -0,0 +1,143 @@
+"""
+Incremental session aggregates for LeadWave™
+Running top-K, score distribution and breakdowns updated once per lead
+"""
+
+import heapq
+import itertools
+from typing import List, Dict, Iterable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lead_pipeline import BusinessLead
+
+# Confidence scores live in 0-100, one-point bins give exact-to-the-point percentiles
+SCORE_BINS = 101
+
+class TopK:
+    """Bounded min-heap keeping the K highest-scoring leads"""
+
+    def __init__(self, k: int = 100):
+        self.k = k
+        self._heap: List[tuple] = []
+        self._sequence = itertools.count()
+
+    def add(self, lead: 'BusinessLead'):
+        # The sequence number keeps earlier leads ahead on ties and avoids comparing leads
+        entry = (lead.confidence_score, -next(self._sequence), lead)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self, count: int = None) -> List['BusinessLead']:
+        """Leads ordered best first"""
+        ranked = sorted(self._heap, key=lambda entry: entry[:2], reverse=True)
+        return [entry[2] for entry in ranked[:count]]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+class ScoreDistribution:
+    """Online count, mean and histogram-backed percentiles"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.bins = [0] * SCORE_BINS
+
+    def add(self, score: float):
+        self.count += 1
+        self.total += score
+        self.minimum = score if self.minimum is None else min(self.minimum, score)
+        self.maximum = score if self.maximum is None else max(self.maximum, score)
+        self.bins[min(max(int(score), 0), SCORE_BINS - 1)] += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    def percentile(self, percent: float) -> float:
+        """Smallest score bin holding at least percent of the leads"""
+        if not self.count:
+            return 0
+        target = max(1, percent / 100 * self.count)
+        running = 0
+        for score, frequency in enumerate(self.bins):
+            running += frequency
+            if running >= target:
+                return float(score)
+        return float(SCORE_BINS - 1)
+
+class Breakdown:
+    """Per-group lead count, score sum and high-quality count"""
+
+    def __init__(self):
+        self.groups: Dict[str, Dict] = {}
+
+    def add(self, key: str, lead: 'BusinessLead'):
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {'leads': 0, 'score_total': 0.0, 'high_quality_leads': 0}
+        group['leads'] += 1
+        group['score_total'] += lead.confidence_score
+        if lead.confidence_score >= 80:
+            group['high_quality_leads'] += 1
+
+    def report(self) -> Dict[str, Dict]:
+        return {
+            key: {
+                'leads': group['leads'],
+                'high_quality_leads': group['high_quality_leads'],
+                'average_confidence': group['score_total'] / group['leads']
+            }
+            for key, group in self.groups.items()
+        }
+
+class SessionAggregates:
+    """Running aggregates over accepted leads"""
+
+    def __init__(self, top_k: int = 100):
+        self.top_k = top_k
+        self.reset()
+
+    def reset(self):
+        self.top = TopK(self.top_k)
+        self.scores = ScoreDistribution()
+        self.by_industry = Breakdown()
+        self.by_state = Breakdown()
+
+    @property
+    def count(self) -> int:
+        return self.scores.count
+
+    def add(self, lead: 'BusinessLead'):
+        """Fold one lead into every aggregate"""
+        self.top.add(lead)
+        self.scores.add(lead.confidence_score)
+        self.by_industry.add(lead.industry or 'unknown', lead)
+        self.by_state.add(lead.state or 'unknown', lead)
+
+    def rebuild(self, leads: Iterable['BusinessLead']):
+        """Recompute from scratch after leads were replaced or rescored"""
+        self.reset()
+        for lead in leads:
+            self.add(lead)
+
+    def top_leads(self, count: int = 10) -> List['BusinessLead']:
+        return self.top.items(count)
+
+    def report(self) -> Dict:
+        return {
+            'average_confidence': self.scores.mean,
+            'score_percentiles': {
+                'p50': self.scores.percentile(50),
+                'p90': self.scores.percentile(90),
+                'p99': self.scores.percentile(99),
+                'min': self.scores.minimum or 0,
+                'max': self.scores.maximum or 0
+            },
+            'by_industry': self.by_industry.report(),
+            'by_state': self.by_state.report()
+        }
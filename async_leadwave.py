@@ -0,0 +1,163 @@
+"""
+Asyncio-native LeadWave™ API
+Runs the blocking pipeline stages off the event loop with bounded concurrency
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, AsyncIterator
+
+from config import Config
+from leadwave import LeadWave
+from lead_pipeline import BusinessLead
+from resilience import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+class AsyncLeadWave:
+    """Async facade over LeadWave for callers running inside an event loop"""
+
+    def __init__(self, leadwave: LeadWave = None, max_concurrency: int = None,
+                 timeout: float = None):
+        self.leadwave = leadwave or LeadWave()
+        # Hard ceiling, the pipeline's autotuner picks the in-flight window below it
+        self.max_concurrency = max_concurrency or self.leadwave.concurrency.maximum
+        self.timeout = timeout if timeout is not None else Config.REQUEST_TIMEOUT
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix='leadwave'
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def concurrency(self):
+        return self.leadwave.concurrency
+
+    @property
+    def leads(self) -> List[BusinessLead]:
+        return self.leadwave.leads
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """Shut down the worker threads without blocking the loop"""
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: self._executor.shutdown(wait=True, cancel_futures=True)
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore binds to the loop that uses it
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _run_blocking(self, func, *args):
+        """Run a blocking call in the worker pool under the concurrency bound"""
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, func, *args)
+            return await asyncio.wait_for(future, timeout=self.timeout)
+
+    def _tuned(self, source: str, func):
+        """Wrap a blocking call so it runs under an autotuned concurrency slot"""
+        def run(*args):
+            with self.concurrency.slot(source):
+                return func(*args)
+        return run
+
+    def _fetch(self, industry: str, location: str, count: int) -> List[Dict]:
+        """Fetch under the source's circuit breaker and retry budget, nothing if the circuit is open"""
+        try:
+            return self.leadwave.resilience.call(
+                self.leadwave._fetch, industry, location, count, source=self.leadwave.source.name
+            )
+        except CircuitOpenError as e:
+            logger.warning(f"⚡ Skipping {self.leadwave.source.name}: {e}")
+            return []
+
+    async def stream_leads(self, industry: str, location: str,
+                           max_leads: int = 50) -> AsyncIterator[BusinessLead]:
+        """Yield accepted leads as soon as each business finishes processing"""
+        logger.info(f"🌊 Starting async LeadWave™ generation for {industry} in {location}")
+
+        businesses = await self._run_blocking(self._fetch, industry, location, max_leads)
+
+        if not businesses:
+            logger.warning("No businesses found")
+            return
+
+        pending = set()
+        remaining = iter(businesses)
+        emitted = 0
+        build = self._tuned(self.leadwave.source.name, self.leadwave._build_lead)
+
+        def schedule():
+            # Keep the autotuned number of builds in flight
+            window = min(self.max_concurrency, self.concurrency.current_limit(self.leadwave.source.name))
+            for business_data in remaining:
+                if self.leadwave._is_suppressed(business_data):
+                    continue
+                pending.add(asyncio.ensure_future(
+                    self._run_blocking(build, business_data, industry)
+                ))
+                if len(pending) >= window:
+                    break
+
+        try:
+            schedule()
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                pending.difference_update(done)
+
+                for task in done:
+                    try:
+                        lead = task.result()
+                    except asyncio.TimeoutError:
+                        logger.error(f"Timed out processing business after {self.timeout}s")
+                        continue
+                    except Exception as e:
+                        logger.error(f"Error processing business: {e}")
+                        continue
+
+                    if lead:
+                        # Stats are only touched from the loop thread
+                        self.leadwave._record_extraction(lead)
+
+                    if self.leadwave._accept_lead(lead):
+                        self.leadwave._add_lead(lead)
+                        emitted += 1
+                        yield lead
+
+                        if emitted >= max_leads:
+                            return
+
+                schedule()
+
+        finally:
+            # Runs on cancellation, early exit and aclose() alike
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    async def generate_leads(self, industry: str, location: str,
+                             max_leads: int = 50) -> List[BusinessLead]:
+        """Collect the streamed leads into a list"""
+        leads = [lead async for lead in self.stream_leads(industry, location, max_leads)]
+        logger.info(f"✅ Generated {len(leads)} high-quality leads")
+        return leads
+
+    async def save_leads(self, filename: str = None, format: str = 'csv') -> str:
+        """Write leads to disk without blocking the loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.leadwave.save_leads, filename, format)
+
+    def get_session_report(self) -> Dict:
+        """Get detailed session statistics"""
+        return self.leadwave.get_session_report()
@@ -0,0 +1,166 @@
+"""
+Campaign result cache for LeadWave™
+Serves repeated (industry, location, max_leads) queries from memory
+"""
+
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, replace, asdict
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+
+from config import Config
+from gazetteer import resolve_location, normalize_name, ZIP_PATTERN
+from industry_classifier import classify_industry
+from suppression import business_keys
+
+if TYPE_CHECKING:
+    from lead_pipeline import BusinessLead, LeadPipeline
+
+logger = logging.getLogger(__name__)
+
+def normalize_query(industry: str, location: str) -> Tuple[str, str]:
+    """Cache key shared by spellings of the same industry and place
+
+    The industry category only prefixes the normalized text, so different
+    queries in one category ("italian restaurants", "chinese restaurants")
+    keep separate entries.
+    """
+    industry_text = normalize_name(industry or '')
+    category = classify_industry(industry or '', default=None)
+    industry_key = f"{category}:{industry_text}" if category else industry_text
+
+    place = resolve_location(location or '')
+    zip_match = ZIP_PATTERN.search(location or '')
+    if zip_match:
+        location_key = zip_match.group(1)
+    elif place:
+        location_key = f"{normalize_name(place.city)}|{place.state}"
+    else:
+        location_key = normalize_name(location or '')
+
+    return industry_key, location_key
+
+def _copy_lead(lead: 'BusinessLead') -> 'BusinessLead':
+    # Sessions rescore and edit leads in place, the cache keeps its own copies
+    return replace(lead, social_media=dict(lead.social_media or {}))
+
+@dataclass
+class CachedCampaign:
+    """Leads produced for one normalized query"""
+    leads: List['BusinessLead']
+    requested: int
+    expires: float
+
+class CampaignCache:
+    """TTL + LRU cache of campaign results with single-flight generation"""
+
+    def __init__(self, ttl: float = None, max_entries: int = None):
+        self.ttl = ttl if ttl is not None else Config.CAMPAIGN_CACHE_TTL
+        self.max_entries = max_entries or Config.CAMPAIGN_CACHE_SIZE
+        self._entries: 'OrderedDict[Tuple, CachedCampaign]' = OrderedDict()
+        self._inflight: Dict[Tuple, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'extensions': 0, 'coalesced': 0, 'evictions': 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _valid_entry(self, key: Tuple, now: float) -> Optional[CachedCampaign]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(self, key: Tuple, leads: List['BusinessLead'], requested: int):
+        with self._lock:
+            self._entries[key] = CachedCampaign(leads, requested, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def generate(self, pipeline: 'LeadPipeline', industry: str, location: str,
+                 max_leads: int = 50) -> List['BusinessLead']:
+        """Serve a campaign from cache, extending or generating it through the pipeline"""
+        key = (pipeline.source.name,) + normalize_query(industry, location)
+
+        while True:
+            with self._lock:
+                entry = self._valid_entry(key, time.monotonic())
+                hit = entry is not None and entry.requested >= max_leads
+                if hit:
+                    self.stats['hits'] += 1
+                    cached = entry.leads[:max_leads]
+                else:
+                    future = self._inflight.get(key)
+                    owner = future is None
+                    if owner:
+                        future = self._inflight[key] = Future()
+                        base = list(entry.leads) if entry else []
+                        self.stats['extensions' if entry else 'misses'] += 1
+                    else:
+                        self.stats['coalesced'] += 1
+
+            if hit:
+                return self._serve(pipeline, cached)
+            if owner:
+                break
+            # Wait for the identical query in flight, then look again
+            future.result()
+
+        try:
+            leads = self._serve(pipeline, base)
+            seen = {business_key for lead in base for business_key in business_keys(asdict(lead))}
+
+            fresh = pipeline._run_campaign(
+                industry, location, max_leads - len(base),
+                skip=lambda business: any(business_key in seen for business_key in business_keys(business)),
+                fetch_count=max_leads
+            )
+            leads.extend(fresh)
+
+            stored = base + [_copy_lead(lead) for lead in fresh]
+            # A source with nothing more to return makes a short result complete for max_leads.
+            # One cut short by suppressed or rejected businesses only covers what it holds,
+            # so a later request for max_leads extends it instead of being served short
+            complete = len(stored) >= max_leads or pipeline.source_exhausted
+            self._store(key, stored, max_leads if complete else len(stored))
+            if base:
+                logger.info(f"🗃️  Extended cached campaign {key} from {len(base)} to {len(base) + len(fresh)} leads")
+            return leads
+
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            future.set_result(None)
+
+    def _serve(self, pipeline: 'LeadPipeline', cached: List['BusinessLead']) -> List['BusinessLead']:
+        """Add copies of cached leads to the pipeline's session, minus suppressed ones"""
+        served = []
+        for lead in cached:
+            if pipeline._is_suppressed(asdict(lead)):
+                continue
+            lead = _copy_lead(lead)
+            pipeline._accept_lead(lead)
+            pipeline._add_lead(lead)
+            served.append(lead)
+
+        pipeline.session_stats['cached_leads'] += len(served)
+        return served
+
+    def invalidate(self, industry: str = None, location: str = None):
+        """Drop one query for every source, or everything when called without arguments"""
+        with self._lock:
+            if industry is None and location is None:
+                self._entries.clear()
+                return
+            query = normalize_query(industry, location)
+            for key in [key for key in self._entries if key[1:] == query]:
+                del self._entries[key]
@@ -0,0 +1,58 @@
+"""
+Business name canonicalization for LeadWave™
+Slugs, cleaned names and dedup keys, computed once per distinct name
+"""
+
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+
+# Template-derived names repeat heavily, this covers far more distinct names than a campaign sees
+CACHE_SIZE = 65536
+
+# Page title decorations stripped from scraped business names
+TITLE_SUFFIXES = (
+    ' - Home', ' | Home', ' - Welcome', ' | Welcome',
+    ' - Official Site', ' | Official Site'
+)
+
+_NON_ALPHANUMERIC = re.compile(r'[^a-z0-9 ]')
+
+@dataclass(frozen=True)
+class CanonicalName:
+    """Every normalized form of one business name"""
+    cleaned: str
+    slug: str
+    key: str
+
+@lru_cache(maxsize=CACHE_SIZE)
+def canonicalize(name: str) -> CanonicalName:
+    """All forms of a name, shared and interned across every lead that carries it"""
+    cleaned = name.strip()
+    for suffix in TITLE_SUFFIXES:
+        if cleaned.endswith(suffix):
+            cleaned = cleaned[:-len(suffix)]
+    cleaned = cleaned.strip()
+
+    slug = cleaned.lower().replace("'", "").replace(' ', '').replace('&', 'and')
+    key = ' '.join(_NON_ALPHANUMERIC.sub(' ', cleaned.lower()).split())
+    return CanonicalName(sys.intern(cleaned), sys.intern(slug), sys.intern(key))
+
+def clean_name(name: str) -> str:
+    """Name without page title decorations such as ' - Home'"""
+    return canonicalize(name).cleaned if name else ''
+
+def slug(name: str) -> str:
+    """Compact lowercase form used for website domains and social handles"""
+    return canonicalize(name).slug if name else ''
+
+def name_key(name: str) -> str:
+    """Lowercase name with punctuation collapsed, for matching the same business"""
+    return canonicalize(name).key if name else ''
+
+def dedup_key(name: str, zip_code: str) -> str:
+    """name+ZIP key identifying a business when phone and domain are missing"""
+    key = name_key(name)
+    zip_code = (zip_code or '')[:5]
+    return f"name:{key}|{zip_code}" if key and zip_code else ''
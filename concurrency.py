@@ -0,0 +1,190 @@
+"""
+Adaptive concurrency for LeadWave™ fetch workers
+AIMD limits per source and globally, driven by latency, errors and 429s
+"""
+
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional, Iterator
+
+from config import Config
+from resilience import error_status
+
+logger = logging.getLogger(__name__)
+
+OK = 'ok'
+ERROR = 'error'
+THROTTLED = 'throttled'
+
+class Slot:
+    """Outcome of one request made under a concurrency slot"""
+
+    def __init__(self):
+        self.outcome = OK
+
+    def observe_status(self, status: int):
+        """Classify an HTTP status code"""
+        if status == 429:
+            self.outcome = THROTTLED
+        elif status >= 500:
+            self.outcome = ERROR
+
+    def observe_exception(self, error: Exception):
+        """Classify a failed request, HTTP errors by status like observe_status"""
+        status = error_status(error)
+        if status is None:
+            self.outcome = ERROR
+        else:
+            # A 404 or 403 says nothing about load on the far end
+            self.observe_status(status)
+
+class AIMDLimiter:
+    """Additive-increase / multiplicative-decrease bound on in-flight requests"""
+
+    def __init__(self, name: str, initial: int = None, minimum: int = 1, maximum: int = None,
+                 decrease_factor: float = 0.5, latency_tolerance: float = 3.0,
+                 error_threshold: float = 0.2, window: int = 20, react_to_throttling: bool = True,
+                 baseline_decay: float = 0.01):
+        self.name = name
+        self.minimum = minimum
+        self.maximum = maximum or Config.MAX_CONCURRENCY
+        self.limit = float(min(max(initial or Config.MAX_WORKERS, minimum), self.maximum))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.error_threshold = error_threshold
+        self.react_to_throttling = react_to_throttling
+        self.baseline_decay = baseline_decay
+
+        self.in_flight = 0
+        self._condition = threading.Condition()
+        self._failures = deque(maxlen=window)
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._last_decrease = 0.0
+        self.stats = {'requests': 0, 'errors': 0, 'throttled': 0, 'decreases': 0, 'peak_in_flight': 0}
+
+    def acquire(self, timeout: float = None) -> bool:
+        """Block until a slot is free under the current limit"""
+        with self._condition:
+            if not self._condition.wait_for(lambda: self.in_flight < int(self.limit), timeout):
+                return False
+            self.in_flight += 1
+            self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self.in_flight)
+            return True
+
+    def release(self, latency: float, outcome: str = OK):
+        """Free a slot and adjust the limit from what the request observed"""
+        with self._condition:
+            self.in_flight -= 1
+            self._record(latency, outcome)
+            self._condition.notify_all()
+
+    def _record(self, latency: float, outcome: str):
+        self.stats['requests'] += 1
+        self._failures.append(outcome != OK)
+
+        if outcome == THROTTLED:
+            self.stats['throttled'] += 1
+            if self.react_to_throttling:
+                self._decrease()
+            return
+
+        if outcome == ERROR:
+            self.stats['errors'] += 1
+            if len(self._failures) >= 5 and sum(self._failures) / len(self._failures) >= self.error_threshold:
+                self._decrease()
+            return
+
+        # Smoothed latency against a minimum that drifts up slowly, so a lasting
+        # shift in latency becomes the new baseline instead of tripping forever
+        self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+        if self._baseline is None or self._latency < self._baseline:
+            self._baseline = self._latency
+        else:
+            self._baseline += (self._latency - self._baseline) * self.baseline_decay
+
+        if self._latency > self._baseline * self.latency_tolerance:
+            self._decrease()
+        elif self.in_flight + 1 >= int(self.limit):
+            # Only grow while the limit is actually binding, about one slot per round trip
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+    def _decrease(self):
+        # One cut per round trip, a burst of concurrent failures is one congestion signal
+        now = time.monotonic()
+        if now - self._last_decrease < (self._latency or 0.01):
+            return
+        self._last_decrease = now
+        self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+        self.stats['decreases'] += 1
+        self._condition.notify_all()
+        logger.debug(f"Concurrency for {self.name} reduced to {int(self.limit)}")
+
+    def report(self) -> Dict:
+        with self._condition:
+            return {
+                'limit': int(self.limit),
+                'in_flight': self.in_flight,
+                'latency_ms': round((self._latency or 0) * 1000, 1),
+                **self.stats
+            }
+
+class AdaptiveConcurrency:
+    """Global limiter plus one limiter per source (directory, host or domain)"""
+
+    def __init__(self, initial: int = None, maximum: int = None, per_source_maximum: int = None):
+        self.initial = initial or Config.MAX_WORKERS
+        self.per_source_maximum = per_source_maximum or Config.MAX_CONCURRENCY_PER_SOURCE
+        # The global limit only reacts to overload on our side, 429s are a per-source signal
+        self.global_limiter = AIMDLimiter('global', self.initial, maximum=maximum or Config.MAX_CONCURRENCY,
+                                          react_to_throttling=False)
+        self._limiters: Dict[str, AIMDLimiter] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def maximum(self) -> int:
+        return self.global_limiter.maximum
+
+    def limiter(self, source: str) -> AIMDLimiter:
+        with self._lock:
+            limiter = self._limiters.get(source)
+            if limiter is None:
+                limiter = self._limiters[source] = AIMDLimiter(
+                    source, self.initial, maximum=min(self.per_source_maximum, self.maximum)
+                )
+            return limiter
+
+    def current_limit(self, source: str = None) -> int:
+        limit = int(self.global_limiter.limit)
+        return min(limit, int(self.limiter(source).limit)) if source else limit
+
+    @contextmanager
+    def slot(self, source: str = 'default') -> Iterator[Slot]:
+        """Hold a per-source and a global slot for one request"""
+        limiter = self.limiter(source)
+        # Always source first, then global, so waiting threads never hold a global slot
+        limiter.acquire()
+        self.global_limiter.acquire()
+
+        slot = Slot()
+        start = time.monotonic()
+        try:
+            yield slot
+        except Exception as e:
+            slot.observe_exception(e)
+            raise
+        finally:
+            latency = time.monotonic() - start
+            self.global_limiter.release(latency, slot.outcome)
+            limiter.release(latency, slot.outcome)
+
+    def report(self) -> Dict:
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {
+            'global': self.global_limiter.report(),
+            'sources': {name: limiter.report() for name, limiter in sorted(limiters.items())}
+        }
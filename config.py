@@ -9,18 +9,33 @@ class Config:
     """Configuration class with error handling"""
     
     # Scraping settings
-    MAX_WORKERS = int(os.getenv('MAX_WORKERS', '3'))
+    MAX_WORKERS = int(os.getenv('MAX_WORKERS', '3'))  # Starting concurrency, autotuned from there
+    MAX_CONCURRENCY = int(os.getenv('MAX_CONCURRENCY', '32'))
+    MAX_CONCURRENCY_PER_SOURCE = int(os.getenv('MAX_CONCURRENCY_PER_SOURCE', '8'))
     REQUEST_TIMEOUT = int(os.getenv('REQUEST_TIMEOUT', '30'))
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
     DELAY_RANGE = (1, 3)  # Random delay between requests
     
     # File settings
     OUTPUT_DIR = os.getenv('OUTPUT_DIR', 'output')
+    GAZETTEER_PATH = os.getenv('GAZETTEER_PATH', '')
+    
+    # Suppression list of previously delivered businesses
+    SUPPRESSION_PATH = os.getenv('SUPPRESSION_PATH', '')
+    SUPPRESSION_CAPACITY = int(os.getenv('SUPPRESSION_CAPACITY', '50000000'))
+    SUPPRESSION_ERROR_RATE = float(os.getenv('SUPPRESSION_ERROR_RATE', '0.001'))
+    
+    # Campaign result cache
+    CAMPAIGN_CACHE_TTL = int(os.getenv('CAMPAIGN_CACHE_TTL', '3600'))
+    CAMPAIGN_CACHE_SIZE = int(os.getenv('CAMPAIGN_CACHE_SIZE', '256'))
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     
     # Error handling settings
     SKIP_ERRORS = ['404', '403', '500', '502', '503', '504']
     RETRYABLE_ERRORS = ['ConnectionError', 'Timeout', 'ReadTimeout']
+    BREAKER_FAILURE_THRESHOLD = int(os.getenv('BREAKER_FAILURE_THRESHOLD', '5'))
+    BREAKER_RECOVERY_SECONDS = float(os.getenv('BREAKER_RECOVERY_SECONDS', '30'))
+    RETRY_BUDGET_RATIO = float(os.getenv('RETRY_BUDGET_RATIO', '0.2'))  # Retries allowed per first attempt
     
     # Data validation
     MIN_EMAIL_LENGTH = 5
@@ -39,6 +54,7 @@ class Config:
             
             # Validate numeric settings
             assert cls.MAX_WORKERS > 0, "MAX_WORKERS must be positive"
+            assert cls.MAX_CONCURRENCY >= cls.MAX_WORKERS, "MAX_CONCURRENCY must be at least MAX_WORKERS"
             assert cls.REQUEST_TIMEOUT > 0, "REQUEST_TIMEOUT must be positive"
             assert cls.MAX_RETRIES >= 0, "MAX_RETRIES must be non-negative"
             
@@ -50,14 +66,17 @@ class Config:
 
 # Industry-specific search terms for lead generation
 INDUSTRY_KEYWORDS = {
-    'restaurants': ['restaurant', 'cafe', 'diner', 'bistro', 'eatery'],
+    'restaurants': ['restaurant', 'cafe', 'diner', 'bistro', 'eatery', 'food', 'dining', 'pizzeria', 'grill'],
     'retail': ['store', 'shop', 'boutique', 'retail', 'market'],
-    'services': ['service', 'repair', 'maintenance', 'consulting'],
-    'healthcare': ['clinic', 'medical', 'dental', 'healthcare', 'therapy'],
+    'services': ['service', 'repair', 'maintenance', 'consulting', 'contractor', 'landscaping', 'hvac'],
+    'healthcare': ['clinic', 'medical', 'healthcare', 'therapy', 'chiropractic', 'physician'],
+    'dental': ['dental', 'dentist', 'dentistry', 'orthodontic', 'orthodontist'],
+    'plumbing': ['plumbing', 'plumber', 'pipe', 'drain'],
     'automotive': ['auto', 'car', 'automotive', 'mechanic', 'dealership'],
     'real_estate': ['real estate', 'realtor', 'property', 'homes', 'realty'],
-    'fitness': ['gym', 'fitness', 'yoga', 'pilates', 'training'],
-    'beauty': ['salon', 'spa', 'beauty', 'barber', 'cosmetic']
+    'fitness': ['gym', 'fitness', 'yoga', 'pilates', 'training', 'workout'],
+    'beauty': ['salon', 'spa', 'beauty', 'barber', 'cosmetic', 'hair', 'nails'],
+    'tech': ['tech', 'technology', 'software', 'computer', 'web design', 'digital marketing', 'cyber security']
 }
 
 # Common business directory URLs (for future implementation)
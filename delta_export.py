@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+Delta exports for LeadWave™
+Added, removed and changed leads between two snapshots, keyed by a stable
+lead key and compared through hash-partitioned key runs
+"""
+
+import os
+import re
+import csv
+import glob
+import json
+import math
+import hashlib
+import logging
+import shutil
+import argparse
+import tempfile
+from dataclasses import fields, asdict
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
+
+from config import Config
+from lead_pipeline import BusinessLead
+from lead_reader import LeadFileReader
+from suppression import business_keys
+from exporters import (EXCEL_COLUMNS, FORMAT_SUFFIXES, COMPRESSION_SUFFIXES, compression_of,
+                       open_binary_input, open_text_output, output_path)
+
+logger = logging.getLogger(__name__)
+
+# last_updated is stamped on every run, it is not a change
+DIFF_FIELDS = [f.name for f in fields(BusinessLead) if f.name != 'last_updated']
+FIELD_BITS = {name: 1 << index for index, name in enumerate(DIFF_FIELDS)}
+DELTA_COLUMNS = ['change', 'lead_key', 'changed_fields', 'field_mask'] + EXCEL_COLUMNS
+
+# Keys per hash bucket, only one bucket of the previous snapshot is held in memory at a time
+BUCKET_ROWS = 500000
+
+# Snapshot formats LeadFileReader can read back
+SNAPSHOT_FORMATS = ('csv', 'jsonl', 'json')
+
+# Timestamp save_leads appends to default filenames, a series shares everything before it
+TIMESTAMP_SUFFIX = re.compile(r'\d{8}_\d{6}$')
+
+def lead_key(record: Dict) -> str:
+    """Stable key of a lead: phone, else domain, else name+ZIP, else a hash of name and address"""
+    keys = business_keys(record)
+    if keys:
+        return keys[0]
+    identity = f"{record.get('business_name', '')}|{record.get('address', '')}".lower()
+    return f"hash:{hashlib.blake2b(identity.encode('utf-8'), digest_size=8).hexdigest()}"
+
+def _comparable(value):
+    # Typed values from memory and coerced values from a CSV read back must agree
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def _digest(lead: Dict) -> str:
+    values = [_comparable(lead.get(name)) for name in DIFF_FIELDS]
+    payload = json.dumps(values, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=12).hexdigest()
+
+def field_mask(old: Dict, new: Dict) -> Tuple[List[str], int]:
+    """Names of the fields that differ and the matching DIFF_FIELDS bitmask"""
+    changed = [name for name in DIFF_FIELDS if _comparable(old.get(name)) != _comparable(new.get(name))]
+    return changed, sum(FIELD_BITS[name] for name in changed)
+
+class Snapshot:
+    """Random-access view of lead dicts, from an export file or from memory"""
+
+    def __init__(self, leads: List = None, reader: LeadFileReader = None, temporary: str = None):
+        self._leads = leads
+        self._reader = reader
+        self._temporary = temporary
+
+    @classmethod
+    def open(cls, path: str) -> 'Snapshot':
+        compression = compression_of(path)
+        if compression is None:
+            return cls(reader=LeadFileReader(path))
+
+        # The reader memory-maps plain files, so a compressed export is expanded to a temporary copy
+        plain = path[:-len(COMPRESSION_SUFFIXES[compression])]
+        handle, temporary = tempfile.mkstemp(prefix='leadwave-snapshot-', suffix=os.path.splitext(plain)[1])
+        try:
+            with os.fdopen(handle, 'wb') as target, open_binary_input(path, compression) as source:
+                shutil.copyfileobj(source, target, 1 << 20)
+            return cls(reader=LeadFileReader(temporary), temporary=temporary)
+        except Exception:
+            os.remove(temporary)
+            raise
+
+    def __len__(self) -> int:
+        return len(self._leads) if self._leads is not None else len(self._reader)
+
+    def lead(self, position: int) -> Dict:
+        if self._leads is not None:
+            lead = self._leads[position]
+            return lead if isinstance(lead, dict) else asdict(lead)
+        return asdict(self._reader.to_lead(self._reader.record(position)))
+
+    def close(self):
+        if self._reader:
+            self._reader.close()
+        if self._temporary:
+            os.remove(self._temporary)
+            self._temporary = None
+
+class _KeyRuns:
+    """(key, digest, position) runs of one snapshot split into hash buckets"""
+
+    def __init__(self, snapshot: Snapshot, bucket_count: int, directory: str, name: str):
+        self.bucket_count = bucket_count
+        self.in_memory: List[List[Tuple[str, str, int]]] = []
+        self.paths: List[str] = []
+
+        if bucket_count == 1:
+            self.in_memory = [[self._entry(snapshot, position) for position in range(len(snapshot))]]
+            return
+
+        self.paths = [os.path.join(directory, f"{name}-{index:04d}.tsv") for index in range(bucket_count)]
+        handles = [open(path, 'w', encoding='utf-8') for path in self.paths]
+        try:
+            for position in range(len(snapshot)):
+                key, digest, _ = self._entry(snapshot, position)
+                handles[self.bucket(key)].write(f"{key}\t{digest}\t{position}\n")
+        finally:
+            for handle in handles:
+                handle.close()
+
+    @staticmethod
+    def _entry(snapshot: Snapshot, position: int) -> Tuple[str, str, int]:
+        lead = snapshot.lead(position)
+        return lead_key(lead), _digest(lead), position
+
+    def bucket(self, key: str) -> int:
+        return int.from_bytes(hashlib.blake2b(key.encode('utf-8'), digest_size=4).digest(), 'little') % self.bucket_count
+
+    def entries(self, index: int) -> Iterator[Tuple[str, str, int]]:
+        if self.in_memory:
+            yield from self.in_memory[index]
+            return
+        with open(self.paths[index], encoding='utf-8') as f:
+            for line in f:
+                key, digest, position = line.rstrip('\n').split('\t')
+                yield key, digest, int(position)
+
+class DeltaWriter:
+    """Writes delta rows as CSV or JSONL, optionally compressed"""
+
+    def __init__(self, path: str, format: str = 'csv', compression: str = None):
+        if format not in ('csv', 'jsonl'):
+            raise ValueError(f"Delta exports support csv and jsonl, not {format}")
+        self.path = path
+        self.format = format
+        self._file = open_text_output(path, compression)
+        self._writer = None
+        if format == 'csv':
+            self._writer = csv.DictWriter(self._file, fieldnames=DELTA_COLUMNS, extrasaction='ignore')
+            self._writer.writeheader()
+
+    def write(self, change: str, key: str, lead: Dict, changed_fields: List[str] = (), mask: int = 0):
+        row = {'change': change, 'lead_key': key, 'changed_fields': '|'.join(changed_fields), 'field_mask': mask}
+        row.update(lead)
+        if self._writer:
+            self._writer.writerow(row)
+        else:
+            self._file.write(json.dumps(row, ensure_ascii=False, default=str) + '\n')
+
+    def close(self):
+        self._file.close()
+
+def diff(old: Snapshot, new: Snapshot, writer: DeltaWriter, bucket_rows: int = BUCKET_ROWS) -> Dict:
+    """Write added, removed and changed leads, returns the counts"""
+    bucket_count = max(1, math.ceil((len(old) + len(new)) / bucket_rows))
+    summary = {'added': 0, 'removed': 0, 'changed': 0, 'unchanged': 0, 'duplicate_keys': 0, 'buckets': bucket_count}
+
+    with tempfile.TemporaryDirectory(prefix='leadwave-delta-') as directory:
+        old_runs = _KeyRuns(old, bucket_count, directory, 'old')
+        new_runs = _KeyRuns(new, bucket_count, directory, 'new')
+
+        for index in range(bucket_count):
+            previous: Dict[str, Tuple[str, int]] = {}
+            for key, digest, position in old_runs.entries(index):
+                if key in previous:
+                    summary['duplicate_keys'] += 1
+                previous[key] = (digest, position)
+
+            seen = set()
+            for key, digest, position in new_runs.entries(index):
+                if key in seen:
+                    summary['duplicate_keys'] += 1
+                    continue
+                seen.add(key)
+
+                match = previous.pop(key, None)
+                if match is None:
+                    writer.write('added', key, new.lead(position))
+                    summary['added'] += 1
+                elif match[0] != digest:
+                    # Only changed rows are parsed a second time to build the mask
+                    lead = new.lead(position)
+                    changed, mask = field_mask(old.lead(match[1]), lead)
+                    writer.write('changed', key, lead, changed, mask)
+                    summary['changed'] += 1
+                else:
+                    summary['unchanged'] += 1
+
+            for key, (_, position) in previous.items():
+                writer.write('removed', key, old.lead(position))
+                summary['removed'] += 1
+
+    return summary
+
+def latest_snapshot(filename: str = None, format: str = 'csv', compression: str = None) -> Optional[str]:
+    """Most recent full export in the same series as filename, deltas excluded
+
+    A filename ending in save_leads' timestamp matches every export sharing the
+    part before it, any other filename only matches an earlier export of itself.
+    Without a filename the default leadwave_leads_<timestamp> series is searched.
+    Bare filenames are looked up in Config.OUTPUT_DIR.
+    """
+    directory, name = os.path.split(filename or '')
+    stem = TIMESTAMP_SUFFIX.sub('', name) if name else 'leadwave_leads_'
+    suffix = f"{FORMAT_SUFFIXES[format]}{COMPRESSION_SUFFIXES[compression]}"
+    series = stem != name
+
+    pattern = f"{glob.escape(stem)}*{suffix}" if series else f"{glob.escape(name)}{suffix}"
+    snapshots = []
+    for path in glob.glob(os.path.join(directory or Config.OUTPUT_DIR, pattern)):
+        rest = os.path.basename(path)[len(stem):-len(suffix)]
+        if not series or TIMESTAMP_SUFFIX.fullmatch(rest):
+            snapshots.append(path)
+    return max(snapshots, key=os.path.getmtime) if snapshots else None
+
+def write_delta(previous: str, leads: Iterable, path: str, format: str = 'csv',
+                compression: str = None, bucket_rows: int = BUCKET_ROWS) -> Dict:
+    """Delta of in-memory leads (or a snapshot path) against a previous snapshot file"""
+    old = Snapshot.open(previous)
+    new = Snapshot.open(leads) if isinstance(leads, str) else Snapshot(list(leads))
+    writer = DeltaWriter(path, format, compression)
+    try:
+        summary = diff(old, new, writer, bucket_rows)
+    finally:
+        writer.close()
+        old.close()
+        new.close()
+
+    summary['path'] = path
+    logger.info(f"🔀 Delta against {previous}: {summary['added']} added, {summary['changed']} changed, "
+                f"{summary['removed']} removed, {summary['unchanged']} unchanged")
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Write the leads added, removed and changed between two LeadWave™ exports")
+    parser.add_argument('previous', help="Earlier CSV, JSONL or JSON export")
+    parser.add_argument('current', help="Later export")
+    parser.add_argument('-o', '--output', help="Delta file name, defaults to <current>_delta")
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv')
+    parser.add_argument('--compression', choices=['gzip', 'zstd'])
+    parser.add_argument('--bucket-rows', type=int, default=BUCKET_ROWS)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    current = args.current
+    if compression_of(current):
+        current = current[:-len(COMPRESSION_SUFFIXES[compression_of(current)])]
+    filename = args.output or f"{os.path.splitext(current)[0]}_delta"
+    summary = write_delta(args.previous, args.current, output_path(filename, args.format, args.compression),
+                          args.format, args.compression, args.bucket_rows)
+    print(json.dumps(summary, indent=2))
+
+if __name__ == "__main__":
+    main()
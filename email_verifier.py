@@ -0,0 +1,214 @@
+"""
+Email deliverability verification for LeadWave™ leads
+Checks MX records once per domain through a shared TTL cache
+"""
+
+import time
+import socket
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Iterable, Tuple
+
+from config import Config
+from utils import DataValidator
+
+logger = logging.getLogger(__name__)
+
+try:
+    import dns.resolver
+    import dns.exception
+except ImportError:  # dnspython is optional, fall back to address lookups
+    dns = None
+
+# Consumer mailbox providers, mail to these rarely reaches a business owner directly
+FREE_MAIL_DOMAINS = {
+    'gmail.com', 'googlemail.com', 'yahoo.com', 'ymail.com', 'hotmail.com',
+    'outlook.com', 'live.com', 'msn.com', 'aol.com', 'icloud.com', 'me.com',
+    'mac.com', 'comcast.net', 'verizon.net', 'att.net', 'charter.net',
+    'protonmail.com', 'proton.me', 'gmx.com', 'mail.com', 'zoho.com'
+}
+
+DELIVERABLE = 'deliverable'
+UNDELIVERABLE = 'undeliverable'
+UNKNOWN = 'unknown'
+INVALID = 'invalid'
+
+class ResolverError(Exception):
+    """Raised when a lookup fails for reasons other than a missing domain"""
+
+class MXResolver:
+    """Base resolver, returns the mail hosts for a domain"""
+
+    def resolve_mx(self, domain: str) -> List[str]:
+        """Return mail exchanger hosts, or an empty list if the domain has none"""
+        raise NotImplementedError
+
+class DNSResolver(MXResolver):
+    """MX lookups through dnspython, with the RFC 5321 implicit-MX fallback"""
+
+    def __init__(self, timeout: float = None):
+        if dns is None:
+            raise ImportError("dnspython is required for DNSResolver")
+        self.timeout = timeout or Config.REQUEST_TIMEOUT
+
+    def resolve_mx(self, domain: str) -> List[str]:
+        try:
+            answers = dns.resolver.resolve(domain, 'MX', lifetime=self.timeout)
+            records = sorted((r.preference, str(r.exchange).rstrip('.')) for r in answers)
+            # A null MX ('.') means the domain explicitly accepts no mail
+            return [host for _, host in records if host]
+        except dns.resolver.NXDOMAIN:
+            return []
+        except dns.resolver.NoAnswer:
+            return AddressResolver().resolve_mx(domain)
+        except dns.exception.DNSException as e:
+            raise ResolverError(str(e))
+
+class AddressResolver(MXResolver):
+    """Stdlib fallback that treats a resolvable domain as its own mail host"""
+
+    def resolve_mx(self, domain: str) -> List[str]:
+        try:
+            socket.getaddrinfo(domain, 25, proto=socket.IPPROTO_TCP)
+            return [domain]
+        except socket.gaierror as e:
+            if e.errno in (socket.EAI_NONAME, getattr(socket, 'EAI_NODATA', socket.EAI_NONAME)):
+                return []
+            raise ResolverError(str(e))
+
+class StaticResolver(MXResolver):
+    """Resolver backed by a fixed domain -> hosts map, for tests and offline runs"""
+
+    def __init__(self, records: Dict[str, List[str]] = None, default: List[str] = None):
+        self.records = {domain.lower(): hosts for domain, hosts in (records or {}).items()}
+        self.default = default
+        self.lookups = 0
+
+    def resolve_mx(self, domain: str) -> List[str]:
+        self.lookups += 1
+        if domain in self.records:
+            return self.records[domain]
+        if self.default is not None:
+            return self.default
+        return []
+
+def default_resolver() -> MXResolver:
+    """Use dnspython when installed, otherwise stdlib address lookups"""
+    return DNSResolver() if dns is not None else AddressResolver()
+
+@dataclass
+class EmailVerification:
+    """Verification outcome for a single address"""
+    email: str = ""
+    domain: str = ""
+    status: str = UNKNOWN
+    free_mail: bool = False
+    mx_hosts: List[str] = field(default_factory=list)
+    reason: str = ""
+
+    @property
+    def deliverable(self) -> bool:
+        return self.status == DELIVERABLE
+
+class DomainCache:
+    """Thread-safe TTL cache of MX results with single-flight lookups"""
+
+    def __init__(self, resolver: MXResolver, ttl: float = 3600, negative_ttl: float = 300):
+        self.resolver = resolver
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[str, Tuple[float, Optional[List[str]], str]] = {}
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'errors': 0}
+
+    def lookup(self, domain: str) -> Tuple[Optional[List[str]], str]:
+        """Return (mx_hosts, error), hosts is None when the lookup failed"""
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(domain)
+            if entry and entry[0] > now:
+                self.stats['hits'] += 1
+                return entry[1], entry[2]
+
+            future = self._inflight.get(domain)
+            owner = future is None
+            if owner:
+                self.stats['misses'] += 1
+                future = Future()
+                self._inflight[domain] = future
+
+        if not owner:
+            # Another thread is already resolving this domain
+            return future.result()
+
+        try:
+            hosts, error = self.resolver.resolve_mx(domain), ""
+            expires = now + self.ttl
+        except Exception as e:
+            hosts, error = None, str(e)
+            expires = now + self.negative_ttl
+            with self._lock:
+                self.stats['errors'] += 1
+
+        with self._lock:
+            self._entries[domain] = (expires, hosts, error)
+            del self._inflight[domain]
+        future.set_result((hosts, error))
+
+        return hosts, error
+
+class EmailVerifier:
+    """Verification stage combining syntax checks, MX lookups and free-mail tagging"""
+
+    def __init__(self, resolver: MXResolver = None, ttl: float = 3600,
+                 max_workers: int = None, cache: DomainCache = None):
+        self.cache = cache or DomainCache(resolver or default_resolver(), ttl)
+        self.max_workers = max_workers or Config.MAX_WORKERS
+
+    @staticmethod
+    def split_domain(email: str) -> str:
+        return email.rsplit('@', 1)[-1].strip().lower() if email and '@' in email else ""
+
+    @staticmethod
+    def is_free_mail(domain: str) -> bool:
+        return domain in FREE_MAIL_DOMAINS
+
+    def verify(self, email: str) -> EmailVerification:
+        """Verify a single address"""
+        domain = self.split_domain(email)
+        result = EmailVerification(email=email, domain=domain, free_mail=self.is_free_mail(domain))
+
+        if not DataValidator.validate_email(email):
+            result.status = INVALID
+            result.reason = "Failed syntax check"
+            return result
+
+        hosts, error = self.cache.lookup(domain)
+
+        if hosts is None:
+            result.status = UNKNOWN
+            result.reason = f"Lookup failed: {error}"
+        elif hosts:
+            result.status = DELIVERABLE
+            result.mx_hosts = list(hosts)
+        else:
+            result.status = UNDELIVERABLE
+            result.reason = "Domain has no mail exchanger"
+
+        return result
+
+    def verify_many(self, emails: Iterable[str]) -> Dict[str, EmailVerification]:
+        """Verify addresses, resolving each distinct domain once and concurrently"""
+        emails = list(dict.fromkeys(email for email in emails if email))
+        domains = {self.split_domain(email) for email in emails if DataValidator.validate_email(email)}
+
+        if domains:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(domains))) as executor:
+                list(executor.map(self.cache.lookup, domains))
+
+        # Every lookup below is now a cache hit
+        return {email: self.verify(email) for email in emails}
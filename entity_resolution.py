@@ -0,0 +1,195 @@
+"""
+Multi-source entity resolution for LeadWave™
+Joins records for the same business across directories by blocking keys
+and merges them field by field with provenance
+"""
+
+import logging
+from datetime import datetime, timedelta
+from dataclasses import dataclass, field, fields, asdict, is_dataclass, MISSING
+from typing import List, Dict, Optional, Iterable, Tuple, FrozenSet
+
+from config import BUSINESS_DIRECTORIES
+from lead_pipeline import BusinessLead
+from suppression import business_keys
+from lead_filter import FIELD_ALIASES
+
+logger = logging.getLogger(__name__)
+
+MERGE_FIELDS = [f.name for f in fields(BusinessLead) if f.name not in ('last_updated', 'confidence_score')]
+
+@dataclass
+class SourceRecord:
+    """One business record as reported by one source"""
+    source: str
+    data: Dict
+    updated: datetime
+    # Fields the source actually reported, the rest are absent or dataclass defaults
+    present: FrozenSet[str] = frozenset()
+
+@dataclass
+class ResolvedEntity:
+    """A merged lead plus where each of its field values came from"""
+    lead: BusinessLead
+    sources: List[str] = field(default_factory=list)
+    provenance: Dict[str, Dict] = field(default_factory=dict)
+    conflicts: List[str] = field(default_factory=list)
+
+class _DisjointSet:
+    """Union-find over record indexes"""
+
+    def __init__(self):
+        self.parent: List[int] = []
+
+    def add(self) -> int:
+        self.parent.append(len(self.parent))
+        return len(self.parent) - 1
+
+    def find(self, item: int) -> int:
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, first: int, second: int):
+        first, second = self.find(first), self.find(second)
+        if first != second:
+            self.parent[max(first, second)] = min(first, second)
+
+def _parse_time(value) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(value) if value else datetime.min
+    except ValueError:
+        return datetime.min
+
+def _reported_fields(record) -> Tuple[Dict, FrozenSet[str]]:
+    """Record as a dict plus the fields it reports
+
+    Dict keys count as reported. Dataclass fields only count when they differ from
+    their default, so a BusinessLead's 0.0 rating or False claim never outranks a
+    real value from another source.
+    """
+    if not is_dataclass(record):
+        return record, frozenset(record)
+
+    data = asdict(record)
+    present = set()
+    for item in fields(record):
+        if item.default is not MISSING:
+            default = item.default
+        elif item.default_factory is not MISSING:
+            default = item.default_factory()
+        else:
+            present.add(item.name)
+            continue
+        if data[item.name] != default:
+            present.add(item.name)
+    return data, frozenset(present)
+
+def _is_empty(value) -> bool:
+    # An explicit False or 0 is a value, only missing text and empty containers are not
+    if value is None or isinstance(value, bool):
+        return value is None
+    return value == '' or (isinstance(value, (dict, list, tuple, set)) and not value)
+
+class EntityResolver:
+    """Hash-join records from several sources and merge each business once"""
+
+    def __init__(self, source_priority: List[str] = None, stale_after_days: int = 365):
+        # Earlier sources win conflicts, by default the order of BUSINESS_DIRECTORIES
+        self.source_priority = source_priority or list(BUSINESS_DIRECTORIES)
+        self.stale_after = timedelta(days=stale_after_days) if stale_after_days else None
+        self.records: List[SourceRecord] = []
+        self._clusters = _DisjointSet()
+        self._key_owner: Dict[str, int] = {}
+        self.stats = {'records': 0, 'entities': 0, 'conflicts': 0}
+
+    def _rank(self, source: str) -> int:
+        return self.source_priority.index(source) if source in self.source_priority else len(self.source_priority)
+
+    def add(self, source: str, record, updated=None):
+        """Add one record, joining it to any earlier record sharing a blocking key"""
+        data, present = _reported_fields(record)
+        # Raw source keys (name, rating, reviews, ...) map onto lead fields as in filters
+        aliased = {field: data[alias] for alias, field in FIELD_ALIASES.items()
+                   if alias in present and field not in present}
+        if aliased:
+            data = dict(data, **aliased)
+            present = present | frozenset(aliased)
+
+        index = self._clusters.add()
+        self.records.append(SourceRecord(source, data, _parse_time(updated or data.get('last_updated')), present))
+        self.stats['records'] += 1
+
+        for key in business_keys(data):
+            owner = self._key_owner.setdefault(key, index)
+            if owner != index:
+                self._clusters.union(owner, index)
+
+    def add_source(self, source: str, records: Iterable):
+        """Add every record from one source dump"""
+        for record in records:
+            self.add(source, record)
+
+    def clusters(self) -> Dict[int, List[int]]:
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(self.records)):
+            groups.setdefault(self._clusters.find(index), []).append(index)
+        return groups
+
+    def _merge(self, members: List[int]) -> ResolvedEntity:
+        records = [self.records[index] for index in members]
+        newest = max(record.updated for record in records)
+
+        def order(record: SourceRecord) -> Tuple:
+            stale = bool(self.stale_after and newest - record.updated > self.stale_after)
+            return (stale, self._rank(record.source), -record.updated.timestamp() if record.updated != datetime.min else 0)
+
+        ranked = sorted(records, key=order)
+        lead = BusinessLead()
+        entity = ResolvedEntity(lead=lead, sources=sorted({record.source for record in records}))
+
+        for name in MERGE_FIELDS:
+            candidates = [record for record in ranked
+                          if name in record.present and not _is_empty(record.data.get(name))]
+            if not candidates:
+                continue
+
+            chosen = candidates[0]
+            setattr(lead, name, chosen.data[name])
+            entity.provenance[name] = {
+                'source': chosen.source,
+                'updated': chosen.updated.isoformat() if chosen.updated != datetime.min else ''
+            }
+
+            if any(candidate.data[name] != chosen.data[name] for candidate in candidates[1:]):
+                entity.conflicts.append(name)
+
+        if newest != datetime.min:
+            lead.last_updated = newest.isoformat()
+
+        self.stats['conflicts'] += len(entity.conflicts)
+        return entity
+
+    def resolve(self) -> List[ResolvedEntity]:
+        """Merge every cluster into a single entity"""
+        entities = [self._merge(members) for members in self.clusters().values()]
+        self.stats['entities'] = len(entities)
+        logger.info(f"🔗 Resolved {self.stats['records']} records into {len(entities)} businesses")
+        return entities
+
+def resolve_sources(dumps: Dict[str, Iterable], source_priority: List[str] = None,
+                    scorer=None) -> List[ResolvedEntity]:
+    """Merge several source dumps, optionally rescoring merged leads with a pipeline scorer"""
+    resolver = EntityResolver(source_priority)
+    for source, records in dumps.items():
+        resolver.add_source(source, records)
+
+    entities = resolver.resolve()
+    if scorer:
+        for entity in entities:
+            entity.lead.confidence_score = scorer(entity.lead)
+    return entities
@@ -5,27 +5,25 @@ Demonstrates various ways to use the lead generation system
 """
 
 from leadwave import LeadWave, BusinessLead
+from async_leadwave import AsyncLeadWave
 import asyncio
 from typing import List
 
 def example_restaurant_leads():
-    """Example: Generate restaurant leads in specific zip codes"""
+    """Example: Generate high-scoring restaurant leads in one state"""
     print("🍽️  Example: Restaurant Lead Generation")
     print("-" * 40)
     
     leadwave = LeadWave()
     
-    # Target high-end restaurant areas
-    leads = leadwave.generate_leads(
+    # Target high-end restaurant areas, keeping high-quality leads only
+    premium_leads = leadwave.generate_leads(
         industry="fine dining restaurants",
         location="Manhattan, NY",
-        zip_codes=["10001", "10002", "10003", "10004"],
-        max_leads=25
+        max_leads=25,
+        where="state = 'NY' and score >= 80"
     )
     
-    # Filter for high-quality leads only
-    premium_leads = [lead for lead in leads if lead.confidence_score >= 80]
-    
     print(f"Generated {len(premium_leads)} premium restaurant leads")
     
     # Save with custom filename
@@ -100,22 +98,21 @@ def example_service_business_leads():
         for service in service_types:
             print(f"Searching {service} in {market}...")
             
+            # Only claimed Google listings (higher quality), rejected before enrichment
             leads = leadwave.generate_leads(
                 industry=service,
                 location=market,
-                max_leads=15
+                max_leads=15,
+                where="claimed"
             )
             
             all_leads.extend(leads)
     
-    # Filter for claimed Google listings (higher quality)
-    claimed_leads = [lead for lead in all_leads if lead.google_claimed]
-    
-    leadwave.leads = claimed_leads
+    leadwave.leads = all_leads
     leadwave.save_leads("service_business_leads", format='json')
     
-    print(f"Service business leads with claimed listings: {len(claimed_leads)}")
-    return claimed_leads
+    print(f"Service business leads with claimed listings: {len(all_leads)}")
+    return all_leads
 
 def example_retail_leads():
     """Example: Generate retail business leads"""
@@ -202,23 +199,14 @@ def example_niche_targeting():
     
     leadwave = LeadWave()
     
-    # Very specific niche with geographic precision
-    leads = leadwave.generate_leads(
+    # Very specific niche with geographic precision and luxury market filtering
+    premium_leads = leadwave.generate_leads(
         industry="luxury wedding photographers",
         location="Napa Valley, CA",
-        zip_codes=["94558", "94559", "94562"],
-        max_leads=15
+        max_leads=15,
+        where="state = 'CA' and rating >= 4.5 and website and score >= 75"
     )
     
-    # Analyze niche-specific metrics
-    premium_leads = []
-    for lead in leads:
-        # Additional filtering for luxury market
-        if (lead.google_rating >= 4.5 and 
-            lead.website and 
-            lead.confidence_score >= 75):
-            premium_leads.append(lead)
-    
     print(f"Luxury wedding photographers found: {len(premium_leads)}")
     
     # Custom analysis for niche market
@@ -234,6 +222,32 @@ def example_niche_targeting():
     
     return premium_leads
 
+def example_async_streaming():
+    """Example: Stream leads from inside an asyncio event loop"""
+    print("⚡ Example: Async Lead Streaming")
+    print("-" * 40)
+    
+    async def stream_dental_leads():
+        async with AsyncLeadWave() as leadwave:
+            leads = []
+            
+            # Leads arrive as soon as they are processed, the loop stays free
+            async for lead in leadwave.stream_leads(
+                industry="dental",
+                location="Miami, FL",
+                max_leads=20
+            ):
+                print(f"   ⚡ {lead.business_name} ({lead.confidence_score:.0f}%)")
+                leads.append(lead)
+            
+            await leadwave.save_leads("async_dental_leads_miami", format='jsonl')
+            return leads
+    
+    leads = asyncio.run(stream_dental_leads())
+    
+    print(f"Streamed {len(leads)} dental leads")
+    return leads
+
 def run_all_examples():
     """Run all example scenarios"""
     print("🌊 LeadWave™ - Complete Example Suite")
@@ -245,7 +259,8 @@ def run_all_examples():
         example_service_business_leads,
         example_retail_leads,
         example_multi_location_campaign,
-        example_niche_targeting
+        example_niche_targeting,
+        example_async_streaming
     ]
     
     results = {}
@@ -279,7 +294,8 @@ if __name__ == "__main__":
             'services': example_service_business_leads,
             'retail': example_retail_leads,
             'campaign': example_multi_location_campaign,
-            'niche': example_niche_targeting
+            'niche': example_niche_targeting,
+            'async': example_async_streaming
         }
         
         if example_name in examples_map:
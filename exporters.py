@@ -0,0 +1,254 @@
+"""
+Lead export backends for LeadWave™
+"""
+
+import io
+import os
+import re
+import csv
+import gzip
+import json
+import logging
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, asdict
+from typing import List, Dict, Iterable, Any, Callable, Optional
+
+from config import Config
+from lead_pipeline import BusinessLead
+
+logger = logging.getLogger(__name__)
+
+# Excel allows 1,048,576 rows per sheet, one of them is the header
+EXCEL_MAX_ROWS = 1048575
+
+EXCEL_COLUMNS = [f.name for f in fields(BusinessLead)]
+
+EXCEL_NUMBER_FORMATS = {
+    'google_rating': '0.0',
+    'google_reviews': '#,##0',
+    'confidence_score': '0.0',
+    'last_updated': 'yyyy-mm-dd hh:mm:ss'
+}
+
+EXCEL_COLUMN_WIDTHS = {
+    'business_name': 32, 'owner_name': 22, 'email': 32, 'phone': 16,
+    'website': 36, 'address': 44, 'social_media': 60, 'source_url': 36,
+    'last_updated': 20
+}
+
+def _excel_value(name: str, value: Any) -> Any:
+    """Convert a lead field into a natively typed Excel value"""
+    if name == 'social_media':
+        return ', '.join(f"{platform}: {url}" for platform, url in (value or {}).items())
+    if name == 'last_updated' and value:
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+def write_excel(leads: Iterable, path: str, max_rows_per_sheet: int = EXCEL_MAX_ROWS,
+                sheet_title: str = 'Leads') -> int:
+    """Stream leads into an XLSX file with openpyxl's write-only mode
+
+    Rows are written as they are produced, so memory stays flat regardless
+    of lead count. Sheets are split when they reach max_rows_per_sheet.
+    Returns the number of rows written.
+    """
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+
+    workbook = Workbook(write_only=True)
+    sheet = None
+    sheet_rows = 0
+    sheet_count = 0
+    total_rows = 0
+
+    def new_sheet():
+        nonlocal sheet, sheet_rows, sheet_count
+        sheet_count += 1
+        title = sheet_title if sheet_count == 1 else f"{sheet_title} ({sheet_count})"
+        sheet = workbook.create_sheet(title)
+        sheet.freeze_panes = 'A2'
+
+        # Dimensions must be set before the first row in write-only mode
+        for index, name in enumerate(EXCEL_COLUMNS, 1):
+            sheet.column_dimensions[get_column_letter(index)].width = EXCEL_COLUMN_WIDTHS.get(name, 14)
+
+        header = []
+        for name in EXCEL_COLUMNS:
+            cell = WriteOnlyCell(sheet, value=name)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        sheet.append(header)
+        sheet_rows = 0
+
+    for lead in leads:
+        if sheet is None or sheet_rows >= max_rows_per_sheet:
+            new_sheet()
+
+        lead_data = lead if isinstance(lead, dict) else asdict(lead)
+        row = []
+        for name in EXCEL_COLUMNS:
+            value = _excel_value(name, lead_data.get(name))
+            number_format = EXCEL_NUMBER_FORMATS.get(name)
+            if number_format and value is not None and not isinstance(value, str):
+                cell = WriteOnlyCell(sheet, value=value)
+                cell.number_format = number_format
+                value = cell
+            row.append(value)
+
+        sheet.append(row)
+        sheet_rows += 1
+        total_rows += 1
+
+    if sheet is None:
+        new_sheet()
+
+    workbook.save(path)
+    logger.info(f"📊 Wrote {total_rows} rows across {sheet_count} sheet(s) to {path}")
+    return total_rows
+
+COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+FORMAT_SUFFIXES = {'csv': '.csv', 'json': '.json', 'jsonl': '.jsonl', 'excel': '.xlsx', 'xlsx': '.xlsx'}
+
+PARTITION_KEYS: Dict[str, Callable[[BusinessLead], str]] = {
+    'state': lambda lead: lead.state,
+    'industry': lambda lead: lead.industry,
+    'date': lambda lead: (lead.last_updated or '')[:10],
+    'city': lambda lead: lead.city
+}
+
+def output_path(filename: str, format: str, compression: str = None) -> str:
+    """Place bare filenames under Config.OUTPUT_DIR and add format/compression suffixes"""
+    if not os.path.dirname(filename):
+        filename = os.path.join(Config.OUTPUT_DIR, filename)
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    return f"{filename}{FORMAT_SUFFIXES[format]}{COMPRESSION_SUFFIXES[compression]}"
+
+def open_text_output(path: str, compression: str = None):
+    """Open a text stream, optionally compressing as it is written"""
+    if compression is None:
+        return open(path, 'w', newline='', encoding='utf-8')
+
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', newline='', encoding='utf-8', compresslevel=6)
+
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the 'zstandard' package")
+        raw = open(path, 'wb')
+        writer = zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(writer, encoding='utf-8', newline='')
+
+    raise ValueError(f"Unsupported compression: {compression}")
+
+def open_binary_input(path: str, compression: str = None):
+    """Open a byte stream, decompressing what open_text_output compressed"""
+    if compression is None:
+        return open(path, 'rb')
+
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd compression requires the 'zstandard' package")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+
+    raise ValueError(f"Unsupported compression: {compression}")
+
+def compression_of(path: str) -> Optional[str]:
+    """Compression implied by a file's suffix, None for plain files"""
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if compression and path.endswith(suffix):
+            return compression
+    return None
+
+def write_leads(leads: Iterable, path: str, format: str = 'csv', compression: str = None) -> int:
+    """Stream leads to a single file, returns the row count"""
+    format = format.lower()
+
+    if format in ('excel', 'xlsx'):
+        if compression:
+            raise ValueError("Excel files are already compressed")
+        return write_excel(leads, path)
+
+    rows = 0
+    with open_text_output(path, compression) as f:
+        if format == 'csv':
+            writer = csv.DictWriter(f, fieldnames=EXCEL_COLUMNS)
+            writer.writeheader()
+            for lead in leads:
+                writer.writerow(lead if isinstance(lead, dict) else asdict(lead))
+                rows += 1
+
+        elif format == 'json':
+            # Same pretty-printed array layout as before, written one lead at a time
+            f.write('[')
+            for lead in leads:
+                lead_data = lead if isinstance(lead, dict) else asdict(lead)
+                f.write(',\n  ' if rows else '\n  ')
+                f.write(json.dumps(lead_data, indent=2, ensure_ascii=False).replace('\n', '\n  '))
+                rows += 1
+            f.write('\n]' if rows else ']')
+
+        elif format == 'jsonl':
+            for lead in leads:
+                lead_data = lead if isinstance(lead, dict) else asdict(lead)
+                f.write(json.dumps(lead_data, ensure_ascii=False) + '\n')
+                rows += 1
+
+        else:
+            raise ValueError(f"Unsupported export format: {format}")
+
+    return rows
+
+def _partition_name(key: str) -> str:
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', key.strip()) or 'unknown'
+
+def write_partitioned(leads: Iterable[BusinessLead], directory: str, partition_by: str = 'state',
+                      format: str = 'csv', compression: str = None,
+                      max_workers: int = None) -> str:
+    """Write one file per partition in parallel plus a manifest, returns the manifest path"""
+    if partition_by not in PARTITION_KEYS:
+        raise ValueError(f"Unknown partition key: {partition_by}")
+
+    key_of = PARTITION_KEYS[partition_by]
+    partitions: Dict[str, List[BusinessLead]] = {}
+    for lead in leads:
+        partitions.setdefault(_partition_name(key_of(lead) or ''), []).append(lead)
+
+    os.makedirs(directory, exist_ok=True)
+
+    def write_partition(key: str) -> Dict:
+        path = os.path.join(directory, f"{partition_by}={key}{FORMAT_SUFFIXES[format]}{COMPRESSION_SUFFIXES[compression]}")
+        rows = write_leads(partitions[key], path, format, compression)
+        return {'key': key, 'file': os.path.basename(path), 'rows': rows, 'bytes': os.path.getsize(path)}
+
+    with ThreadPoolExecutor(max_workers=max_workers or Config.MAX_WORKERS) as executor:
+        entries = list(executor.map(write_partition, sorted(partitions)))
+
+    manifest = {
+        'created': datetime.now().isoformat(),
+        'format': format,
+        'compression': compression,
+        'partition_by': partition_by,
+        'total_rows': sum(entry['rows'] for entry in entries),
+        'partitions': entries
+    }
+
+    manifest_path = os.path.join(directory, 'manifest.json')
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    logger.info(f"🗂️  Wrote {manifest['total_rows']} rows into {len(entries)} partitions under {directory}")
+    return manifest_path
@@ -0,0 +1,557 @@
+#!/usr/bin/env python3
+"""
+Fake directory server for LeadWave™
+Local stand-in for directory listings, business websites, social profiles and a
+Places-style JSON API, with configurable latency, errors, rate limits and
+slow-drip bodies, plus a load driver that runs the pipeline against it
+"""
+
+import re
+import json
+import math
+import time
+import zlib
+import random
+import logging
+import argparse
+import threading
+import statistics
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.error import HTTPError
+from urllib.parse import urlsplit, parse_qs, urlencode
+from urllib.request import urlopen, Request
+from typing import List, Dict, Optional, Tuple
+
+from config import Config
+from gazetteer import resolve_location
+from lead_pipeline import LeadSource, LeadPipeline
+from concurrency import AdaptiveConcurrency
+from resilience import Resilience
+
+logger = logging.getLogger(__name__)
+
+LATENCY_DISTRIBUTIONS = ('constant', 'uniform', 'exponential', 'lognormal', 'pareto')
+SOCIAL_NETWORKS = {
+    'facebook.com': 'facebook', 'instagram.com': 'instagram',
+    'twitter.com': 'twitter', 'linkedin.com': 'linkedin'
+}
+PAGE_SIZE = 20
+LISTINGS_PER_QUERY = 200
+ERROR_STATUSES = (500, 502, 503, 504)
+ADDRESS_PATTERN = re.compile(r'^(.*?),\s*([^,]+),\s*([A-Z]{2})\s+(\d{5})')
+
+SURNAMES = ['Harper', 'Bennett', 'Alvarez', 'Nguyen', 'Okafor', 'Schmidt', 'Russo', 'Patel',
+            'Kowalski', 'Murphy', 'Tanaka', 'Delgado', 'Fischer', 'Larsen', 'Moreau', 'Quinn']
+FIRST_NAMES = ['Maria', 'James', 'Aisha', 'Daniel', 'Sofia', 'Kevin', 'Lena', 'Marcus',
+               'Priya', 'Tom', 'Grace', 'Omar', 'Elena', 'Victor', 'Hannah', 'Luis']
+SUFFIXES = ['Co', 'Group', '& Sons', 'Services', 'Studio', 'Partners', 'Collective', 'Works']
+STREETS = ['Main St', 'Oak Ave', 'Elm St', 'Park Blvd', 'Cedar Ln', 'Maple Dr', 'Pine St', 'Lake Rd']
+
+@dataclass
+class ChaosProfile:
+    """Network conditions the fixture server simulates on every fixture response"""
+    latency: str = 'constant'
+    latency_ms: float = 0.0        # Mean, or median for lognormal and minimum for pareto
+    error_rate: float = 0.0        # Share of responses replaced by a random 5xx
+    throttle_rate: float = 0.0     # Share of responses replaced by a 429
+    rate_limit: float = 0.0        # Requests per second served before answering 429, 0 for no limit
+    drip_bytes: int = 0            # Body chunk size for slow-drip responses, 0 sends bodies at once
+    drip_interval_ms: float = 50.0
+
+    def __post_init__(self):
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution {self.latency!r}, use one of {LATENCY_DISTRIBUTIONS}")
+
+    @classmethod
+    def parse_latency(cls, spec: str) -> Tuple[str, float]:
+        """'lognormal:80' -> ('lognormal', 80.0), a bare number is constant"""
+        name, _, value = spec.partition(':')
+        if not value:
+            return 'constant', float(name)
+        return name, float(value)
+
+    def delay(self, rng: random.Random) -> float:
+        """One latency sample in seconds"""
+        mean = self.latency_ms / 1000
+        if mean <= 0:
+            return 0.0
+        if self.latency == 'uniform':
+            return rng.uniform(0, 2 * mean)
+        if self.latency == 'exponential':
+            return rng.expovariate(1 / mean)
+        if self.latency == 'lognormal':
+            return rng.lognormvariate(math.log(mean), 0.6)
+        if self.latency == 'pareto':
+            # Heavy tail, most requests near the minimum and a few far beyond it
+            return min(mean * rng.paretovariate(2.5), mean * 50)
+        return mean
+
+def _slug(text: str) -> str:
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+class FixtureData:
+    """Deterministic businesses per query, the same query always yields the same listings"""
+
+    def __init__(self, base_url: str = '', seed: int = 0):
+        self.base_url = base_url
+        self.seed = seed
+        self._places: Dict[str, Dict] = {}
+        self._queries: Dict[Tuple[str, str], List[str]] = {}
+        self._lock = threading.Lock()
+
+    def listings(self, industry: str, location: str) -> List[Dict]:
+        key = (_slug(industry), _slug(location))
+        with self._lock:
+            place_ids = self._queries.get(key)
+            if place_ids is None:
+                place_ids = self._queries[key] = self._generate(industry, location)
+            return [self._places[place_id] for place_id in place_ids]
+
+    def place(self, place_id: str) -> Optional[Dict]:
+        with self._lock:
+            return self._places.get(place_id)
+
+    def _generate(self, industry: str, location: str) -> List[str]:
+        rng = random.Random(zlib.crc32(f"{self.seed}|{_slug(industry)}|{_slug(location)}".encode('utf-8')))
+        place = resolve_location(location)
+        city = place.city if place and place.city else (location.split(',')[0].strip() or 'Springfield')
+        state = place.state if place else 'IL'
+        trade = industry.strip().title() or 'Business'
+
+        place_ids = []
+        for index in range(LISTINGS_PER_QUERY):
+            place_id = f"fx{zlib.crc32(f'{industry}|{location}|{index}'.encode('utf-8')):08x}"
+            owner = f"{rng.choice(FIRST_NAMES)} {rng.choice(SURNAMES)}"
+            name = f"{rng.choice(SURNAMES)} {trade} {rng.choice(SUFFIXES)}"
+            zip_code = place.zip_code if place and place.zip_code else f"{rng.randint(10000, 99999)}"
+            self._places[place_id] = {
+                'place_id': place_id,
+                'name': name,
+                'owner_name': owner,
+                'email': f"{owner.split()[0].lower()}@{_slug(name).replace('-', '')}.example",
+                'formatted_address': f"{rng.randint(100, 9999)} {rng.choice(STREETS)}, {city}, {state} {zip_code}",
+                'formatted_phone_number': f"({rng.randint(200, 989)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+                'rating': round(rng.uniform(3.0, 5.0), 1),
+                'user_ratings_total': rng.randint(3, 400),
+                'types': [_slug(industry)],
+                'website': f"{self.base_url}/site/{place_id}/",
+                'google_claimed': rng.random() < 0.6,
+                'google_3pack': index < 3,
+                'social_slug': _slug(name).replace('-', '')
+            }
+            place_ids.append(place_id)
+        return place_ids
+
+class FixtureServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the fixture data, chaos profile and request counters"""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], chaos: ChaosProfile = None, seed: int = 0):
+        super().__init__(address, FixtureRequestHandler)
+        host, port = self.server_address[:2]
+        self.base_url = f"http://{host}:{port}"
+        self.chaos = chaos or ChaosProfile()
+        self.data = FixtureData(self.base_url, seed)
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._tokens = self.chaos.rate_limit
+        self._refilled = time.monotonic()
+        self.stats = {'requests': 0, 'bytes_sent': 0, 'statuses': {}}
+
+    def start(self) -> threading.Thread:
+        """Serve in a background thread, shutdown() stops it"""
+        thread = threading.Thread(target=self.serve_forever, name='leadwave-fixtures', daemon=True)
+        thread.start()
+        return thread
+
+    def host_map(self) -> Dict[str, str]:
+        """SocialProfileVerifier host_map pointing the social networks at this server"""
+        return {host: f"{self.base_url}/social/{network}" for host, network in SOCIAL_NETWORKS.items()}
+
+    def fault(self) -> Tuple[Optional[int], float]:
+        """Pick this request's injected status (None to serve normally) and latency"""
+        with self._lock:
+            delay = self.chaos.delay(self.rng)
+            if self.chaos.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(self.chaos.rate_limit, self._tokens + (now - self._refilled) * self.chaos.rate_limit)
+                self._refilled = now
+                if self._tokens < 1:
+                    return 429, delay
+                self._tokens -= 1
+            roll = self.rng.random()
+            if roll < self.chaos.throttle_rate:
+                return 429, delay
+            if roll < self.chaos.throttle_rate + self.chaos.error_rate:
+                return self.rng.choice(ERROR_STATUSES), delay
+            return None, delay
+
+    def record(self, status: int, size: int):
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['bytes_sent'] += size
+            self.stats['statuses'][status] = self.stats['statuses'].get(status, 0) + 1
+
+    def report(self) -> Dict:
+        with self._lock:
+            return {
+                'requests': self.stats['requests'],
+                'bytes_sent': self.stats['bytes_sent'],
+                'statuses': dict(sorted(self.stats['statuses'].items()))
+            }
+
+class FixtureRequestHandler(BaseHTTPRequestHandler):
+    """Routes fixture paths; /stats is exempt from injected faults"""
+
+    protocol_version = 'HTTP/1.1'
+    server: FixtureServer
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+
+        if url.path == '/stats':
+            return self._send(200, json.dumps(self.server.report()).encode('utf-8'), 'application/json', drip=False)
+
+        status, delay = self.server.fault()
+        if delay:
+            time.sleep(delay)
+        if status == 429:
+            return self._send(429, b'{"status": "OVER_QUERY_LIMIT"}', 'application/json',
+                              {'Retry-After': '1'}, drip=False)
+        if status:
+            return self._send(status, b'Upstream unavailable', 'text/plain', drip=False)
+
+        parts = [part for part in url.path.split('/') if part]
+        if url.path == '/robots.txt':
+            return self._send(200, b"User-agent: *\nAllow: /\n", 'text/plain')
+        if url.path == '/places/textsearch/json':
+            return self._text_search(params)
+        if url.path == '/places/details/json':
+            return self._details(params)
+        if len(parts) == 3 and parts[0] == 'directory':
+            return self._directory(parts[1], parts[2], params)
+        if len(parts) in (2, 3) and parts[0] == 'site':
+            return self._site(parts[1], parts[2] if len(parts) == 3 else '')
+        if len(parts) >= 3 and parts[0] == 'social':
+            return self._social(parts[-1])
+        return self._send(404, b'Not found', 'text/plain')
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Dict = None, drip: bool = True):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        chunk = self.server.chaos.drip_bytes if drip else 0
+        try:
+            if chunk and self.command != 'HEAD':
+                # Slow-drip: the body trickles out in small pieces
+                for start in range(0, len(body), chunk):
+                    self.wfile.write(body[start:start + chunk])
+                    self.wfile.flush()
+                    time.sleep(self.server.chaos.drip_interval_ms / 1000)
+            elif self.command != 'HEAD':
+                self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+        self.server.record(status, len(body))
+
+    def _json(self, body: Dict, status: int = 200):
+        return self._send(status, json.dumps(body).encode('utf-8'), 'application/json')
+
+    def _html(self, title: str, content: str, status: int = 200):
+        page = f"<!DOCTYPE html><html><head><title>{title}</title></head><body>{content}</body></html>"
+        return self._send(status, page.encode('utf-8'), 'text/html; charset=utf-8')
+
+    def _text_search(self, params: Dict):
+        industry, _, location = params.get('query', '').partition(' in ')
+        if not industry or not location:
+            return self._json({'status': 'INVALID_REQUEST', 'results': []}, 400)
+
+        listings = self.server.data.listings(industry, location)
+        offset = int(params.get('pagetoken') or 0)
+        page = listings[offset:offset + PAGE_SIZE]
+        body = {
+            'status': 'OK' if page else 'ZERO_RESULTS',
+            'results': [
+                {key: place[key] for key in ('place_id', 'name', 'formatted_address', 'formatted_phone_number',
+                                             'rating', 'user_ratings_total', 'types', 'website')}
+                for place in page
+            ]
+        }
+        if offset + PAGE_SIZE < len(listings):
+            body['next_page_token'] = str(offset + PAGE_SIZE)
+        return self._json(body)
+
+    def _details(self, params: Dict):
+        place = self.server.data.place(params.get('place_id', ''))
+        if not place:
+            return self._json({'status': 'NOT_FOUND'}, 404)
+        slug = place['social_slug']
+        profiles = {
+            network: f"https://{host}/{'company/' if network == 'linkedin' else ''}{slug}"
+            for host, network in SOCIAL_NETWORKS.items()
+            if zlib.crc32(f"{network}|{slug}".encode('utf-8')) % 3
+        }
+        return self._json({'status': 'OK', 'result': {
+            'place_id': place['place_id'],
+            'name': place['name'],
+            'owner_name': place['owner_name'],
+            'google_claimed': place['google_claimed'],
+            'google_3pack': place['google_3pack'],
+            'social_media': profiles
+        }})
+
+    def _directory(self, industry: str, location: str, params: Dict):
+        listings = self.server.data.listings(industry.replace('-', ' '), location.replace('-', ' '))
+        page = int(params.get('page') or 1)
+        entries = listings[(page - 1) * PAGE_SIZE:page * PAGE_SIZE]
+        items = ''.join(
+            f'<li class="listing"><a href="/site/{place["place_id"]}/">{place["name"]}</a>'
+            f'<span class="address">{place["formatted_address"]}</span>'
+            f'<span class="phone">{place["formatted_phone_number"]}</span></li>'
+            for place in entries
+        )
+        pager = f'<a rel="next" href="?page={page + 1}">Next</a>' if page * PAGE_SIZE < len(listings) else ''
+        return self._html(f"{industry} in {location}", f"<ul>{items}</ul>{pager}")
+
+    def _site(self, place_id: str, page: str):
+        place = self.server.data.place(place_id)
+        if not place:
+            return self._html('Not found', '<p>No such business</p>', 404)
+
+        navigation = (f'<nav><a href="/site/{place_id}/about">About us</a> '
+                      f'<a href="/site/{place_id}/contact">Contact</a></nav>')
+        if page == 'contact':
+            content = (f'<p>Call {place["formatted_phone_number"]} or email '
+                       f'<a href="mailto:{place["email"]}">{place["email"]}</a></p>'
+                       f'<address>{place["formatted_address"]}</address>')
+        elif page == 'about':
+            content = f'<p>{place["name"]} is family run. Owner: {place["owner_name"]}</p>'
+        elif not page:
+            content = f'<h1>{place["name"]}</h1><p>Serving the community since 1998.</p>'
+        else:
+            return self._html('Not found', navigation, 404)
+        return self._html(place['name'], navigation + content)
+
+    def _social(self, slug: str):
+        # Roughly a third of candidate profiles do not exist
+        if zlib.crc32(slug.encode('utf-8')) % 3 == 0:
+            return self._html('Page not found', '<p>This page isn\'t available</p>', 404)
+        return self._html(slug, f'<h1>{slug}</h1>')
+
+class PlacesSource(LeadSource):
+    """Lead source reading a Places-style JSON API such as the fixture server's"""
+
+    name = 'places'
+
+    def __init__(self, base_url: str, timeout: float = None):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout or Config.REQUEST_TIMEOUT
+
+    def _get(self, path: str, params: Dict) -> Dict:
+        url = f"{self.base_url}{path}?{urlencode(params)}"
+        with urlopen(Request(url, headers={'Accept': 'application/json'}), timeout=self.timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+
+    def fetch(self, industry: str, location: str, count: int = 10) -> List[Dict]:
+        """Page through text search results, a failing later page keeps what was read"""
+        businesses = []
+        token = None
+        while len(businesses) < count:
+            params = {'query': f"{industry} in {location}"}
+            if token:
+                params['pagetoken'] = token
+            try:
+                body = self._get('/places/textsearch/json', params)
+            except HTTPError:
+                if not businesses:
+                    raise
+                logger.warning(f"Stopped paging {industry} in {location} after {len(businesses)} results")
+                break
+
+            businesses.extend(self._record(result, industry) for result in body.get('results', []))
+            token = body.get('next_page_token')
+            if not token:
+                break
+        return businesses[:count]
+
+    @staticmethod
+    def _record(result: Dict, industry: str) -> Dict:
+        record = {
+            'name': result.get('name', ''),
+            'phone': result.get('formatted_phone_number', ''),
+            'website': result.get('website', ''),
+            'address': result.get('formatted_address', ''),
+            'rating': result.get('rating', 0),
+            'reviews': result.get('user_ratings_total', 0),
+            'types': result.get('types', [industry.lower()]),
+            'place_id': result.get('place_id', ''),
+        }
+        match = ADDRESS_PATTERN.match(record['address'])
+        if match:
+            record['city'], record['state'], record['zip_code'] = match.group(2), match.group(3), match.group(4)
+        return record
+
+    def enrich(self, stage: str, business_data: Dict) -> Dict:
+        """Owner, Google and social fields come from the details endpoint"""
+        if not business_data.get('place_id'):
+            return {}
+        details = self._get('/places/details/json', {'place_id': business_data['place_id']}).get('result', {})
+        if stage == 'owner':
+            return {'owner_name': details.get('owner_name', '')}
+        if stage == 'google':
+            return {'google_claimed': details.get('google_claimed', False),
+                    'google_3pack': details.get('google_3pack', False)}
+        if stage == 'social':
+            return {'social_media': details.get('social_media', {})}
+        return {}
+
+DEFAULT_QUERIES = [
+    ('plumber', 'Austin, TX'), ('dentist', 'Chicago, IL'), ('restaurant', 'Miami, FL'),
+    ('lawyer', 'New York, NY'), ('auto repair', 'Los Angeles, CA'), ('salon', 'Seattle, WA')
+]
+
+def _percentile(values: List[float], percent: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(percent / 100 * (len(ordered) - 1))))]
+
+def run_load(base_url: str, campaigns: int = 20, workers: int = 4, max_leads: int = 20,
+             queries: List[Tuple[str, str]] = None, crawl: bool = False, verify_social: bool = False,
+             host_map: Dict[str, str] = None) -> Dict:
+    """Run campaigns against a Places-style server and report throughput
+
+    Campaigns share one concurrency autotuner and one set of circuit breakers,
+    as they would inside the lead service.
+    """
+    queries = queries or DEFAULT_QUERIES
+    source = PlacesSource(base_url)
+    concurrency = AdaptiveConcurrency()
+    resilience = Resilience()
+    durations, failures, lead_counts = [], [], []
+    lock = threading.Lock()
+
+    def campaign(index: int):
+        industry, location = queries[index % len(queries)]
+        pipeline = LeadPipeline(source)
+        pipeline.concurrency = concurrency
+        pipeline.resilience = resilience
+        start = time.perf_counter()
+        try:
+            leads = pipeline.generate_leads(industry, location, max_leads)
+            if crawl and leads:
+                pipeline.enrich_from_websites()
+            if verify_social and leads:
+                from social_verifier import SocialProfileVerifier
+                verifier = SocialProfileVerifier(host_map=host_map, concurrency=concurrency, resilience=resilience)
+                try:
+                    pipeline.verify_social_profiles(verifier)
+                finally:
+                    verifier.close()
+            error = None
+        except Exception as e:
+            leads, error = [], f"{type(e).__name__}: {e}"
+        with lock:
+            durations.append(time.perf_counter() - start)
+            lead_counts.append(len(pipeline.leads))
+            if error:
+                failures.append(error)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(campaign, range(campaigns)))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'campaigns': campaigns,
+        'failed_campaigns': len(failures),
+        'errors': sorted(set(failures))[:10],
+        'leads': sum(lead_counts),
+        'elapsed_seconds': round(elapsed, 3),
+        'campaigns_per_second': round(campaigns / elapsed, 2) if elapsed else 0.0,
+        'leads_per_second': round(sum(lead_counts) / elapsed, 2) if elapsed else 0.0,
+        'campaign_latency': {
+            'mean': round(statistics.mean(durations), 3) if durations else 0.0,
+            'p50': round(_percentile(durations, 50), 3),
+            'p95': round(_percentile(durations, 95), 3),
+            'max': round(max(durations), 3) if durations else 0.0
+        },
+        'concurrency': concurrency.report(),
+        'resilience': resilience.report()
+    }
+
+def _chaos_from_args(args) -> ChaosProfile:
+    latency, latency_ms = ChaosProfile.parse_latency(args.latency)
+    return ChaosProfile(latency=latency, latency_ms=latency_ms, error_rate=args.error_rate,
+                        throttle_rate=args.throttle_rate, rate_limit=args.rate_limit,
+                        drip_bytes=args.drip_bytes, drip_interval_ms=args.drip_interval)
+
+def main():
+    parser = argparse.ArgumentParser(description="LeadWave™ fake directory server and load driver")
+    parser.add_argument('mode', choices=['serve', 'load'], help="Run the server, or run campaigns against it")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=0, help="0 picks a free port")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--latency', default='0', help="Milliseconds, or distribution:ms such as lognormal:80")
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--rate-limit', type=float, default=0.0, help="Requests per second before 429s")
+    parser.add_argument('--drip-bytes', type=int, default=0, help="Slow-drip chunk size in bytes")
+    parser.add_argument('--drip-interval', type=float, default=50.0, help="Milliseconds between drip chunks")
+    parser.add_argument('--url', help="Load an already running server instead of starting one")
+    parser.add_argument('--campaigns', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--max-leads', type=int, default=20)
+    parser.add_argument('--crawl', action='store_true', help="Also crawl lead websites")
+    parser.add_argument('--verify-social', action='store_true', help="Also check social profiles")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    server = None
+    if args.mode == 'serve' or not args.url:
+        server = FixtureServer((args.host, args.port), _chaos_from_args(args), args.seed)
+
+    if args.mode == 'serve':
+        print(f"🧪 LeadWave™ fixture server on {server.base_url} ({asdict(server.chaos)})")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            print("\n⏹️  Fixture server stopped")
+        finally:
+            server.server_close()
+        return
+
+    base_url = args.url or server.base_url
+    if server:
+        server.start()
+    host_map = server.host_map() if server else {
+        host: f"{base_url.rstrip('/')}/social/{network}" for host, network in SOCIAL_NETWORKS.items()
+    }
+    print(f"🧪 Running {args.campaigns} campaigns with {args.workers} workers against {base_url}")
+
+    try:
+        report = run_load(base_url, args.campaigns, args.workers, args.max_leads,
+                          crawl=args.crawl, verify_social=args.verify_social, host_map=host_map)
+        with urlopen(f"{base_url.rstrip('/')}/stats", timeout=Config.REQUEST_TIMEOUT) as response:
+            report['server'] = json.loads(response.read().decode('utf-8'))
+    finally:
+        if server:
+            server.shutdown()
+            server.server_close()
+
+    print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Offline US gazetteer for LeadWave™ location parsing
+Cities, states and ZIP codes in a compact memory-mapped file with prefix
+lookup, plus a persistent cache in front of any geopy geocoder
+"""
+
+import os
+import re
+import csv
+import sys
+import mmap
+import time
+import heapq
+import struct
+import sqlite3
+import logging
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Optional, Iterable, Iterator
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'LWGAZ01\n'
+HEADER = struct.Struct('<8sQ')
+
+# Abbreviation -> (name, approximate centroid latitude, longitude)
+US_STATES = {
+    'AL': ('Alabama', 32.81, -86.79), 'AK': ('Alaska', 61.37, -152.40),
+    'AZ': ('Arizona', 33.73, -111.43), 'AR': ('Arkansas', 34.97, -92.37),
+    'CA': ('California', 36.12, -119.68), 'CO': ('Colorado', 39.06, -105.31),
+    'CT': ('Connecticut', 41.60, -72.76), 'DE': ('Delaware', 39.32, -75.51),
+    'DC': ('District of Columbia', 38.90, -77.03), 'FL': ('Florida', 27.77, -81.69),
+    'GA': ('Georgia', 33.04, -83.64), 'HI': ('Hawaii', 21.09, -157.50),
+    'ID': ('Idaho', 44.24, -114.48), 'IL': ('Illinois', 40.35, -88.99),
+    'IN': ('Indiana', 39.85, -86.26), 'IA': ('Iowa', 42.01, -93.21),
+    'KS': ('Kansas', 38.53, -96.73), 'KY': ('Kentucky', 37.67, -84.67),
+    'LA': ('Louisiana', 31.17, -91.87), 'ME': ('Maine', 44.69, -69.38),
+    'MD': ('Maryland', 39.06, -76.80), 'MA': ('Massachusetts', 42.23, -71.53),
+    'MI': ('Michigan', 43.33, -84.54), 'MN': ('Minnesota', 45.69, -93.90),
+    'MS': ('Mississippi', 32.74, -89.68), 'MO': ('Missouri', 38.46, -92.29),
+    'MT': ('Montana', 46.92, -110.45), 'NE': ('Nebraska', 41.13, -98.27),
+    'NV': ('Nevada', 38.31, -117.06), 'NH': ('New Hampshire', 43.45, -71.56),
+    'NJ': ('New Jersey', 40.30, -74.52), 'NM': ('New Mexico', 34.84, -106.25),
+    'NY': ('New York', 42.17, -74.95), 'NC': ('North Carolina', 35.63, -79.81),
+    'ND': ('North Dakota', 47.53, -99.78), 'OH': ('Ohio', 40.39, -82.76),
+    'OK': ('Oklahoma', 35.57, -96.93), 'OR': ('Oregon', 44.57, -122.07),
+    'PA': ('Pennsylvania', 40.59, -77.21), 'RI': ('Rhode Island', 41.68, -71.51),
+    'SC': ('South Carolina', 33.86, -80.95), 'SD': ('South Dakota', 44.30, -99.44),
+    'TN': ('Tennessee', 35.75, -86.69), 'TX': ('Texas', 31.05, -97.56),
+    'UT': ('Utah', 40.15, -111.86), 'VT': ('Vermont', 44.05, -72.71),
+    'VA': ('Virginia', 37.77, -78.17), 'WA': ('Washington', 47.40, -121.49),
+    'WV': ('West Virginia', 38.49, -80.95), 'WI': ('Wisconsin', 44.27, -89.62),
+    'WY': ('Wyoming', 42.76, -107.30)
+}
+
+STATE_NAMES = {name.lower(): abbr for abbr, (name, _, _) in US_STATES.items()}
+
+# Built-in seed used when no full gazetteer file is configured:
+# (city, state, representative zip, latitude, longitude, population)
+SEED_PLACES = [
+    ('New York', 'NY', '10001', 40.7128, -74.0060, 8336817),
+    ('Manhattan', 'NY', '10001', 40.7831, -73.9712, 1694251),
+    ('Buffalo', 'NY', '14202', 42.8864, -78.8784, 278349),
+    ('Rochester', 'NY', '14604', 43.1566, -77.6088, 211328),
+    ('Syracuse', 'NY', '13202', 43.0481, -76.1474, 148620),
+    ('Albany', 'NY', '12207', 42.6526, -73.7562, 99224),
+    ('Los Angeles', 'CA', '90012', 34.0522, -118.2437, 3898747),
+    ('San Diego', 'CA', '92101', 32.7157, -117.1611, 1386932),
+    ('San Jose', 'CA', '95113', 37.3382, -121.8863, 1013240),
+    ('San Francisco', 'CA', '94102', 37.7749, -122.4194, 873965),
+    ('Sacramento', 'CA', '95814', 38.5816, -121.4944, 524943),
+    ('Oakland', 'CA', '94612', 37.8044, -122.2712, 440646),
+    ('Beverly Hills', 'CA', '90210', 34.0736, -118.4004, 32701),
+    ('Napa', 'CA', '94559', 38.2975, -122.2869, 79246),
+    ('Chicago', 'IL', '60601', 41.8781, -87.6298, 2746388),
+    ('Aurora', 'IL', '60505', 41.7606, -88.3201, 180542),
+    ('Joliet', 'IL', '60432', 41.5250, -88.0817, 150362),
+    ('Naperville', 'IL', '60540', 41.7508, -88.1535, 149540),
+    ('Rockford', 'IL', '61101', 42.2711, -89.0940, 148655),
+    ('Houston', 'TX', '77002', 29.7604, -95.3698, 2304580),
+    ('San Antonio', 'TX', '78205', 29.4241, -98.4936, 1434625),
+    ('Dallas', 'TX', '75201', 32.7767, -96.7970, 1304379),
+    ('Austin', 'TX', '78701', 30.2672, -97.7431, 961855),
+    ('Fort Worth', 'TX', '76102', 32.7555, -97.3308, 918915),
+    ('Plano', 'TX', '75074', 33.0198, -96.6989, 285494),
+    ('Jacksonville', 'FL', '32202', 30.3322, -81.6557, 949611),
+    ('Miami', 'FL', '33130', 25.7617, -80.1918, 442241),
+    ('Tampa', 'FL', '33602', 27.9506, -82.4572, 384959),
+    ('Orlando', 'FL', '32801', 28.5383, -81.3792, 307573),
+    ('Fort Lauderdale', 'FL', '33301', 26.1224, -80.1373, 182760),
+    ('Phoenix', 'AZ', '85003', 33.4484, -112.0740, 1608139),
+    ('Scottsdale', 'AZ', '85251', 33.4942, -111.9261, 241361),
+    ('Philadelphia', 'PA', '19103', 39.9526, -75.1652, 1603797),
+    ('Columbus', 'OH', '43215', 39.9612, -82.9988, 905748),
+    ('Charlotte', 'NC', '28202', 35.2271, -80.8431, 874579),
+    ('Indianapolis', 'IN', '46204', 39.7684, -86.1581, 887642),
+    ('Seattle', 'WA', '98101', 47.6062, -122.3321, 737015),
+    ('Denver', 'CO', '80202', 39.7392, -104.9903, 715522),
+    ('Washington', 'DC', '20001', 38.9072, -77.0369, 689545),
+    ('Boston', 'MA', '02108', 42.3601, -71.0589, 675647),
+    ('Portland', 'OR', '97204', 45.5152, -122.6784, 652503),
+    ('Las Vegas', 'NV', '89101', 36.1699, -115.1398, 641903),
+    ('Nashville', 'TN', '37203', 36.1627, -86.7816, 689447),
+    ('Detroit', 'MI', '48226', 42.3314, -83.0458, 639111),
+    ('Atlanta', 'GA', '30303', 33.7490, -84.3880, 498715),
+    ('Minneapolis', 'MN', '55401', 44.9778, -93.2650, 429954)
+]
+
+ZIP_PATTERN = re.compile(r'\b(\d{5})(?:-\d{4})?\b')
+
+@dataclass
+class Place:
+    """Canonical resolved location"""
+    city: str = ""
+    state: str = ""
+    zip_code: str = ""
+    latitude: float = 0.0
+    longitude: float = 0.0
+    population: int = 0
+    source: str = "gazetteer"
+
+def normalize_name(text: str) -> str:
+    """Lowercase and collapse punctuation so lookups ignore formatting"""
+    return ' '.join(re.sub(r'[^a-z0-9 ]', ' ', text.lower()).split())
+
+def _place_records(places: Iterable[tuple]) -> Iterator[tuple]:
+    """Expand places into (key, fields) records keyed by ZIP and by city/state"""
+    for city, state, zip_code, latitude, longitude, population in places:
+        fields = (city, state, zip_code, f"{latitude:.4f}", f"{longitude:.4f}", str(int(population or 0)))
+        if zip_code:
+            yield zip_code, fields
+        yield f"{normalize_name(city)} {state.lower()}", fields
+
+def build_gazetteer(places: Iterable[tuple], path: str = None) -> bytes:
+    """Encode places into the sorted, offset-indexed gazetteer format"""
+    best: Dict[str, tuple] = {}
+    for key, fields in _place_records(places):
+        # Keep the most populous place when keys collide
+        if key not in best or int(fields[5]) > int(best[key][5]):
+            best[key] = fields
+
+    offsets = []
+    data = bytearray()
+    for key in sorted(best):
+        offsets.append(len(data))
+        data += ('\t'.join((key,) + best[key]) + '\n').encode('utf-8')
+
+    blob = HEADER.pack(MAGIC, len(offsets)) + struct.pack(f'<{len(offsets)}I', *offsets) + bytes(data)
+
+    if path:
+        with open(path, 'wb') as f:
+            f.write(blob)
+        logger.info(f"🗺️  Gazetteer with {len(offsets)} keys written to {path}")
+
+    return blob
+
+def load_places_csv(csv_path: str) -> Iterator[tuple]:
+    """Read places from a CSV with zip, city, state, lat, lon and optional population columns"""
+    with open(csv_path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            try:
+                yield (
+                    row['city'].strip(), row['state'].strip().upper(), row.get('zip', '').strip().zfill(5),
+                    float(row['lat']), float(row['lon']), int(float(row.get('population') or 0))
+                )
+            except (KeyError, ValueError) as e:
+                logger.error(f"Skipping gazetteer row {row}: {e}")
+
+class Gazetteer:
+    """Binary-searchable place index over a memory map or in-memory buffer"""
+
+    def __init__(self, path: str = None, data: bytes = None):
+        self._file = None
+        if path:
+            self._file = open(path, 'rb')
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._buffer = data if data is not None else build_gazetteer(SEED_PLACES)
+
+        magic, count = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise ValueError("Not a LeadWave gazetteer file")
+
+        self.count = count
+        offsets_start = HEADER.size
+        self._data_start = offsets_start + 4 * count
+        self._offsets = memoryview(self._buffer)[offsets_start:self._data_start].cast('I')
+
+    def close(self):
+        self._offsets.release()
+        if self._file:
+            self._buffer.close()
+            self._file.close()
+            self._file = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _key(self, index: int) -> bytes:
+        start = self._data_start + self._offsets[index]
+        return self._buffer[start:self._buffer.find(b'\t', start)]
+
+    def _place(self, index: int) -> Place:
+        start = self._data_start + self._offsets[index]
+        line = self._buffer[start:self._buffer.find(b'\n', start)].decode('utf-8')
+        _, city, state, zip_code, latitude, longitude, population = line.split('\t')
+        return Place(city, state, zip_code, float(latitude), float(longitude), int(population))
+
+    def _lower_bound(self, key: bytes) -> int:
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._key(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def get(self, key: str) -> Optional[Place]:
+        """Exact lookup by ZIP or normalized 'city st' key"""
+        encoded = key.encode('utf-8')
+        index = self._lower_bound(encoded)
+        if index < self.count and self._key(index) == encoded:
+            return self._place(index)
+        return None
+
+    def _population(self, index: int) -> int:
+        start = self._data_start + self._offsets[index]
+        end = self._buffer.find(b'\n', start)
+        return int(self._buffer[self._buffer.rfind(b'\t', start, end) + 1:end])
+
+    def prefix(self, prefix: str, limit: int = 20) -> List[Place]:
+        """Places whose key starts with the prefix, most populous first"""
+        encoded = prefix.encode('utf-8')
+        # 0xff never occurs in UTF-8, so it bounds every key carrying the prefix
+        first, last = self._lower_bound(encoded), self._lower_bound(encoded + b'\xff')
+
+        # Rank the whole range by population before parsing, key order says nothing about size
+        best = heapq.nlargest(limit, range(first, last), key=self._population)
+        return [self._place(index) for index in best]
+
+    def resolve(self, text: str) -> Optional[Place]:
+        """Resolve free text like 'Miami, FL', 'miami florida' or '33130'"""
+        if not text:
+            return None
+
+        zip_match = ZIP_PATTERN.search(text)
+        if zip_match:
+            place = self.get(zip_match.group(1))
+            if place:
+                return place
+            text = ZIP_PATTERN.sub(' ', text)
+
+        tokens = normalize_name(text).split()
+        if not tokens:
+            return None
+
+        # Peel a trailing state abbreviation or full state name off the query
+        state = None
+        for width in (3, 2, 1):
+            if len(tokens) < width:
+                continue
+            candidate = ' '.join(tokens[-width:])
+            if width == 1 and candidate.upper() in US_STATES:
+                state = candidate.upper()
+            elif candidate in STATE_NAMES:
+                state = STATE_NAMES[candidate]
+            if state:
+                tokens = tokens[:-width]
+                break
+
+        city = ' '.join(tokens)
+
+        if city and state:
+            return self.get(f"{city} {state.lower()}")
+
+        if city:
+            candidates = self.prefix(f"{city} ", limit=1)
+            return candidates[0] if candidates else None
+
+        if state:
+            # 'New York' or 'Washington' alone usually means the city
+            candidates = self.prefix(f"{' '.join(normalize_name(text).split())} ", limit=1)
+            if candidates:
+                return candidates[0]
+            name, latitude, longitude = US_STATES[state]
+            return Place('', state, '', latitude, longitude, 0)
+
+        return None
+
+class GeocodeCache:
+    """Persistent SQLite cache of geocoder answers, including misses"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self.db.execute(
+            'CREATE TABLE IF NOT EXISTS geocodes ('
+            'query TEXT PRIMARY KEY, city TEXT, state TEXT, zip_code TEXT, '
+            'latitude REAL, longitude REAL, found INTEGER NOT NULL, created REAL NOT NULL)'
+        )
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.connection = connection
+        return connection
+
+    def get(self, query: str):
+        """Return a Place, False for a cached miss, or None when unknown"""
+        row = self.db.execute(
+            'SELECT city, state, zip_code, latitude, longitude, found FROM geocodes WHERE query = ?', (query,)
+        ).fetchone()
+        if row is None:
+            return None
+        if not row[5]:
+            return False
+        return Place(row[0], row[1], row[2], row[3], row[4], 0, 'cache')
+
+    def put(self, query: str, place: Optional[Place]):
+        if place:
+            values = (query, place.city, place.state, place.zip_code, place.latitude, place.longitude, 1, time.time())
+        else:
+            values = (query, None, None, None, None, None, 0, time.time())
+        self.db.execute('INSERT OR REPLACE INTO geocodes VALUES (?, ?, ?, ?, ?, ?, ?, ?)', values)
+
+def geopy_geocoder(user_agent: str = 'leadwave'):
+    """Nominatim geocoder from geopy, the fallback for places missing from the gazetteer"""
+    from geopy.geocoders import Nominatim
+    return Nominatim(user_agent=user_agent, timeout=Config.REQUEST_TIMEOUT)
+
+class LocationResolver:
+    """Gazetteer first, then a persistent cache, then an optional remote geocoder"""
+
+    def __init__(self, gazetteer: Gazetteer = None, geocoder=None, cache_path: str = None):
+        self.gazetteer = gazetteer or get_gazetteer()
+        self.geocoder = geocoder
+        self.cache = GeocodeCache(cache_path) if cache_path else None
+        self.stats = {'gazetteer': 0, 'cache': 0, 'geocoder': 0, 'unresolved': 0}
+        self._resolve = lru_cache(maxsize=100000)(self._resolve_uncached)
+
+    def resolve(self, text: str) -> Optional[Place]:
+        return self._resolve(normalize_name(text) if not ZIP_PATTERN.search(text or '') else text.strip())
+
+    def _resolve_uncached(self, query: str) -> Optional[Place]:
+        place = self.gazetteer.resolve(query)
+        if place:
+            self.stats['gazetteer'] += 1
+            return place
+
+        if self.cache:
+            cached = self.cache.get(query)
+            if cached is not None:
+                self.stats['cache'] += 1
+                return cached or None
+
+        if self.geocoder is None:
+            self.stats['unresolved'] += 1
+            return None
+
+        place = self._geocode(query)
+        self.stats['geocoder' if place else 'unresolved'] += 1
+        if self.cache:
+            self.cache.put(query, place)
+        return place
+
+    def _geocode(self, query: str) -> Optional[Place]:
+        try:
+            location = self.geocoder.geocode(query, country_codes='us', addressdetails=True)
+        except Exception as e:
+            logger.error(f"Geocoding error for {query!r}: {e}")
+            return None
+
+        if not location:
+            return None
+
+        address = (location.raw or {}).get('address', {})
+        state_name = (address.get('state') or '').lower()
+        return Place(
+            city=address.get('city') or address.get('town') or address.get('village') or '',
+            state=STATE_NAMES.get(state_name, ''),
+            zip_code=(address.get('postcode') or '')[:5],
+            latitude=location.latitude,
+            longitude=location.longitude,
+            source='geocoder'
+        )
+
+_default_gazetteer: Optional[Gazetteer] = None
+
+def get_gazetteer() -> Gazetteer:
+    """Shared gazetteer from Config.GAZETTEER_PATH, or the built-in seed"""
+    global _default_gazetteer
+    if _default_gazetteer is None:
+        path = Config.GAZETTEER_PATH
+        _default_gazetteer = Gazetteer(path) if path and os.path.exists(path) else Gazetteer()
+    return _default_gazetteer
+
+def resolve_location(text: str) -> Optional[Place]:
+    """Resolve a location with the shared gazetteer"""
+    return get_gazetteer().resolve(text)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python gazetteer.py <places.csv> <output.gaz>")
+        sys.exit(1)
+    build_gazetteer(load_places_csv(sys.argv[1]), sys.argv[2])
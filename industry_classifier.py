@@ -0,0 +1,146 @@
+"""
+Industry classification for LeadWave™
+A single Aho-Corasick automaton compiled from INDUSTRY_KEYWORDS
+"""
+
+import logging
+from collections import deque
+from functools import lru_cache
+from typing import List, Dict, Tuple, Optional, Iterator
+
+from config import INDUSTRY_KEYWORDS
+
+logger = logging.getLogger(__name__)
+
+# Queries up to this length are cached, longer page text is classified directly
+MAX_CACHED_QUERY_LENGTH = 256
+
+class AhoCorasick:
+    """Multi-pattern matcher that finds every keyword in one pass over the text"""
+
+    def __init__(self, patterns: Dict[str, List[str]]):
+        # Node 0 is the root; each node has transitions, a fail link and outputs
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[Tuple[str, str]]] = [[]]
+
+        for payload, words in patterns.items():
+            for word in words:
+                self._add(word.lower(), payload)
+
+        self._link()
+
+    def _add(self, word: str, payload: str):
+        node = 0
+        for char in word:
+            next_node = self.transitions[node].get(char)
+            if next_node is None:
+                next_node = len(self.transitions)
+                self.transitions[node][char] = next_node
+                self.transitions.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            node = next_node
+        self.outputs[node].append((word, payload))
+
+    def _link(self):
+        """Compute fail links breadth-first and merge outputs along them"""
+        queue = deque(self.transitions[0].values())
+
+        while queue:
+            node = queue.popleft()
+            for char, child in self.transitions[node].items():
+                queue.append(child)
+
+                fallback = self.fail[node]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.transitions[fallback].get(char, 0)
+                self.fail[child] = target if target != child else 0
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, str, str]]:
+        """Yield (start, word, payload) for every keyword occurrence"""
+        transitions = self.transitions
+        fail = self.fail
+        outputs = self.outputs
+        node = 0
+
+        for position, char in enumerate(text):
+            while node and char not in transitions[node]:
+                node = fail[node]
+            node = transitions[node].get(char, 0)
+
+            for word, payload in outputs[node]:
+                yield position - len(word) + 1, word, payload
+
+def _is_word_match(text: str, start: int, length: int) -> bool:
+    """Require word boundaries, allowing a plural suffix after the keyword"""
+    if start > 0 and text[start - 1].isalnum():
+        return False
+
+    end = start + length
+    for suffix in ('', 's', 'es'):
+        tail = end + len(suffix)
+        if text[end:tail] == suffix and (tail >= len(text) or not text[tail].isalnum()):
+            return True
+
+    return False
+
+class IndustryClassifier:
+    """Ranks industry categories for free-text queries and scraped page text"""
+
+    def __init__(self, keywords: Dict[str, List[str]] = None, cache_size: int = 100000):
+        self.keywords = keywords or INDUSTRY_KEYWORDS
+        self.automaton = AhoCorasick(self.keywords)
+        self._cached_classify = lru_cache(maxsize=cache_size)(self._classify)
+
+    def _classify(self, text: str) -> Tuple[Tuple[str, float], ...]:
+        weights: Dict[str, float] = {}
+        first_seen: Dict[str, int] = {}
+
+        for start, word, category in self.automaton.iter_matches(text):
+            if not _is_word_match(text, start, len(word)):
+                continue
+            # Longer keywords are more specific, so they carry more weight
+            weights[category] = weights.get(category, 0.0) + len(word)
+            first_seen.setdefault(category, start)
+
+        total = sum(weights.values())
+        if not total:
+            return ()
+
+        ranked = sorted(weights, key=lambda category: (-weights[category], first_seen[category]))
+        return tuple((category, round(weights[category] / total, 4)) for category in ranked)
+
+    def classify(self, text: str) -> List[Tuple[str, float]]:
+        """Return (category, share of keyword weight) pairs, best first"""
+        if not text:
+            return []
+
+        text = text.lower()
+        if len(text) <= MAX_CACHED_QUERY_LENGTH:
+            return list(self._cached_classify(text))
+
+        return list(self._classify(text))
+
+    def best(self, text: str, default: Optional[str] = None) -> Optional[str]:
+        """Return the top category, or the default when nothing matches"""
+        ranked = self.classify(text)
+        return ranked[0][0] if ranked else default
+
+    def cache_info(self):
+        return self._cached_classify.cache_info()
+
+_default_classifier: Optional[IndustryClassifier] = None
+
+def get_classifier() -> IndustryClassifier:
+    """Shared classifier, compiled on first use"""
+    global _default_classifier
+    if _default_classifier is None:
+        _default_classifier = IndustryClassifier()
+    return _default_classifier
+
+def classify_industry(text: str, default: Optional[str] = None) -> Optional[str]:
+    """Classify text with the shared classifier"""
+    return get_classifier().best(text, default)
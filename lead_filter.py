@@ -0,0 +1,361 @@
+"""
+Lead filter expressions for LeadWave™
+Compiles expressions like "score >= 80 and claimed and state in ('FL', 'TX')"
+into predicates over leads, raw source records and indexed lead stores
+"""
+
+import re
+import logging
+from functools import lru_cache
+from dataclasses import fields
+from typing import List, Dict, Optional, Iterable, Iterator, Callable, Any, Tuple
+
+from lead_pipeline import BusinessLead
+
+logger = logging.getLogger(__name__)
+
+LEAD_FIELDS = {f.name for f in fields(BusinessLead)}
+
+FIELD_ALIASES = {
+    'name': 'business_name',
+    'owner': 'owner_name',
+    'zip': 'zip_code',
+    'rating': 'google_rating',
+    'reviews': 'google_reviews',
+    'claimed': 'google_claimed',
+    'three_pack': 'google_3pack',
+    'score': 'confidence_score',
+}
+
+# Lead fields copied verbatim from raw source records by LeadPipeline._build_lead,
+# so conditions on them can be checked before a business is processed. Fields
+# filled by enrichment stages (owner_name, google_claimed, google_3pack,
+# social_media) may be missing from the listing and are only checked afterwards.
+RAW_FIELDS: Dict[str, Callable[[Dict], Any]] = {
+    'business_name': lambda record: record.get('name', ''),
+    'email': lambda record: record.get('email', ''),
+    'phone': lambda record: record.get('phone', ''),
+    'website': lambda record: record.get('website', ''),
+    'source_url': lambda record: record.get('source_url', ''),
+    'address': lambda record: record.get('address', ''),
+    'city': lambda record: record.get('city', ''),
+    'state': lambda record: record.get('state', ''),
+    'zip_code': lambda record: record.get('zip_code', ''),
+    'country': lambda record: 'US',
+    'google_rating': lambda record: record.get('rating', 0),
+    'google_reviews': lambda record: record.get('reviews', 0),
+}
+
+# Fields a LeadFileReader can look up without scanning, with its index key names
+FILE_INDEX_KEYS = {'phone': 'phone', 'website': 'domain', 'zip_code': 'zip'}
+
+TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<number>-?\d+(?:\.\d+)?)
+      | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+      | (?P<op>==|!=|>=|<=|=|<|>|\(|\)|\[|\]|,)
+      | (?P<word>[A-Za-z_][A-Za-z0-9_]*)
+    )""", re.VERBOSE)
+
+KEYWORDS = {'and', 'or', 'not', 'in', 'contains', 'true', 'false'}
+COMPARISONS = {'=', '==', '!=', '<', '<=', '>', '>=', 'in', 'not in', 'contains'}
+
+class FilterSyntaxError(ValueError):
+    """Raised for malformed filter expressions or unknown fields"""
+
+def _tokenize(expression: str) -> List[Tuple[str, Any]]:
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+
+    while position < len(expression):
+        match = TOKEN_PATTERN.match(expression, position)
+        if not match or match.end() == position:
+            raise FilterSyntaxError(f"Unexpected input at position {position}: {expression[position:position + 10]!r}")
+        position = match.end()
+
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == 'number':
+            tokens.append(('value', float(text) if '.' in text else int(text)))
+        elif kind == 'string':
+            tokens.append(('value', re.sub(r'\\(.)', r'\1', text[1:-1])))
+        elif kind == 'word' and text.lower() in ('true', 'false'):
+            tokens.append(('value', text.lower() == 'true'))
+        elif kind == 'word' and text.lower() in KEYWORDS:
+            tokens.append(('keyword', text.lower()))
+        elif kind == 'word':
+            tokens.append(('field', text))
+        else:
+            tokens.append(('op', text))
+
+    return tokens
+
+class _Parser:
+    """Recursive descent: or_expr -> and_expr ('or' and_expr)*, and so on"""
+
+    def __init__(self, tokens: List[Tuple[str, Any]]):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self) -> Tuple[str, Any]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else ('end', None)
+
+    def take(self, kind: str = None, value: Any = None) -> Tuple[str, Any]:
+        token = self.peek()
+        if (kind and token[0] != kind) or (value is not None and token[1] != value):
+            expected = value or kind
+            raise FilterSyntaxError(f"Expected {expected} but found {token[1] if token[1] is not None else 'end of filter'}")
+        self.position += 1
+        return token
+
+    def parse(self):
+        node = self.or_expr()
+        if self.peek()[0] != 'end':
+            raise FilterSyntaxError(f"Unexpected {self.peek()[1]!r}")
+        return node
+
+    def or_expr(self):
+        terms = [self.and_expr()]
+        while self.peek() == ('keyword', 'or'):
+            self.take()
+            terms.append(self.and_expr())
+        return terms[0] if len(terms) == 1 else ('or', terms)
+
+    def and_expr(self):
+        terms = [self.not_expr()]
+        while self.peek() == ('keyword', 'and'):
+            self.take()
+            terms.append(self.not_expr())
+        return terms[0] if len(terms) == 1 else ('and', terms)
+
+    def not_expr(self):
+        if self.peek() == ('keyword', 'not'):
+            self.take()
+            return ('not', self.not_expr())
+        return self.atom()
+
+    def atom(self):
+        if self.peek() == ('op', '('):
+            self.take()
+            node = self.or_expr()
+            self.take('op', ')')
+            return node
+
+        name = self.take('field')[1]
+        field = FIELD_ALIASES.get(name, name)
+        if field not in LEAD_FIELDS:
+            raise FilterSyntaxError(f"Unknown lead field: {name}")
+
+        kind, value = self.peek()
+        if kind == 'keyword' and value == 'not' and self.tokens[self.position + 1:self.position + 2] == [('keyword', 'in')]:
+            self.position += 2
+            return ('cmp', field, 'not in', self.value_list())
+        if kind == 'keyword' and value == 'in':
+            self.take()
+            return ('cmp', field, 'in', self.value_list())
+        if kind == 'keyword' and value == 'contains':
+            self.take()
+            return ('cmp', field, 'contains', self.take('value')[1])
+        if kind == 'op' and value in COMPARISONS:
+            self.take()
+            return ('cmp', field, value, self.take('value')[1])
+
+        # A bare field tests for a truthy value
+        return ('truthy', field)
+
+    def value_list(self) -> tuple:
+        closing = ')' if self.peek() == ('op', '(') else ']'
+        self.take('op', '(' if closing == ')' else '[')
+        values = []
+        while self.peek() != ('op', closing):
+            values.append(self.take('value')[1])
+            if self.peek() == ('op', ','):
+                self.take()
+        self.take('op', closing)
+        return tuple(values)
+
+def _fold(value: Any) -> Any:
+    # String comparisons ignore case, state codes and industries are typed both ways
+    return value.lower() if isinstance(value, str) else value
+
+def _compile(node, get: Callable[[str], Callable[[Any], Any]]) -> Callable[[Any], bool]:
+    """Turn an AST node into a closure, get(field) returns a value accessor"""
+    kind = node[0]
+
+    if kind == 'and':
+        parts = [_compile(child, get) for child in node[1]]
+        return lambda item: all(part(item) for part in parts)
+    if kind == 'or':
+        parts = [_compile(child, get) for child in node[1]]
+        return lambda item: any(part(item) for part in parts)
+    if kind == 'not':
+        inner = _compile(node[1], get)
+        return lambda item: not inner(item)
+
+    value_of = get(node[1])
+    if kind == 'truthy':
+        return lambda item: bool(value_of(item))
+
+    _, field, op, literal = node
+    if op in ('in', 'not in'):
+        options = frozenset(_fold(value) for value in literal)
+        if op == 'in':
+            return lambda item: _fold(value_of(item)) in options
+        return lambda item: _fold(value_of(item)) not in options
+
+    if op == 'contains':
+        needle = _fold(literal)
+        def contains(item):
+            value = value_of(item)
+            if isinstance(value, dict):
+                return needle in {_fold(key) for key in value}
+            return needle in _fold(str(value or ''))
+        return contains
+
+    literal = _fold(literal)
+    def compare(item, op=op):
+        value = _fold(value_of(item))
+        try:
+            if op in ('=', '=='):
+                return value == literal
+            if op == '!=':
+                return value != literal
+            if op == '<':
+                return value < literal
+            if op == '<=':
+                return value <= literal
+            if op == '>':
+                return value > literal
+            return value >= literal
+        except TypeError:
+            return False
+    return compare
+
+def _fields(node) -> set:
+    if node[0] in ('and', 'or'):
+        return set().union(*(_fields(child) for child in node[1]))
+    if node[0] == 'not':
+        return _fields(node[1])
+    return {node[1]}
+
+def _record_getter(field: str) -> Callable[[tuple], Any]:
+    # Record predicates take (raw record, campaign industry), matching _build_lead
+    if field == 'industry':
+        return lambda item: item[0].get('industry') or item[1]
+    raw = RAW_FIELDS[field]
+    return lambda item: raw(item[0])
+
+class LeadFilter:
+    """A compiled filter expression"""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tree = _Parser(_tokenize(expression)).parse()
+        self.fields = _fields(self.tree)
+        self._predicate = _compile(self.tree, lambda field: lambda lead: getattr(lead, field))
+
+        # Top-level conjuncts that only need raw record fields can run before enrichment
+        conjuncts = self.tree[1] if self.tree[0] == 'and' else [self.tree]
+        self.conjuncts = conjuncts
+        record_parts = [node for node in conjuncts if _fields(node) <= set(RAW_FIELDS) | {'industry'}]
+        self.pushdown = bool(record_parts)
+        self._record_predicate = _compile(('and', record_parts), _record_getter) if record_parts else None
+
+    def __repr__(self) -> str:
+        return f"LeadFilter({self.expression!r})"
+
+    def __call__(self, lead: BusinessLead) -> bool:
+        return self._predicate(lead)
+
+    def matches_record(self, record: Dict, industry: str = '') -> bool:
+        """Check the pushed-down conditions against a raw source record"""
+        return self._record_predicate is None or self._record_predicate((record, industry))
+
+    def equality_lookups(self) -> List[Tuple[str, tuple]]:
+        """(field, values) for top-level '=' and 'in' conditions, usable as index lookups"""
+        lookups = []
+        for node in self.conjuncts:
+            if node[0] == 'cmp' and node[2] in ('=', '=='):
+                lookups.append((node[1], (node[3],)))
+            elif node[0] == 'cmp' and node[2] == 'in':
+                lookups.append((node[1], node[3]))
+        return lookups
+
+    def min_score(self) -> float:
+        """Lowest confidence score any matching lead can have, from top-level conditions"""
+        bound = 0.0
+        for node in self.conjuncts:
+            if node[0] == 'cmp' and node[1] == 'confidence_score' and node[2] in ('>=', '>', '=', '=='):
+                if isinstance(node[3], (int, float)) and not isinstance(node[3], bool):
+                    bound = max(bound, float(node[3]))
+        return bound
+
+    def apply(self, leads: Iterable[BusinessLead]) -> List[BusinessLead]:
+        return [lead for lead in leads if self._predicate(lead)]
+
+@lru_cache(maxsize=256)
+def _compiled(expression: str) -> LeadFilter:
+    return LeadFilter(expression)
+
+def compile_filter(expression) -> LeadFilter:
+    """Parse and compile an expression once, LeadFilter instances pass through"""
+    if isinstance(expression, LeadFilter):
+        return expression
+    return _compiled(expression.strip())
+
+class LeadIndex:
+    """Hash indexes over an in-memory lead collection, built per field on demand"""
+
+    def __init__(self, leads: List[BusinessLead]):
+        self.leads = leads
+        self._indexes: Dict[str, Dict[Any, List[int]]] = {}
+        self._indexed_count = 0
+
+    def _index(self, field: str) -> Dict[Any, List[int]]:
+        if self._indexed_count != len(self.leads):
+            # Leads were added, rebuild lazily
+            self._indexes.clear()
+            self._indexed_count = len(self.leads)
+
+        index = self._indexes.get(field)
+        if index is None:
+            index = self._indexes[field] = {}
+            for position, lead in enumerate(self.leads):
+                value = getattr(lead, field)
+                if isinstance(value, (dict, list)):
+                    continue
+                index.setdefault(_fold(value), []).append(position)
+        return index
+
+    def query(self, expression) -> List[BusinessLead]:
+        """Leads matching the filter, narrowed by the most selective equality lookup"""
+        lead_filter = compile_filter(expression)
+
+        best = None
+        for field, values in lead_filter.equality_lookups():
+            index = self._index(field)
+            positions = sorted({position for value in values for position in index.get(_fold(value), ())})
+            if best is None or len(positions) < len(best):
+                best = positions
+
+        candidates = self.leads if best is None else (self.leads[position] for position in best)
+        return lead_filter.apply(candidates)
+
+def filter_leads(leads: Iterable[BusinessLead], expression) -> List[BusinessLead]:
+    """One-off filtering of a lead collection"""
+    return compile_filter(expression).apply(leads)
+
+def query_file(reader, expression) -> Iterator[BusinessLead]:
+    """Filter a LeadFileReader, using its phone/domain/zip lookups when the filter allows"""
+    lead_filter = compile_filter(expression)
+
+    for field, values in lead_filter.equality_lookups():
+        if field in FILE_INDEX_KEYS:
+            for value in dict.fromkeys(values):
+                for lead in reader.find(FILE_INDEX_KEYS[field], value):
+                    if lead_filter(lead):
+                        yield lead
+            return
+
+    yield from reader.scan(lead_filter)
@@ -0,0 +1,623 @@
+"""
+LeadWave™ shared lead pipeline
+One BusinessLead model, one source interface and one processing pipeline
+used by every LeadWave™ entry point
+"""
+
+import random
+import logging
+import threading
+from datetime import datetime
+from typing import List, Dict, Optional
+from dataclasses import dataclass, asdict
+
+from aggregates import SessionAggregates
+from concurrency import AdaptiveConcurrency
+from resilience import Resilience, CircuitOpenError
+from canonical import slug
+from suppression import business_keys
+
+logger = logging.getLogger(__name__)
+
+# Leads scoring below this are discarded
+MIN_CONFIDENCE_SCORE = 50
+
+# Filtered campaigns fetch up to this many times the requested count looking for matches
+FILTERED_FETCH_FACTOR = 16
+
+# Points each filled field adds to the confidence score
+SCORE_WEIGHTS = {
+    'business_name': 10, 'phone': 10, 'email': 10, 'address': 10,
+    'owner_name': 20,
+    'google_claimed': 15, 'google_3pack': 15,
+    'website': 5, 'social_media': 5
+}
+
+@dataclass
+class BusinessLead:
+    """Data structure for business leads"""
+    business_name: str = ""
+    owner_name: str = ""
+    email: str = ""
+    phone: str = ""
+    website: str = ""
+    address: str = ""
+    city: str = ""
+    state: str = ""
+    zip_code: str = ""
+    country: str = ""
+    industry: str = ""
+    google_3pack: bool = False
+    google_claimed: bool = False
+    google_rating: float = 0.0
+    google_reviews: int = 0
+    social_media: Dict = None
+    last_updated: str = ""
+    source_url: str = ""
+    confidence_score: float = 0.0
+
+    def __post_init__(self):
+        if self.social_media is None:
+            self.social_media = {}
+        if not self.last_updated:
+            self.last_updated = datetime.now().isoformat()
+
+class LeadSource:
+    """Base class for anything that supplies raw business records
+
+    Records are dictionaries using the canonical keys: name, owner_name,
+    email, phone, website, address, city, state, zip_code, rating, reviews,
+    google_claimed, google_3pack and optionally industry, social_media
+    and source_url.
+    """
+    
+    name = 'source'
+    
+    def fetch(self, industry: str, location: str, count: int = 10) -> List[Dict]:
+        """Return up to count raw business records"""
+        raise NotImplementedError
+    
+    def enrich(self, stage: str, business_data: Dict) -> Dict:
+        """Look up the fields of an enrichment stage the listing did not carry"""
+        return {}
+
+class LeadPipeline:
+    """Source-agnostic lead processing, scoring, reporting and export"""
+    
+    # Expensive enrichment stages as (stage, relative cost, fields), cheapest run first
+    ENRICHMENT_STAGES = [
+        ('social', 1, ('social_media',)),
+        ('owner', 2, ('owner_name',)),
+        ('google', 3, ('google_claimed', 'google_3pack')),
+    ]
+    
+    def __init__(self, source: LeadSource, suppression=None, cache=None):
+        self.source = source
+        self.suppression = suppression
+        self.cache = cache
+        self.leads = []
+        self.processed_businesses = set()
+        self.session_stats = {
+            'total_processed': 0,
+            'successful_extractions': 0,
+            'google_verified': 0,
+            'claimed_businesses': 0,
+            'three_pack_businesses': 0,
+            'high_quality_leads': 0,
+            'emails_verified': 0,
+            'undeliverable_emails': 0,
+            'free_mail_emails': 0,
+            'suppressed_businesses': 0,
+            'social_profiles_checked': 0,
+            'social_profiles_missing': 0,
+            'cached_leads': 0,
+            'filtered_businesses': 0
+        }
+        self.aggregates = SessionAggregates()
+        self._aggregated_leads = self.leads
+        self.concurrency = AdaptiveConcurrency()
+        self.resilience = Resilience()
+        # Optional callback invoked with each accepted lead as it is added
+        self.on_lead = None
+        # Optional callable, a true result stops the running campaign before the next business
+        self.should_stop = None
+        self.enrichment_stats = {
+            'stages_run': 0,
+            'lookups': 0,
+            'stages_skipped': 0,
+            'lookups_skipped': 0,
+            'early_rejections': 0
+        }
+        self._enrichment_lock = threading.Lock()
+        # Counts from the last delta export written by save_leads
+        self.last_delta = None
+        # Whether the last campaign stopped because the source had nothing more to return
+        self.source_exhausted = False
+    
+    @property
+    def data_generator(self) -> LeadSource:
+        return self.source
+    
+    def generate_leads(self, industry: str, location: str, max_leads: int = 50,
+                       where=None) -> List[BusinessLead]:
+        """Generate leads for specified criteria
+        
+        where is a filter expression such as "score >= 80 and claimed", conditions
+        on raw source fields are checked before a business is processed.
+        """
+        if where is not None:
+            from lead_filter import compile_filter
+            where = compile_filter(where)
+        
+        # Cached campaigns are unfiltered, filtered runs go straight to the source
+        if self.cache is not None and where is None:
+            return self.cache.generate(self, industry, location, max_leads)
+        return self._run_campaign(industry, location, max_leads, where=where)
+    
+    def _run_campaign(self, industry: str, location: str, max_leads: int,
+                      skip=None, fetch_count: int = None, where=None) -> List[BusinessLead]:
+        """Fetch and process businesses, skip() drops records before any processing"""
+        logger.info(f"🌊 Starting LeadWave™ generation for {industry} in {location}")
+        
+        if max_leads <= 0:
+            return []
+        
+        leads = []
+        self.source_exhausted = False
+        # A score condition in the filter raises the bar for early rejection
+        min_score = max(MIN_CONFIDENCE_SCORE, where.min_score() if where is not None else 0)
+        count = fetch_count or max_leads
+        # Filtered campaigns fetch again with a larger count until enough leads match
+        fetch_limit = count * FILTERED_FETCH_FACTOR if where is not None else count
+        seen = set()
+        
+        while True:
+            # Fetch raw business records, an open circuit fails fast instead of waiting out retries
+            try:
+                businesses = self.resilience.call(
+                    self._fetch, industry, location, count, source=self.source.name
+                )
+            except CircuitOpenError as e:
+                logger.warning(f"⚡ Skipping {self.source.name}: {e}")
+                break
+            
+            if not businesses and not seen:
+                logger.warning("No businesses found")
+                self.source_exhausted = True
+                break
+            
+            for business_data in businesses:
+                if self._stop_requested():
+                    break
+                try:
+                    # Sources return earlier records again for a larger count, any shared key is the same business
+                    keys = business_keys(business_data) or [repr(sorted(business_data.items()))]
+                    if any(key in seen for key in keys):
+                        continue
+                    seen.update(keys)
+                    
+                    if self._is_suppressed(business_data):
+                        continue
+                    if skip and skip(business_data):
+                        continue
+                    if where is not None and not where.matches_record(business_data, industry):
+                        self.session_stats['filtered_businesses'] += 1
+                        continue
+                    
+                    lead = self._process_business(business_data, industry, min_score)
+                    if where is not None and lead and not where(lead):
+                        self.session_stats['filtered_businesses'] += 1
+                        continue
+                    if self._accept_lead(lead):
+                        leads.append(lead)
+                        self._add_lead(lead)
+                        
+                        if len(leads) >= max_leads:
+                            break
+                            
+                except Exception as e:
+                    logger.error(f"Error processing business: {e}")
+            
+            if self._stop_requested():
+                logger.info(f"🛑 Campaign for {industry} in {location} stopped after {len(leads)} leads")
+                break
+            
+            # Stop when full, when the source ran out, or at the over-fetch limit
+            self.source_exhausted = len(businesses) < count
+            if len(leads) >= max_leads or self.source_exhausted or count >= fetch_limit:
+                break
+            count = min(count * 2, fetch_limit)
+        
+        logger.info(f"✅ Generated {len(leads)} high-quality leads")
+        
+        return leads
+    
+    def _stop_requested(self) -> bool:
+        return bool(self.should_stop and self.should_stop())
+    
+    def _fetch(self, industry: str, location: str, count: int) -> List[Dict]:
+        with self.concurrency.slot(self.source.name):
+            return self.source.fetch(industry, location, count)
+    
+    def _is_suppressed(self, business_data: Dict) -> bool:
+        """Skip businesses already delivered in an earlier campaign"""
+        if self.suppression is None or not self.suppression.is_suppressed(business_data):
+            return False
+        
+        self.session_stats['suppressed_businesses'] += 1
+        return True
+    
+    def mark_delivered(self, leads: List[BusinessLead] = None) -> int:
+        """Add leads to the suppression list so later campaigns skip them"""
+        if self.suppression is None:
+            return 0
+        
+        leads = self.leads if leads is None else leads
+        added = self.suppression.add_many(asdict(lead) for lead in leads)
+        logger.info(f"🛡️  Marked {len(leads)} leads as delivered")
+        return added
+    
+    def _accept_lead(self, lead: Optional[BusinessLead]) -> bool:
+        """Apply the quality threshold and count accepted leads"""
+        if not lead or lead.confidence_score < MIN_CONFIDENCE_SCORE:
+            return False
+        
+        self.session_stats['total_processed'] += 1
+        if lead.confidence_score >= 80:
+            self.session_stats['high_quality_leads'] += 1
+        
+        return True
+    
+    def _add_lead(self, lead: BusinessLead):
+        """Append an accepted lead and fold it into the running aggregates"""
+        self._sync_aggregates()
+        self.leads.append(lead)
+        self.aggregates.add(lead)
+        if self.on_lead:
+            self.on_lead(lead)
+    
+    def _sync_aggregates(self):
+        """Rebuild aggregates if the leads list was replaced or edited directly"""
+        if self._aggregated_leads is not self.leads or self.aggregates.count != len(self.leads):
+            self.aggregates.rebuild(self.leads)
+            self._aggregated_leads = self.leads
+    
+    def _process_business(self, business_data: Dict, industry: str,
+                          min_score: float = MIN_CONFIDENCE_SCORE) -> Optional[BusinessLead]:
+        """Process individual business to extract lead information"""
+        lead = self._build_lead(business_data, industry, min_score)
+        if lead:
+            self._record_extraction(lead)
+        return lead
+    
+    def _record_extraction(self, lead: BusinessLead):
+        """Update extraction statistics for a processed lead"""
+        self.session_stats['successful_extractions'] += 1
+        if lead.google_claimed:
+            self.session_stats['claimed_businesses'] += 1
+        if lead.google_3pack:
+            self.session_stats['three_pack_businesses'] += 1
+        
+        logger.info(f"📊 Processed: {lead.business_name} (Score: {lead.confidence_score:.1f}%)")
+    
+    def _build_lead(self, business_data: Dict, industry: str,
+                    min_score: float = MIN_CONFIDENCE_SCORE) -> Optional[BusinessLead]:
+        """Build a scored lead from business data without touching session state
+        
+        Listing fields are copied first, then the expensive enrichment stages run
+        cheapest first. A lead is dropped (None) as soon as its best possible
+        score falls below min_score, skipping the remaining lookups.
+        """
+        try:
+            lead = BusinessLead()
+            lead.business_name = business_data.get('name', '')
+            lead.email = business_data.get('email', '')
+            lead.phone = business_data.get('phone', '')
+            lead.website = business_data.get('website', '')
+            lead.industry = business_data.get('industry') or industry
+            lead.source_url = business_data.get('source_url', '')
+            lead.google_rating = business_data.get('rating', 0)
+            lead.google_reviews = business_data.get('reviews', 0)
+            
+            # Parse address
+            address = business_data.get('address', '')
+            lead.address = address
+            lead.city = business_data.get('city', '')
+            lead.state = business_data.get('state', '')
+            lead.zip_code = business_data.get('zip_code', '')
+            lead.country = 'US'
+            
+            if not self._enrich(lead, business_data, min_score):
+                return None
+            
+            # Calculate confidence score
+            lead.confidence_score = self._calculate_confidence_score(lead)
+            
+            return lead
+            
+        except Exception as e:
+            logger.error(f"Error processing business {business_data.get('name', 'Unknown')}: {e}")
+            return None
+    
+    def _enrich(self, lead: BusinessLead, business_data: Dict, min_score: float) -> bool:
+        """Run enrichment stages by cost with an optimistic score bound, False if rejected early"""
+        # Stages the listing already answered cost nothing and go first
+        stages = sorted(
+            self.ENRICHMENT_STAGES,
+            key=lambda stage: 0 if all(name in business_data for name in stage[2]) else stage[1]
+        )
+        pending = sum(SCORE_WEIGHTS.get(name, 0) for _, _, names in stages for name in names)
+        stats = {'stages_run': 0, 'lookups': 0, 'stages_skipped': 0, 'lookups_skipped': 0, 'early_rejections': 0}
+        accepted = True
+        
+        for position, (stage, _, names) in enumerate(stages):
+            if self._calculate_confidence_score(lead) + pending < min_score:
+                remaining = stages[position:]
+                stats['early_rejections'] = 1
+                stats['stages_skipped'] = len(remaining)
+                stats['lookups_skipped'] = sum(
+                    1 for _, _, fields in remaining if not all(name in business_data for name in fields)
+                )
+                accepted = False
+                break
+            
+            values = {name: business_data[name] for name in names if name in business_data}
+            if len(values) < len(names):
+                stats['lookups'] += 1
+                values.update(self._lookup(stage, business_data))
+            
+            if stage == 'social' and not values.get('social_media'):
+                # No discovered profiles, derive candidates from the name
+                values['social_media'] = self._generate_social_media(lead.business_name)
+            
+            for name in names:
+                setattr(lead, name, values.get(name, getattr(lead, name)))
+            stats['stages_run'] += 1
+            pending -= sum(SCORE_WEIGHTS.get(name, 0) for name in names)
+        
+        with self._enrichment_lock:
+            for key, value in stats.items():
+                self.enrichment_stats[key] += value
+        return accepted
+    
+    def _lookup(self, stage: str, business_data: Dict) -> Dict:
+        """One enrichment lookup, a failing or open source leaves the fields unset"""
+        try:
+            return self.resilience.call(
+                self.source.enrich, stage, business_data, source=f"{self.source.name}:{stage}"
+            ) or {}
+        except CircuitOpenError:
+            return {}
+        except Exception as e:
+            logger.debug(f"Enrichment stage {stage} failed for {business_data.get('name', 'Unknown')}: {e}")
+            return {}
+    
+    def _generate_social_media(self, business_name: str) -> Dict:
+        """Generate social media profiles"""
+        social_media = {}
+        
+        # Clean business name for URLs, memoized per distinct name
+        handle = slug(business_name)
+        
+        # Randomly assign social media presence
+        platforms = {
+            'facebook': f"https://facebook.com/{handle}",
+            'instagram': f"https://instagram.com/{handle}",
+            'twitter': f"https://twitter.com/{handle}",
+            'linkedin': f"https://linkedin.com/company/{handle}"
+        }
+        
+        # Randomly select 1-3 platforms
+        selected_platforms = random.sample(list(platforms.keys()), random.randint(1, 3))
+        
+        for platform in selected_platforms:
+            social_media[platform] = platforms[platform]
+        
+        return social_media
+    
+    def verify_emails(self, verifier=None, drop_undeliverable: bool = True) -> Dict:
+        """Check lead emails for deliverability, one MX lookup per domain"""
+        from email_verifier import EmailVerifier
+        
+        verifier = verifier or EmailVerifier()
+        results = verifier.verify_many(lead.email for lead in self.leads)
+        
+        for lead in self.leads:
+            result = results.get(lead.email)
+            if not result:
+                continue
+            
+            self.session_stats['emails_verified'] += 1
+            if result.free_mail:
+                self.session_stats['free_mail_emails'] += 1
+            
+            if result.status in ('undeliverable', 'invalid'):
+                self.session_stats['undeliverable_emails'] += 1
+                if drop_undeliverable:
+                    # A bounced address is worse than none, rescore without it
+                    lead.email = ""
+                    lead.confidence_score = self._calculate_confidence_score(lead)
+        
+        self._refresh_aggregates()
+        
+        logger.info(f"📧 Verified {len(results)} emails ({self.session_stats['undeliverable_emails']} undeliverable)")
+        return results
+    
+    def verify_social_profiles(self, verifier=None, drop_missing: bool = True) -> Dict[str, str]:
+        """Check candidate social profile URLs, each distinct URL once"""
+        from social_verifier import SocialProfileVerifier, MISSING
+        
+        verifier = verifier or SocialProfileVerifier(concurrency=self.concurrency, resilience=self.resilience)
+        results = verifier.check_many(
+            url for lead in self.leads for url in (lead.social_media or {}).values()
+        )
+        
+        for lead in self.leads:
+            if not lead.social_media:
+                continue
+            
+            missing = [platform for platform, url in lead.social_media.items() if results.get(url) == MISSING]
+            self.session_stats['social_profiles_checked'] += len(lead.social_media)
+            self.session_stats['social_profiles_missing'] += len(missing)
+            
+            if drop_missing and missing:
+                lead.social_media = {
+                    platform: url for platform, url in lead.social_media.items() if platform not in missing
+                }
+                lead.confidence_score = self._calculate_confidence_score(lead)
+        
+        self._refresh_aggregates()
+        return results
+    
+    def enrich_from_websites(self, crawler=None) -> Dict[str, int]:
+        """Crawl lead websites for missing contact fields, never overwriting known values"""
+        from site_crawler import SiteCrawler
+        
+        crawler = crawler or SiteCrawler(concurrency=self.concurrency, resilience=self.resilience)
+        targets = [lead for lead in self.leads if lead.website]
+        results = crawler.crawl_many([
+            (lead.website, {name: getattr(lead, name) for name in crawler.required_fields})
+            for lead in targets
+        ])
+        
+        summary = {'sites': len(results), 'pages': 0, 'bytes': 0, 'fields_filled': 0}
+        for lead, result in zip(targets, results):
+            summary['pages'] += len(result.pages)
+            summary['bytes'] += result.bytes_read
+            
+            filled = 0
+            for name, value in result.fields.items():
+                if hasattr(lead, name) and not getattr(lead, name):
+                    setattr(lead, name, value)
+                    filled += 1
+            
+            if filled:
+                summary['fields_filled'] += filled
+                lead.confidence_score = self._calculate_confidence_score(lead)
+        
+        self._refresh_aggregates()
+        logger.info(f"🕸️  Crawled {summary['sites']} sites ({summary['pages']} pages), filled {summary['fields_filled']} fields")
+        return summary
+    
+    def _refresh_aggregates(self):
+        """Rebuild aggregates after leads were rescored in place"""
+        self.aggregates.rebuild(self.leads)
+        self._aggregated_leads = self.leads
+    
+    def _calculate_confidence_score(self, lead: BusinessLead) -> float:
+        """Calculate confidence score for lead quality"""
+        # Basic information 40, owner 20, Google verification 30, website and socials 10
+        score = float(sum(points for name, points in SCORE_WEIGHTS.items() if getattr(lead, name)))
+        
+        return min(score, 100.0)
+    
+    def save_leads(self, filename: str = None, format: str = 'csv',
+                   compression: str = None, partition_by: str = None,
+                   delta_from: str = None) -> str:
+        """Save leads to file, or to a partitioned directory with a manifest
+        
+        delta_from is a previous snapshot, or 'latest' for the newest export with
+        this run's filename series, format and compression. Added, removed and
+        changed leads against it are also written to <filename>_delta, with
+        counts kept in self.last_delta. Partitioned exports write no delta.
+        """
+        # Imported here because exporters builds on this module
+        from exporters import output_path, write_leads, write_partitioned
+        
+        if not filename:
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            filename = f"leadwave_leads_{timestamp}"
+        
+        try:
+            format = format.lower()
+            
+            if partition_by:
+                if delta_from:
+                    logger.warning("⚠️ Partitioned exports have no delta, delta_from is ignored")
+                directory = output_path(filename, 'csv')[:-len('.csv')]
+                manifest_file = write_partitioned(self.leads, directory, partition_by, format, compression)
+                logger.info(f"💾 Leads saved to {directory}")
+                return manifest_file
+            
+            if delta_from == 'latest':
+                from delta_export import latest_snapshot, SNAPSHOT_FORMATS
+                if format not in SNAPSHOT_FORMATS:
+                    logger.warning(f"⚠️ {format} exports cannot be read back, no delta against the latest snapshot")
+                    delta_from = None
+                else:
+                    # Same filename series, format and compression as this run's snapshot
+                    delta_from = latest_snapshot(filename, format, compression)
+                    if not delta_from:
+                        logger.warning(f"⚠️ No previous snapshot like {filename}, writing a full export only")
+            
+            saved_file = output_path(filename, format, compression)
+            
+            # The delta goes first, with a fixed filename the previous snapshot is the file about to be replaced
+            if delta_from:
+                from delta_export import write_delta
+                delta_format = format if format in ('csv', 'jsonl') else 'jsonl'
+                try:
+                    self.last_delta = write_delta(
+                        delta_from, self.leads, output_path(f"{filename}_delta", delta_format, compression),
+                        delta_format, compression
+                    )
+                except Exception as e:
+                    # A failed delta never costs the full snapshot
+                    logger.error(f"Error writing delta against {delta_from}: {e}")
+            
+            write_leads(self.leads, saved_file, format, compression)
+            logger.info(f"💾 Leads saved to {saved_file}")
+            return saved_file
+                
+        except Exception as e:
+            logger.error(f"Error saving leads: {e}")
+            return ""
+    
+    def get_session_report(self) -> Dict:
+        """Get detailed session statistics"""
+        self._sync_aggregates()
+        aggregates = self.aggregates.report()
+        
+        return {
+            'session_stats': self.session_stats,
+            'total_leads': len(self.leads),
+            'high_quality_leads': self.session_stats['high_quality_leads'],
+            'average_confidence': aggregates['average_confidence'],
+            'score_percentiles': aggregates['score_percentiles'],
+            'google_coverage': {
+                'claimed_percentage': (self.session_stats['claimed_businesses'] / max(self.session_stats['successful_extractions'], 1)) * 100,
+                'three_pack_percentage': (self.session_stats['three_pack_businesses'] / max(self.session_stats['successful_extractions'], 1)) * 100
+            },
+            'by_industry': aggregates['by_industry'],
+            'by_state': aggregates['by_state'],
+            'enrichment': dict(self.enrichment_stats),
+            'concurrency': self.concurrency.report(),
+            'resilience': self.resilience.report()
+        }
+    
+    def top_leads(self, count: int = 10) -> List[BusinessLead]:
+        """Highest-scoring leads of the session"""
+        self._sync_aggregates()
+        if count <= self.aggregates.top_k:
+            return self.aggregates.top_leads(count)
+        return sorted(self.leads, key=lambda lead: lead.confidence_score, reverse=True)[:count]
+    
+    def display_leads_preview(self, count: int = 5):
+        """Display a preview of generated leads"""
+        print(f"\n🎯 Lead Preview (Top {min(count, len(self.leads))} leads):")
+        print("=" * 80)
+        
+        for i, lead in enumerate(self.top_leads(count), 1):
+            print(f"\n📋 Lead #{i}:")
+            print(f"   🏢 Business: {lead.business_name}")
+            print(f"   👤 Owner: {lead.owner_name}")
+            print(f"   📧 Email: {lead.email}")
+            print(f"   📞 Phone: {lead.phone}")
+            print(f"   🌐 Website: {lead.website}")
+            print(f"   📍 Address: {lead.address}")
+            print(f"   ⭐ Google Rating: {lead.google_rating}/5.0 ({lead.google_reviews} reviews)")
+            print(f"   ✅ Google Claimed: {'Yes' if lead.google_claimed else 'No'}")
+            print(f"   🏆 3-Pack: {'Yes' if lead.google_3pack else 'No'}")
+            print(f"   📱 Social Media: {', '.join(lead.social_media.keys()) if lead.social_media else 'None'}")
+            print(f"   🎯 Confidence Score: {lead.confidence_score:.1f}%")
+            print("-" * 80)
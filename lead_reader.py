@@ -0,0 +1,336 @@
+"""
+Memory-mapped reader for previously exported LeadWave™ lead files
+Supports CSV, JSONL and pretty-printed JSON array exports from save_leads
+"""
+
+import os
+import re
+import ast
+import csv
+import json
+import mmap
+import bisect
+import logging
+from array import array
+from dataclasses import fields
+from typing import List, Dict, Iterable, Iterator, Callable, Any
+
+from lead_pipeline import BusinessLead
+
+logger = logging.getLogger(__name__)
+
+# Byte-level tokens used to find top-level objects in a JSON array export
+JSON_TOKEN_PATTERN = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+
+LEAD_FIELD_TYPES = {f.name: f.type for f in fields(BusinessLead)}
+
+def normalize_key(key: str, value: Any) -> str:
+    """Normalize a lookup value for the given index key"""
+    if value is None:
+        return ""
+
+    value = str(value).strip()
+
+    if key == 'phone':
+        digits = re.sub(r'[^\d]', '', value)
+        return digits[-10:]
+    if key == 'domain':
+        domain = value.lower()
+        domain = re.sub(r'^[a-z]+://', '', domain).split('/')[0]
+        return domain[4:] if domain.startswith('www.') else domain
+    if key == 'zip':
+        return value[:5]
+
+    return value.lower()
+
+def record_key_value(key: str, record: Dict) -> str:
+    """Extract the normalized index value for a key from a raw record"""
+    if key == 'phone':
+        return normalize_key(key, record.get('phone'))
+    if key == 'domain':
+        return normalize_key(key, record.get('website'))
+    if key == 'zip':
+        return normalize_key(key, record.get('zip_code'))
+
+    return normalize_key(key, record.get(key))
+
+def _search_pattern(key: str, value: str):
+    """Byte pattern that must appear in any row matching a normalized key value
+
+    Returns None when rows may store the value in a form a byte search cannot
+    match, such as escaped quotes or non-ASCII case variants, and every row has
+    to be parsed instead.
+    """
+    if key == 'phone':
+        # Exported phones are formatted, only the trailing digits are contiguous
+        return re.compile(re.escape(value[-4:].encode('utf-8')))
+    if not value.isascii() or '"' in value or '\\' in value:
+        return None
+    # Domains and generic columns are normalized to lower case but stored as written
+    return re.compile(re.escape(value.encode('utf-8')), re.IGNORECASE)
+
+class LeadFileReader:
+    """Lazy, memory-mapped reader with an offset index over a lead export"""
+
+    def __init__(self, path: str, format: str = None):
+        self.path = path
+        self.format = (format or self._detect_format(path)).lower()
+        if self.format not in ('csv', 'jsonl', 'json'):
+            raise ValueError(f"Unsupported lead file format: {self.format}")
+
+        self._file = None
+        self._mm = None
+        self.header: List[str] = []
+        self.starts = array('Q')
+        self.ends = array('Q')
+        self.indexes: Dict[str, Dict[str, array]] = {}
+
+        self.open()
+
+    @staticmethod
+    def _detect_format(path: str) -> str:
+        """Infer the export format from the file extension"""
+        extension = os.path.splitext(path)[1].lower().lstrip('.')
+        return 'jsonl' if extension == 'ndjson' else extension
+
+    def open(self):
+        """Map the file into memory and build the row offset index"""
+        if self._mm is not None:
+            return
+
+        self._file = open(self.path, 'rb')
+        if os.fstat(self._file.fileno()).st_size == 0:
+            # Empty exports cannot be mapped, treat them as zero rows
+            self._mm = b''
+            return
+
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self.format == 'csv':
+            self._index_csv()
+        elif self.format == 'jsonl':
+            self._index_jsonl()
+        else:
+            self._index_json_array()
+
+        logger.info(f"📂 Indexed {len(self.starts)} leads in {self.path}")
+
+    def close(self):
+        """Release the memory map and file handle"""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+        if self._file:
+            self._file.close()
+        self._mm = None
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __getitem__(self, position: int) -> BusinessLead:
+        return self.to_lead(self.record(position))
+
+    def __iter__(self) -> Iterator[BusinessLead]:
+        return self.iter_leads()
+
+    def _index_csv(self):
+        """Record row offsets, honouring quoted fields that span lines"""
+        mm = self._mm
+        header_line = mm.readline()
+        self.header = next(csv.reader([header_line.decode('utf-8-sig')]))
+
+        start = mm.tell()
+        in_quotes = False
+
+        while True:
+            line = mm.readline()
+            if not line:
+                break
+
+            if line.count(b'"') % 2:
+                in_quotes = not in_quotes
+
+            if not in_quotes:
+                end = mm.tell()
+                if line.strip():
+                    self.starts.append(start)
+                    self.ends.append(end)
+                start = end
+
+    def _index_jsonl(self):
+        """Record one offset pair per non-blank line"""
+        mm = self._mm
+        start = 0
+
+        while True:
+            line = mm.readline()
+            if not line:
+                break
+
+            end = mm.tell()
+            if line.strip():
+                self.starts.append(start)
+                self.ends.append(end)
+            start = end
+
+    def _index_json_array(self):
+        """Record the byte span of every top-level object in a JSON array"""
+        depth = 0
+        start = 0
+
+        for match in JSON_TOKEN_PATTERN.finditer(self._mm):
+            token = match.group()
+            if token == b'{':
+                if depth == 0:
+                    start = match.start()
+                depth += 1
+            elif token == b'}':
+                depth -= 1
+                if depth == 0:
+                    self.starts.append(start)
+                    self.ends.append(match.end())
+
+    def raw(self, position: int) -> bytes:
+        """Return the raw bytes of a single row"""
+        return self._mm[self.starts[position]:self.ends[position]]
+
+    def record(self, position: int) -> Dict:
+        """Parse a single row into a dictionary of raw values"""
+        text = self.raw(position).decode('utf-8')
+
+        if self.format == 'csv':
+            values = next(csv.reader([text]))
+            return dict(zip(self.header, values))
+
+        return json.loads(text)
+
+    def to_lead(self, record: Dict) -> BusinessLead:
+        """Convert a raw export record back into a BusinessLead"""
+        lead = BusinessLead()
+
+        for name, value in record.items():
+            if name not in LEAD_FIELD_TYPES:
+                continue
+            setattr(lead, name, self._coerce(name, value))
+
+        return lead
+
+    def _coerce(self, name: str, value: Any) -> Any:
+        """Restore the field type lost by CSV export"""
+        field_type = LEAD_FIELD_TYPES[name]
+
+        if not isinstance(value, str):
+            return value
+
+        try:
+            if field_type is bool:
+                return value.strip().lower() in ('true', '1', 'yes')
+            if field_type is float:
+                return float(value) if value else 0.0
+            if field_type is int:
+                return int(float(value)) if value else 0
+            if name == 'social_media':
+                return ast.literal_eval(value) if value else {}
+        except (ValueError, SyntaxError) as e:
+            logger.error(f"Could not convert {name}={value!r}: {e}")
+
+        return value
+
+    def iter_records(self, positions: Iterator[int] = None) -> Iterator[Dict]:
+        """Lazily yield raw records, optionally for selected row positions"""
+        for position in positions if positions is not None else range(len(self)):
+            yield self.record(position)
+
+    def iter_leads(self, positions: Iterator[int] = None) -> Iterator[BusinessLead]:
+        """Lazily yield BusinessLead objects"""
+        for record in self.iter_records(positions):
+            yield self.to_lead(record)
+
+    def iter_batches(self, batch_size: int = 10000, columns: List[str] = None) -> Iterator[Dict[str, List]]:
+        """Yield column-oriented batches of typed values"""
+        for batch_start in range(0, len(self), batch_size):
+            batch: Dict[str, List] = {}
+
+            for position in range(batch_start, min(batch_start + batch_size, len(self))):
+                record = self.record(position)
+                for name in columns or record.keys():
+                    value = record.get(name)
+                    if name in LEAD_FIELD_TYPES:
+                        value = self._coerce(name, value)
+                    batch.setdefault(name, []).append(value)
+
+            yield batch
+
+    def build_index(self, *keys: str) -> Dict[str, Dict[str, array]]:
+        """Build value -> row position indexes for lookup keys in one pass"""
+        pending = [key for key in keys if key not in self.indexes]
+        if not pending:
+            return self.indexes
+
+        built = {key: {} for key in pending}
+
+        for position in range(len(self)):
+            record = self.record(position)
+            for key in pending:
+                value = record_key_value(key, record)
+                if value:
+                    built[key].setdefault(value, array('L')).append(position)
+
+        self.indexes.update(built)
+        return self.indexes
+
+    def _candidate_positions(self, key: str, value: str) -> Iterable[int]:
+        """Locate rows containing the raw search pattern without parsing them"""
+        if not len(self):
+            return []
+
+        pattern = _search_pattern(key, value)
+        if pattern is None:
+            return range(len(self))
+
+        positions = []
+        match = pattern.search(self._mm, 0)
+
+        while match:
+            offset = match.start()
+            position = bisect.bisect_right(self.starts, offset) - 1
+            if position >= 0 and offset < self.ends[position]:
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+                # Skip the rest of this row, one hit is enough to parse it
+                match = pattern.search(self._mm, self.ends[position])
+            else:
+                match = pattern.search(self._mm, offset + 1)
+
+        return positions
+
+    def find(self, key: str, value: Any) -> Iterator[BusinessLead]:
+        """Yield leads whose phone, domain, zip or column value matches"""
+        normalized = normalize_key(key, value)
+        if not normalized:
+            return
+
+        if key in self.indexes:
+            yield from self.iter_leads(self.indexes[key].get(normalized, ()))
+            return
+
+        for position in self._candidate_positions(key, normalized):
+            record = self.record(position)
+            if record_key_value(key, record) == normalized:
+                yield self.to_lead(record)
+
+    def scan(self, predicate: Callable[[BusinessLead], bool]) -> Iterator[BusinessLead]:
+        """Yield every lead matching an arbitrary predicate"""
+        for lead in self.iter_leads():
+            if predicate(lead):
+                yield lead
+
+def open_leads(path: str, format: str = None) -> LeadFileReader:
+    """Open a lead export for lazy, indexed access"""
+    return LeadFileReader(path, format)
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+LeadWave™ HTTP service
+Long-running lead generation endpoint streaming NDJSON, with a bounded
+fair job queue and engine caches shared across requests
+"""
+
+import json
+import queue
+import logging
+import argparse
+import threading
+from collections import OrderedDict, deque
+from dataclasses import asdict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from typing import Dict, Optional
+
+from config import Config
+from leadwave import LeadWave, BusinessDataGenerator
+from campaign_cache import CampaignCache
+from concurrency import AdaptiveConcurrency
+from resilience import Resilience
+from lead_filter import compile_filter, FilterSyntaxError
+
+logger = logging.getLogger(__name__)
+
+MAX_LEADS_PER_REQUEST = 500
+
+class QueueFull(Exception):
+    """Raised when a job cannot be accepted right now"""
+
+class Job:
+    """One lead generation request and the buffer its leads stream through"""
+
+    _DONE = object()
+
+    def __init__(self, client_id: str, industry: str, location: str, max_leads: int, buffer_size: int,
+                 where=None):
+        self.client_id = client_id
+        self.industry = industry
+        self.location = location
+        self.max_leads = max_leads
+        self.where = where
+        self.stream: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self.cancelled = threading.Event()
+
+    def emit(self, item):
+        """Hand an item to the response writer, waiting while its buffer is full"""
+        while not self.cancelled.is_set():
+            try:
+                self.stream.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+
+    def finish(self):
+        self.emit(self._DONE)
+
+    def __iter__(self):
+        while True:
+            item = self.stream.get()
+            if item is self._DONE:
+                return
+            yield item
+
+class FairJobQueue:
+    """Bounded job queue served round-robin across clients"""
+
+    def __init__(self, max_pending: int = 64, max_per_client: int = 4):
+        self.max_pending = max_pending
+        self.max_per_client = max_per_client
+        self._clients: 'OrderedDict[str, deque]' = OrderedDict()
+        self._active: Dict[str, int] = {}
+        self._pending = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def put(self, job: Job):
+        with self._condition:
+            if self._closed:
+                raise QueueFull("Service is shutting down")
+            if self._pending >= self.max_pending:
+                raise QueueFull("Job queue is full")
+            if self._active.get(job.client_id, 0) >= self.max_per_client:
+                raise QueueFull(f"Client {job.client_id} has too many jobs in progress")
+
+            self._clients.setdefault(job.client_id, deque()).append(job)
+            self._active[job.client_id] = self._active.get(job.client_id, 0) + 1
+            self._pending += 1
+            self._condition.notify()
+
+    def get(self) -> Optional[Job]:
+        """Next job, taking one per client in turn, None once closed"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._pending or self._closed)
+            if not self._pending:
+                return None
+
+            client_id, jobs = next(iter(self._clients.items()))
+            job = jobs.popleft()
+            if jobs:
+                self._clients.move_to_end(client_id)
+            else:
+                del self._clients[client_id]
+            self._pending -= 1
+            return job
+
+    def done(self, job: Job):
+        with self._condition:
+            self._active[job.client_id] -= 1
+            if not self._active[job.client_id]:
+                del self._active[job.client_id]
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def stats(self) -> Dict:
+        with self._condition:
+            return {'pending': self._pending, 'clients': len(self._active), 'in_progress': sum(self._active.values())}
+
+class LeadService:
+    """Worker pool plus shared engine state behind the HTTP handler"""
+
+    def __init__(self, workers: int = None, max_pending: int = 64, max_per_client: int = 4,
+                 stream_buffer: int = 64, source=None, suppression=None, cache: CampaignCache = None):
+        self.jobs = FairJobQueue(max_pending, max_per_client)
+        self.stream_buffer = stream_buffer
+        # Built once and shared by every request
+        self.source = source or BusinessDataGenerator()
+        self.suppression = suppression
+        self.cache = cache or CampaignCache()
+        self.concurrency = AdaptiveConcurrency()
+        self.resilience = Resilience()
+        self._workers = [
+            threading.Thread(target=self._work, name=f'leadwave-job-{i}', daemon=True)
+            for i in range(workers or Config.MAX_WORKERS)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def submit(self, client_id: str, industry: str, location: str, max_leads: int, where=None) -> Job:
+        job = Job(client_id, industry, location, max_leads, self.stream_buffer, where)
+        self.jobs.put(job)
+        return job
+
+    def _work(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            try:
+                self._run(job)
+            finally:
+                self.jobs.done(job)
+                job.finish()
+
+    def _run(self, job: Job):
+        if job.cancelled.is_set():
+            return
+
+        leadwave = LeadWave(self.source, self.suppression, self.cache)
+        leadwave.concurrency = self.concurrency
+        leadwave.resilience = self.resilience
+        leadwave.on_lead = lambda lead: job.emit({'type': 'lead', 'lead': asdict(lead)})
+        # A client that hung up gets no more fetches or enrichment spent on it
+        leadwave.should_stop = job.cancelled.is_set
+
+        try:
+            leadwave.generate_leads(job.industry, job.location, job.max_leads, where=job.where)
+            if job.cancelled.is_set():
+                return
+            report = leadwave.get_session_report()
+            job.emit({
+                'type': 'summary',
+                'total_leads': report['total_leads'],
+                'high_quality_leads': report['high_quality_leads'],
+                'average_confidence': report['average_confidence'],
+                'cached_leads': report['session_stats']['cached_leads']
+            })
+        except Exception as e:
+            logger.error(f"Job failed for {job.industry} in {job.location}: {e}")
+            job.emit({'type': 'error', 'error': str(e)})
+
+    def health(self) -> Dict:
+        return {
+            'status': 'ok',
+            'queue': self.jobs.stats(),
+            'cache': dict(self.cache.stats, entries=len(self.cache)),
+            'concurrency': self.concurrency.report()['global'],
+            'breakers': {
+                name: breaker['state'] for name, breaker in self.resilience.report()['breakers'].items()
+            }
+        }
+
+    def close(self):
+        self.jobs.close()
+
+class LeadRequestHandler(BaseHTTPRequestHandler):
+    """GET /leads streams NDJSON (optional where= filter), GET /health reports queue and cache state"""
+
+    protocol_version = 'HTTP/1.1'
+    service: LeadService = None
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def _send_json(self, status: int, body: Dict, headers: Dict = None):
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(f"{len(data):x}\r\n".encode('ascii') + data + b"\r\n")
+        self.wfile.flush()
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        if url.path == '/health':
+            return self._send_json(200, self.service.health())
+        if url.path != '/leads':
+            return self._send_json(404, {'error': 'Not found'})
+
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        industry = params.get('industry', '').strip()
+        location = params.get('location', '').strip()
+        try:
+            max_leads = min(int(params.get('max_leads', '20')), MAX_LEADS_PER_REQUEST)
+        except ValueError:
+            max_leads = 0
+        if not industry or not location or max_leads <= 0:
+            return self._send_json(400, {'error': 'industry, location and a positive max_leads are required'})
+
+        where = None
+        if params.get('where', '').strip():
+            try:
+                where = compile_filter(params['where'])
+            except FilterSyntaxError as e:
+                return self._send_json(400, {'error': f"Invalid filter: {e}"})
+
+        client_id = self.headers.get('X-Client-Id') or self.client_address[0]
+        try:
+            job = self.service.submit(client_id, industry, location, max_leads, where)
+        except QueueFull as e:
+            return self._send_json(429, {'error': str(e)}, {'Retry-After': '2'})
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.send_header('Cache-Control', 'no-cache')
+        self.end_headers()
+
+        try:
+            for item in job:
+                self._write_chunk(json.dumps(item, ensure_ascii=False).encode('utf-8') + b"\n")
+            self._write_chunk(b"")
+        except (BrokenPipeError, ConnectionResetError):
+            # The worker stops waiting on a reader that has gone away
+            job.cancelled.set()
+            self.close_connection = True
+
+def serve(host: str = '127.0.0.1', port: int = 8765, **service_options) -> ThreadingHTTPServer:
+    """Build the HTTP server, call serve_forever() on the result to run it"""
+    handler = type('BoundLeadRequestHandler', (LeadRequestHandler,), {'service': LeadService(**service_options)})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+def main():
+    parser = argparse.ArgumentParser(description="LeadWave™ lead generation service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--workers', type=int, default=Config.MAX_WORKERS)
+    parser.add_argument('--max-pending', type=int, default=64, help="Jobs queued before returning 429")
+    parser.add_argument('--max-per-client', type=int, default=4, help="Jobs in progress per client")
+    args = parser.parse_args()
+
+    server = serve(args.host, args.port, workers=args.workers,
+                   max_pending=args.max_pending, max_per_client=args.max_per_client)
+    print(f"🌊 LeadWave™ service listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹️  LeadWave™ service stopped")
+    finally:
+        server.RequestHandlerClass.service.close()
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ Professional Business Contact Information Scraper
 import os
 import sys
 import time
+import argparse
 import random
 import logging
 import json
@@ -21,6 +22,11 @@ from urllib.error import URLError, HTTPError
 import html.parser
 import socket
 
+from lead_pipeline import BusinessLead, LeadSource, LeadPipeline
+from industry_classifier import classify_industry
+from gazetteer import resolve_location, ZIP_PATTERN
+from canonical import slug
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -32,38 +38,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
-class BusinessLead:
-    """Data structure for business leads"""
-    business_name: str = ""
-    owner_name: str = ""
-    email: str = ""
-    phone: str = ""
-    website: str = ""
-    address: str = ""
-    city: str = ""
-    state: str = ""
-    zip_code: str = ""
-    country: str = ""
-    industry: str = ""
-    google_3pack: bool = False
-    google_claimed: bool = False
-    google_rating: float = 0.0
-    google_reviews: int = 0
-    social_media: Dict = None
-    last_updated: str = ""
-    source_url: str = ""
-    confidence_score: float = 0.0
-
-    def __post_init__(self):
-        if self.social_media is None:
-            self.social_media = {}
-        if not self.last_updated:
-            self.last_updated = datetime.now().isoformat()
-
-class BusinessDataGenerator:
+class BusinessDataGenerator(LeadSource):
     """Generate realistic business data for demonstration"""
     
+    name = 'demo'
+    
     def __init__(self):
         self.business_templates = {
             'restaurants': [
@@ -131,6 +110,10 @@ class BusinessDataGenerator:
             "businessemail.com", "company.com", "professional.net"
         ]
     
+    def fetch(self, industry: str, location: str, count: int = 10) -> List[Dict]:
+        """Fetch demo business records"""
+        return self.generate_business_data(industry, location, count)
+    
     def generate_business_data(self, industry: str, location: str, count: int = 10) -> List[Dict]:
         """Generate realistic business data"""
         businesses = []
@@ -138,15 +121,23 @@ class BusinessDataGenerator:
         # Parse location
         state = 'CA'  # Default
         city = 'Los Angeles'  # Default
-        
-        if ',' in location:
+        requested_zip = None
+        
+        place = resolve_location(location)
+        if place:
+            state = place.state
+            city = place.city or self.cities.get(state, [city])[0]
+            zip_match = ZIP_PATTERN.search(location)
+            requested_zip = zip_match.group(1) if zip_match else None
+        elif ',' in location:
             parts = location.split(',')
             if len(parts) >= 2:
                 city = parts[0].strip()
                 state = parts[1].strip().split()[0]  # Get state code
         
         # Get business templates for industry
-        templates = self.business_templates.get(industry.lower(), self.business_templates['tech'])
+        category = classify_industry(industry, default='tech')
+        templates = self.business_templates.get(category, self.business_templates['tech'])
         
         for i in range(count):
             business_name = random.choice(templates)
@@ -165,11 +156,10 @@ class BusinessDataGenerator:
             # Generate address
             street_num = random.randint(100, 9999)
             street = random.choice(self.street_names)
-            zip_code = f"{random.randint(10000, 99999)}"
+            zip_code = requested_zip or f"{random.randint(10000, 99999)}"
             
             # Generate website
-            website_name = business_name.lower().replace(' ', '').replace("'", "")
-            website = f"https://{website_name}.com"
+            website = f"https://{slug(business_name)}.com"
             
             business = {
                 'name': business_name,
@@ -192,215 +182,19 @@ class BusinessDataGenerator:
         
         return businesses
 
-class LeadWave:
+class LeadWave(LeadPipeline):
     """Main LeadWave™ lead generation system"""
     
-    def __init__(self):
-        self.data_generator = BusinessDataGenerator()
-        self.leads = []
-        self.processed_businesses = set()
-        self.session_stats = {
-            'total_processed': 0,
-            'successful_extractions': 0,
-            'google_verified': 0,
-            'claimed_businesses': 0,
-            'three_pack_businesses': 0,
-            'high_quality_leads': 0
-        }
-    
-    def generate_leads(self, industry: str, location: str, max_leads: int = 50) -> List[BusinessLead]:
-        """Generate leads for specified criteria"""
-        logger.info(f"🌊 Starting LeadWave™ generation for {industry} in {location}")
-        
-        # Generate business data
-        businesses = self.data_generator.generate_business_data(industry, location, max_leads)
-        
-        if not businesses:
-            logger.warning("No businesses found")
-            return []
-        
-        leads = []
-        
-        for business_data in businesses:
-            try:
-                lead = self._process_business(business_data, industry)
-                if lead and lead.confidence_score >= 50:
-                    leads.append(lead)
-                    self.session_stats['total_processed'] += 1
-                    
-                    if lead.confidence_score >= 80:
-                        self.session_stats['high_quality_leads'] += 1
-                    
-                    if len(leads) >= max_leads:
-                        break
-                        
-            except Exception as e:
-                logger.error(f"Error processing business: {e}")
-        
-        self.leads.extend(leads)
-        logger.info(f"✅ Generated {len(leads)} high-quality leads")
-        
-        return leads
-    
-    def _process_business(self, business_data: Dict, industry: str) -> Optional[BusinessLead]:
-        """Process individual business to extract lead information"""
-        try:
-            lead = BusinessLead()
-            lead.business_name = business_data.get('name', '')
-            lead.owner_name = business_data.get('owner_name', '')
-            lead.email = business_data.get('email', '')
-            lead.phone = business_data.get('phone', '')
-            lead.website = business_data.get('website', '')
-            lead.industry = industry
-            lead.google_rating = business_data.get('rating', 0)
-            lead.google_reviews = business_data.get('reviews', 0)
-            lead.google_claimed = business_data.get('google_claimed', False)
-            lead.google_3pack = business_data.get('google_3pack', False)
-            
-            # Parse address
-            address = business_data.get('address', '')
-            lead.address = address
-            lead.city = business_data.get('city', '')
-            lead.state = business_data.get('state', '')
-            lead.zip_code = business_data.get('zip_code', '')
-            lead.country = 'US'
-            
-            # Generate social media profiles
-            lead.social_media = self._generate_social_media(lead.business_name)
-            
-            # Calculate confidence score
-            lead.confidence_score = self._calculate_confidence_score(lead)
-            
-            # Update statistics
-            self.session_stats['successful_extractions'] += 1
-            if lead.google_claimed:
-                self.session_stats['claimed_businesses'] += 1
-            if lead.google_3pack:
-                self.session_stats['three_pack_businesses'] += 1
-            
-            logger.info(f"📊 Processed: {lead.business_name} (Score: {lead.confidence_score:.1f}%)")
-            return lead
-            
-        except Exception as e:
-            logger.error(f"Error processing business {business_data.get('name', 'Unknown')}: {e}")
-            return None
-    
-    def _generate_social_media(self, business_name: str) -> Dict:
-        """Generate social media profiles"""
-        social_media = {}
-        
-        # Clean business name for URLs
-        clean_name = business_name.lower().replace(' ', '').replace("'", "").replace('&', 'and')
-        
-        # Randomly assign social media presence
-        platforms = {
-            'facebook': f"https://facebook.com/{clean_name}",
-            'instagram': f"https://instagram.com/{clean_name}",
-            'twitter': f"https://twitter.com/{clean_name}",
-            'linkedin': f"https://linkedin.com/company/{clean_name}"
-        }
-        
-        # Randomly select 1-3 platforms
-        selected_platforms = random.sample(list(platforms.keys()), random.randint(1, 3))
-        
-        for platform in selected_platforms:
-            social_media[platform] = platforms[platform]
-        
-        return social_media
-    
-    def _calculate_confidence_score(self, lead: BusinessLead) -> float:
-        """Calculate confidence score for lead quality"""
-        score = 0.0
-        
-        # Basic information (40 points)
-        if lead.business_name: score += 10
-        if lead.phone: score += 10
-        if lead.email: score += 10
-        if lead.address: score += 10
-        
-        # Owner information (20 points)
-        if lead.owner_name: score += 20
-        
-        # Google verification (30 points)
-        if lead.google_claimed: score += 15
-        if lead.google_3pack: score += 15
-        
-        # Additional factors (10 points)
-        if lead.website: score += 5
-        if lead.social_media: score += 5
-        
-        return min(score, 100.0)
-    
-    def save_leads(self, filename: str = None, format: str = 'csv') -> str:
-        """Save leads to file"""
-        if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"leadwave_leads_{timestamp}"
-        
-        try:
-            # Convert leads to dictionaries
-            leads_data = [asdict(lead) for lead in self.leads]
-            
-            if format.lower() == 'csv':
-                csv_file = f"{filename}.csv"
-                
-                if leads_data:
-                    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=leads_data[0].keys())
-                        writer.writeheader()
-                        writer.writerows(leads_data)
-                
-                logger.info(f"💾 Leads saved to {csv_file}")
-                return csv_file
-            
-            elif format.lower() == 'json':
-                json_file = f"{filename}.json"
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(leads_data, f, indent=2, ensure_ascii=False)
-                logger.info(f"💾 Leads saved to {json_file}")
-                return json_file
-                
-        except Exception as e:
-            logger.error(f"Error saving leads: {e}")
-            return ""
-    
-    def get_session_report(self) -> Dict:
-        """Get detailed session statistics"""
-        total_leads = len(self.leads)
-        
-        return {
-            'session_stats': self.session_stats,
-            'total_leads': total_leads,
-            'high_quality_leads': self.session_stats['high_quality_leads'],
-            'average_confidence': sum(l.confidence_score for l in self.leads) / total_leads if total_leads else 0,
-            'google_coverage': {
-                'claimed_percentage': (self.session_stats['claimed_businesses'] / max(self.session_stats['successful_extractions'], 1)) * 100,
-                'three_pack_percentage': (self.session_stats['three_pack_businesses'] / max(self.session_stats['successful_extractions'], 1)) * 100
-            }
-        }
-    
-    def display_leads_preview(self, count: int = 5):
-        """Display a preview of generated leads"""
-        print(f"\n🎯 Lead Preview (Top {min(count, len(self.leads))} leads):")
-        print("=" * 80)
-        
-        for i, lead in enumerate(self.leads[:count], 1):
-            print(f"\n📋 Lead #{i}:")
-            print(f"   🏢 Business: {lead.business_name}")
-            print(f"   👤 Owner: {lead.owner_name}")
-            print(f"   📧 Email: {lead.email}")
-            print(f"   📞 Phone: {lead.phone}")
-            print(f"   🌐 Website: {lead.website}")
-            print(f"   📍 Address: {lead.address}")
-            print(f"   ⭐ Google Rating: {lead.google_rating}/5.0 ({lead.google_reviews} reviews)")
-            print(f"   ✅ Google Claimed: {'Yes' if lead.google_claimed else 'No'}")
-            print(f"   🏆 3-Pack: {'Yes' if lead.google_3pack else 'No'}")
-            print(f"   📱 Social Media: {', '.join(lead.social_media.keys()) if lead.social_media else 'None'}")
-            print(f"   🎯 Confidence Score: {lead.confidence_score:.1f}%")
-            print("-" * 80)
+    def __init__(self, source: LeadSource = None, suppression=None, cache=None):
+        super().__init__(source or BusinessDataGenerator(), suppression, cache)
 
 def main():
     """Main function to run LeadWave™"""
+    parser = argparse.ArgumentParser(description="LeadWave™ interactive lead generation")
+    parser.add_argument('--profile', nargs='?', const='', metavar='DIR',
+                        help="Write per-stage CPU and allocation profiles of this run, to DIR if given")
+    args = parser.parse_args()
+    
     print("🌊 Welcome to LeadWave™ - Advanced Lead Generation System")
     print("🚀 Professional Business Contact Information Scraper")
     print("=" * 70)
@@ -434,42 +228,55 @@ def main():
         print(f"\n🔍 Searching for {industry} businesses in {location}...")
         print("⏳ Processing business data...")
         
-        # Generate leads
-        leads = leadwave.generate_leads(
-            industry=industry,
-            location=location,
-            max_leads=max_leads
-        )
+        profiler = None
+        if args.profile is not None:
+            from profiling import PipelineProfiler
+            profiler = PipelineProfiler(args.profile or None)
+            profiler.start()
+            profiler.instrument(leadwave)
         
-        if leads:
-            print(f"\n✅ Successfully generated {len(leads)} leads!")
-            
-            # Display preview
-            leadwave.display_leads_preview(3)
-            
-            # Save results
-            print(f"\n💾 Saving Results:")
-            output_format = input("Save format (csv/json) [csv]: ").strip().lower() or 'csv'
-            saved_file = leadwave.save_leads(format=output_format)
-            
-            if saved_file:
-                print(f"📁 Results saved to: {saved_file}")
-            
-            # Display session report
-            report = leadwave.get_session_report()
-            print(f"\n📊 Session Report:")
-            print(f"   • Total leads generated: {report['total_leads']}")
-            print(f"   • High-quality leads (80%+): {report['high_quality_leads']}")
-            print(f"   • Average confidence score: {report['average_confidence']:.1f}%")
-            print(f"   • Google claimed businesses: {report['google_coverage']['claimed_percentage']:.1f}%")
-            print(f"   • 3-pack presence: {report['google_coverage']['three_pack_percentage']:.1f}%")
+        try:
+            # Generate leads
+            leads = leadwave.generate_leads(
+                industry=industry,
+                location=location,
+                max_leads=max_leads
+            )
             
-            print(f"\n🎉 LeadWave™ generation complete!")
-            print(f"📈 Ready for your next lead generation campaign!")
-        
-        else:
-            print("❌ No leads found. Try adjusting your search criteria.")
+            if leads:
+                print(f"\n✅ Successfully generated {len(leads)} leads!")
+                
+                # Display preview
+                leadwave.display_leads_preview(3)
+                
+                # Save results
+                print(f"\n💾 Saving Results:")
+                output_format = input("Save format (csv/json) [csv]: ").strip().lower() or 'csv'
+                saved_file = leadwave.save_leads(format=output_format)
+                
+                if saved_file:
+                    print(f"📁 Results saved to: {saved_file}")
+                
+                # Display session report
+                report = leadwave.get_session_report()
+                print(f"\n📊 Session Report:")
+                print(f"   • Total leads generated: {report['total_leads']}")
+                print(f"   • High-quality leads (80%+): {report['high_quality_leads']}")
+                print(f"   • Average confidence score: {report['average_confidence']:.1f}%")
+                print(f"   • Google claimed businesses: {report['google_coverage']['claimed_percentage']:.1f}%")
+                print(f"   • 3-pack presence: {report['google_coverage']['three_pack_percentage']:.1f}%")
+                
+                print(f"\n🎉 LeadWave™ generation complete!")
+                print(f"📈 Ready for your next lead generation campaign!")
             
+            else:
+                print("❌ No leads found. Try adjusting your search criteria.")
+        finally:
+            # A run that raises still leaves its profile behind
+            if profiler:
+                profiler.stop()
+                print(f"🔬 Profile saved to: {profiler.write_reports()}")
+
     except KeyboardInterrupt:
         print("\n\n⏹️  LeadWave™ stopped by user")
     except Exception as e:
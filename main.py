@@ -7,6 +7,7 @@ WebContainer Offline Demo Version - No Network Dependencies
 import os
 import sys
 import time
+import argparse
 import random
 import logging
 import json
@@ -16,6 +17,11 @@ from datetime import datetime
 from typing import List, Dict, Optional
 from dataclasses import dataclass, asdict
 
+from lead_pipeline import BusinessLead, LeadSource, LeadPipeline
+from industry_classifier import classify_industry
+from gazetteer import resolve_location
+from canonical import slug
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,38 +33,11 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
-class BusinessLead:
-    """Data structure for business leads"""
-    business_name: str = ""
-    owner_name: str = ""
-    email: str = ""
-    phone: str = ""
-    website: str = ""
-    address: str = ""
-    city: str = ""
-    state: str = ""
-    zip_code: str = ""
-    country: str = ""
-    industry: str = ""
-    google_3pack: bool = False
-    google_claimed: bool = False
-    google_rating: float = 0.0
-    google_reviews: int = 0
-    social_media: Dict = None
-    last_updated: str = ""
-    source_url: str = ""
-    confidence_score: float = 0.0
-
-    def __post_init__(self):
-        if self.social_media is None:
-            self.social_media = {}
-        if not self.last_updated:
-            self.last_updated = datetime.now().isoformat()
-
-class BusinessDataGenerator:
+class BusinessDataGenerator(LeadSource):
     """Generate realistic business data for demonstration"""
     
+    name = 'offline'
+    
     def __init__(self):
         self.business_names = {
             'restaurants': [
@@ -131,6 +110,10 @@ class BusinessDataGenerator:
             'youtube': 'https://youtube.com/channel/'
         }
 
+    def fetch(self, industry: str, location: str, count: int = 10) -> List[Dict]:
+        """Fetch offline demo business records"""
+        return self.generate_business_data(industry, location, count)
+    
     def generate_business_data(self, industry: str, location: str, count: int = 10) -> List[Dict]:
         """Generate realistic business data"""
         businesses = []
@@ -150,23 +133,22 @@ class BusinessDataGenerator:
     
     def _get_industry_key(self, industry: str) -> str:
         """Map industry input to business names key"""
-        industry_lower = industry.lower()
+        category_keys = {
+            'restaurants': 'restaurants',
+            'dental': 'dentists',
+            'plumbing': 'plumbers',
+            'beauty': 'salons',
+            'fitness': 'gyms'
+        }
         
-        if any(word in industry_lower for word in ['restaurant', 'food', 'dining']):
-            return 'restaurants'
-        elif any(word in industry_lower for word in ['dental', 'dentist']):
-            return 'dentists'
-        elif any(word in industry_lower for word in ['plumb', 'pipe']):
-            return 'plumbers'
-        elif any(word in industry_lower for word in ['salon', 'hair', 'beauty']):
-            return 'salons'
-        elif any(word in industry_lower for word in ['gym', 'fitness', 'workout']):
-            return 'gyms'
-        else:
-            return 'restaurants'
+        return category_keys.get(classify_industry(industry), 'restaurants')
     
     def _parse_location(self, location: str) -> tuple:
         """Parse location string into city and state"""
+        place = resolve_location(location)
+        if place and place.city:
+            return place.city, place.state
+        
         if ',' in location:
             parts = location.split(',')
             city = parts[0].strip()
@@ -192,7 +174,7 @@ class BusinessDataGenerator:
         phone = f"({area_code}) {exchange}-{number}"
         
         # Generate website
-        business_slug = name.lower().replace("'", "").replace(" ", "").replace("&", "and")
+        business_slug = slug(name)
         website = f"https://www.{business_slug}.com"
         
         # Generate owner
@@ -224,7 +206,7 @@ class BusinessDataGenerator:
         
         return {
             'name': name,
-            'owner': owner,
+            'owner_name': owner,
             'email': email,
             'phone': phone,
             'website': website,
@@ -240,161 +222,89 @@ class BusinessDataGenerator:
             'social_media': social_media
         }
 
-class LeadWave:
+class LeadWave(LeadPipeline):
     """Main LeadWave™ lead generation system - Offline Demo"""
     
-    def __init__(self):
-        self.data_generator = BusinessDataGenerator()
-        self.leads = []
-        self.session_stats = {
-            'total_processed': 0,
-            'successful_extractions': 0,
-            'google_verified': 0,
-            'claimed_businesses': 0,
-            'three_pack_businesses': 0
-        }
+    def __init__(self, source: LeadSource = None, suppression=None, cache=None):
+        super().__init__(source or BusinessDataGenerator(), suppression, cache)
+
+def main():
+    """Main function to run LeadWave™"""
+    parser = argparse.ArgumentParser(description="LeadWave™ offline demo")
+    parser.add_argument('--profile', nargs='?', const='', metavar='DIR',
+                        help="Write per-stage CPU and allocation profiles of this run, to DIR if given")
+    args = parser.parse_args()
     
-    def generate_leads(self, industry: str, location: str, max_leads: int = 50) -> List[BusinessLead]:
-        """Generate leads for specified criteria"""
-        logger.info(f"Starting LeadWave™ generation for {industry} in {location}")
-        
-        # Generate business data
-        business_data_list = self.data_generator.generate_business_data(
-            industry, location, max_leads
-        )
-        
-        if not business_data_list:
-            logger.warning("No businesses generated")
-            return []
-        
-        leads = []
-        
-        for business_data in business_data_list:
-            try:
-                lead = self._create_lead_from_data(business_data)
-                if lead and lead.confidence_score >= 50:
-                    leads.append(lead)
-                    self.session_stats['total_processed'] += 1
-                    
-            except Exception as e:
-                logger.error(f"Error processing business: {e}")
-        
-        self.leads.extend(leads)
-        logger.info(f"Generated {len(leads)} high-quality leads")
-        
-        return leads
+    print("🌊 Welcome to LeadWave™ - Advanced Lead Generation System")
+    print("📱 WebContainer Offline Demo - Realistic Business Data Generator")
+    print("=" * 65)
     
-    def _create_lead_from_data(self, data: Dict) -> Optional[BusinessLead]:
-        """Create BusinessLead from generated data"""
-        try:
-            lead = BusinessLead()
-            lead.business_name = data['name']
-            lead.owner_name = data['owner']
-            lead.email = data['email']
-            lead.phone = data['phone']
-            lead.website = data['website']
-            lead.address = data['address']
-            lead.city = data['city']
-            lead.state = data['state']
-            lead.zip_code = data['zip_code']
-            lead.country = 'US'
-            lead.industry = data['industry']
-            lead.google_rating = data['rating']
-            lead.google_reviews = data['reviews']
-            lead.google_claimed = data['google_claimed']
-            lead.google_3pack = data['google_3pack']
-            lead.social_media = data['social_media']
-            
-            # Calculate confidence score
-            lead.confidence_score = self._calculate_confidence_score(lead)
-            
-            # Update statistics
-            self.session_stats['successful_extractions'] += 1
-            if lead.google_claimed:
-                self.session_stats['claimed_businesses'] += 1
-            if lead.google_3pack:
-                self.session_stats['three_pack_businesses'] += 1
-            
-            logger.info(f"Generated lead: {lead.business_name} (Score: {lead.confidence_score:.2f})")
-            return lead
-            
-        except Exception as e:
-            logger.error(f"Error creating lead from data: {e}")
-            return None
+    print("ℹ️  Runs fully offline - no network access or API keys required")
+    print()
     
-    def _calculate_confidence_score(self, lead: BusinessLead) -> float:
-        """Calculate confidence score for lead quality"""
-        score = 0.0
+    try:
+        leadwave = LeadWave()
         
-        # Basic information (40 points)
-        if lead.business_name: score += 10
-        if lead.phone: score += 10
-        if lead.email: score += 10
-        if lead.address: score += 10
+        print("🎯 Lead Generation Setup:")
+        industry = input("Enter industry (restaurants, dentists, plumbers, salons, gyms): ").strip()
+        if not industry:
+            industry = "restaurants"
         
-        # Owner information (20 points)
-        if lead.owner_name: score += 20
+        location = input("Enter location (City, State - e.g., 'Miami, FL'): ").strip()
+        if not location:
+            location = "Los Angeles, CA"
         
-        # Google verification (30 points)
-        if lead.google_claimed: score += 15
-        if lead.google_3pack: score += 15
+        max_leads_input = input("Maximum leads to generate (default 10): ").strip()
+        max_leads = int(max_leads_input) if max_leads_input.isdigit() else 10
         
-        # Additional factors (10 points)
-        if lead.website: score += 5
-        if lead.social_media: score += 5
+        print(f"\n🔍 Generating {industry} businesses in {location}...")
         
-        return min(score, 100.0)
-    
-    def save_leads(self, filename: str = None, format: str = 'csv') -> str:
-        """Save leads to file"""
-        if not filename:
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"leadwave_leads_{timestamp}"
+        profiler = None
+        if args.profile is not None:
+            from profiling import PipelineProfiler
+            profiler = PipelineProfiler(args.profile or None)
+            profiler.start()
+            profiler.instrument(leadwave)
         
         try:
-            # Convert leads to dictionaries
-            leads_data = [asdict(lead) for lead in self.leads]
+            leads = leadwave.generate_leads(
+                industry=industry,
+                location=location,
+                max_leads=max_leads
+            )
             
-            if format.lower() == 'csv':
-                csv_file = f"{filename}.csv"
+            if leads:
+                print(f"\n✅ Successfully generated {len(leads)} leads!")
                 
-                if leads_data:
-                    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.DictWriter(f, fieldnames=leads_data[0].keys())
-                        writer.writeheader()
-                        writer.writerows(leads_data)
+                leadwave.display_leads_preview(3)
                 
-                logger.info(f"Leads saved to {csv_file}")
-                return csv_file
-            
-            elif format.lower() == 'json':
-                json_file = f"{filename}.json"
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(leads_data, f, indent=2, ensure_ascii=False)
-                logger.info(f"Leads saved to {json_file}")
-                return json_file
+                output_format = input("\nSave format (csv/json) [csv]: ").strip().lower() or 'csv'
+                saved_file = leadwave.save_leads(format=output_format)
                 
-        except Exception as e:
-            logger.error(f"Error saving leads: {e}")
-            return ""
-    
-    def get_session_report(self) -> Dict:
-        """Get detailed session statistics"""
-        return {
-            'session_stats': self.session_stats,
-            'total_leads': len(self.leads),
-            'high_quality_leads': len([l for l in self.leads if l.confidence_score >= 80]),
-            'average_confidence': sum(l.confidence_score for l in self.leads) / len(self.leads) if self.leads else 0,
-            'google_coverage': {
-                'claimed_percentage': (self.session_stats['claimed_businesses'] / max(self.session_stats['successful_extractions'], 1)) * 100,
-                'three_pack_percentage': (self.session_stats['three_pack_businesses'] / max(self.session_stats['successful_extractions'], 1)) * 100
-            }
-        }
+                if saved_file:
+                    print(f"📁 Results saved to: {saved_file}")
+                
+                report = leadwave.get_session_report()
+                print(f"\n📊 Session Report:")
+                print(f"   • Total leads generated: {report['total_leads']}")
+                print(f"   • High-quality leads (80%+): {report['high_quality_leads']}")
+                print(f"   • Average confidence score: {report['average_confidence']:.1f}%")
+                print(f"   • Google claimed businesses: {report['google_coverage']['claimed_percentage']:.1f}%")
+                print(f"   • 3-pack presence: {report['google_coverage']['three_pack_percentage']:.1f}%")
+            
+            else:
+                print("❌ No leads generated. Try adjusting your search criteria.")
+        finally:
+            # A run that raises still leaves its profile behind
+            if profiler:
+                profiler.stop()
+                print(f"🔬 Profile saved to: {profiler.write_reports()}")
+            
+    except KeyboardInterrupt:
+        print("\n\n⏹️  LeadWave™ stopped by user")
+    except Exception as e:
+        logger.error(f"LeadWave™ error: {e}")
+        print(f"❌ Error: {e}")
 
-def main():
-    """Main function to run LeadWave™"""
-    print("🌊 Welcome to LeadWave™ - Advanced Lead Generation System")
-    print("📱 WebContainer Offline Demo - Realistic Business Data Generator")
-    print("=" * 65)
-    
-    print("ℹ️
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Profiling mode for LeadWave™
+Per-stage cProfile and tracemalloc reports plus collapsed stacks for flamegraphs
+"""
+
+import os
+import sys
+import time
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+from datetime import datetime
+from contextlib import contextmanager
+from typing import List, Dict, Optional
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Pipeline methods wrapped by instrument(), stage name -> (owner attribute, method name)
+PIPELINE_STAGES = {
+    'generate_business_data': ('source', 'fetch'),
+    '_process_business': (None, '_process_business'),
+    'scoring': (None, '_calculate_confidence_score'),
+    'save_leads': (None, 'save_leads'),
+}
+
+class _StageStats:
+    """Accumulated cost of one stage across all of its calls"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profile = cProfile.Profile()
+        self.calls = 0
+        self.wall_time = 0.0
+        self.allocated = 0
+        self.peak = 0
+
+class PipelineProfiler:
+    """Records CPU and allocation profiles for each pipeline stage
+
+    cProfile only keeps caller/callee pairs, so the collapsed stacks for
+    flamegraphs come from a stack sampler running alongside it.
+    """
+
+    def __init__(self, output_dir: str = None, sample_interval: float = 0.005,
+                 trace_frames: int = 10, top_count: int = 25):
+        self.output_dir = output_dir or os.path.join(
+            Config.OUTPUT_DIR, f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+        self.sample_interval = sample_interval
+        self.trace_frames = trace_frames
+        self.top_count = top_count
+
+        self.stages: Dict[str, _StageStats] = {}
+        self.samples: Dict[str, int] = {}
+        self._stack: List[_StageStats] = []
+        self._thread_id = None
+        self._sampler: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._start_snapshot = None
+        self._end_snapshot = None
+        self._started_tracing = False
+        self._restore: List[tuple] = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        self.write_reports()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracing = True
+        self._start_snapshot = tracemalloc.take_snapshot()
+        self._thread_id = threading.get_ident()
+        self._stop.clear()
+        self._sampler = threading.Thread(target=self._sample, name='leadwave-profiler', daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._sampler:
+            self._sampler.join()
+        self._end_snapshot = tracemalloc.take_snapshot()
+        if self._started_tracing:
+            tracemalloc.stop()
+        self.uninstrument()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Profile the enclosed block as one call of the named stage"""
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = _StageStats(name)
+
+        # Only one cProfile can be active, a nested stage pauses its parent
+        parent = self._stack[-1] if self._stack else None
+        if parent:
+            parent.profile.disable()
+        self._stack.append(stats)
+
+        memory_before = 0
+        if tracemalloc.is_tracing():
+            memory_before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        stats.profile.enable()
+        try:
+            yield stats
+        finally:
+            stats.profile.disable()
+            stats.calls += 1
+            stats.wall_time += time.perf_counter() - start
+            if tracemalloc.is_tracing():
+                current, peak = tracemalloc.get_traced_memory()
+                stats.allocated += max(0, current - memory_before)
+                stats.peak = max(stats.peak, peak - memory_before)
+
+            self._stack.pop()
+            if parent:
+                parent.profile.enable()
+
+    def instrument(self, pipeline):
+        """Wrap the pipeline's stage methods on this instance only"""
+        for name, (owner_attribute, method_name) in PIPELINE_STAGES.items():
+            owner = getattr(pipeline, owner_attribute) if owner_attribute else pipeline
+            method = getattr(owner, method_name, None)
+            if method is None:
+                continue
+
+            def wrapped(*args, _method=method, _stage=name, **kwargs):
+                with self.stage(_stage):
+                    return _method(*args, **kwargs)
+
+            had_own = method_name in vars(owner)
+            self._restore.append((owner, method_name, vars(owner).get(method_name), had_own))
+            setattr(owner, method_name, wrapped)
+        return pipeline
+
+    def uninstrument(self):
+        for owner, method_name, original, had_own in reversed(self._restore):
+            if had_own:
+                setattr(owner, method_name, original)
+            else:
+                delattr(owner, method_name)
+        self._restore.clear()
+
+    def _sample(self):
+        # Folds the profiled thread's stack, rooted at the active stage
+        while not self._stop.wait(self.sample_interval):
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+
+            frames = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_filename != __file__:
+                    frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+
+            stack = self._stack
+            root = stack[-1].name if stack else 'other'
+            key = ';'.join([f"stage:{root}"] + frames[::-1])
+            self.samples[key] = self.samples.get(key, 0) + 1
+
+    def top_allocations(self, count: int = None) -> List[Dict]:
+        """Lines that allocated the most memory while profiling"""
+        differences = self._end_snapshot.compare_to(self._start_snapshot, 'lineno')
+        return [
+            {
+                'location': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                'size_diff': stat.size_diff,
+                'count_diff': stat.count_diff
+            }
+            for stat in differences[:count or self.top_count]
+        ]
+
+    def summary(self) -> Dict:
+        return {
+            'stages': {
+                name: {
+                    'calls': stats.calls,
+                    'wall_time': stats.wall_time,
+                    'allocated_bytes': stats.allocated,
+                    'peak_bytes': stats.peak
+                }
+                for name, stats in self.stages.items()
+            },
+            'samples': sum(self.samples.values()),
+            'top_allocations': self.top_allocations()
+        }
+
+    def write_reports(self) -> str:
+        """Write pstats files, collapsed stacks and a text summary, returns the directory"""
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        for name, stats in self.stages.items():
+            stats.profile.dump_stats(os.path.join(self.output_dir, f"{name}.pstats"))
+
+        with open(os.path.join(self.output_dir, 'collapsed_stacks.txt'), 'w', encoding='utf-8') as f:
+            for stack, count in sorted(self.samples.items()):
+                f.write(f"{stack} {count}\n")
+
+        summary = self.summary()
+        with open(os.path.join(self.output_dir, 'summary.txt'), 'w', encoding='utf-8') as f:
+            f.write("LeadWave™ profile summary\n")
+            f.write("=" * 60 + "\n\n")
+            f.write(f"{'stage':<26}{'calls':>8}{'wall s':>10}{'alloc KB':>12}{'peak KB':>10}\n")
+            for name, stage in summary['stages'].items():
+                f.write(f"{name:<26}{stage['calls']:>8}{stage['wall_time']:>10.3f}"
+                        f"{stage['allocated_bytes'] / 1024:>12.1f}{stage['peak_bytes'] / 1024:>10.1f}\n")
+
+            f.write(f"\nTop allocations\n{'-' * 60}\n")
+            for allocation in summary['top_allocations']:
+                f.write(f"{allocation['size_diff'] / 1024:>10.1f} KB {allocation['count_diff']:>8} blocks  "
+                        f"{allocation['location']}\n")
+
+            for name, stats in self.stages.items():
+                f.write(f"\nCPU profile: {name}\n{'-' * 60}\n")
+                pstats.Stats(stats.profile, stream=f).sort_stats('cumulative').print_stats(self.top_count)
+
+        logger.info(f"🔬 Profile written to {self.output_dir}")
+        return self.output_dir
+
+@contextmanager
+def profile_run(pipeline=None, output_dir: str = None, **kwargs):
+    """Profile everything in the block, instrumenting the pipeline's stages if given"""
+    profiler = PipelineProfiler(output_dir, **kwargs)
+    with profiler:
+        if pipeline is not None:
+            profiler.instrument(pipeline)
+        yield profiler
@@ -0,0 +1,247 @@
+"""
+Resilience layer for LeadWave™
+Circuit breakers per source and per host, a shared retry budget and jittered
+exponential backoff, driven by Config.MAX_RETRIES, SKIP_ERRORS and RETRYABLE_ERRORS
+"""
+
+import time
+import random
+import logging
+import threading
+from typing import Dict, Optional, Callable, Any
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+class CircuitOpenError(Exception):
+    """Raised without calling out when a source or host circuit is open"""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"Circuit for {name} is open, retry in {retry_in:.0f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+class HTTPStatusError(Exception):
+    """Raised inside a resilient call for a response status that counts as a failure"""
+
+    def __init__(self, code: int, headers: Dict = None):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+        self.headers = headers or {}
+
+def is_failure_status(status: int) -> bool:
+    """Server errors and throttling say the far end is unhealthy"""
+    return status >= 500 or status == 429
+
+def error_status(error: Exception) -> Optional[int]:
+    """HTTP status carried by urllib, http.client or requests errors"""
+    status = getattr(error, 'code', None) or getattr(error, 'status', None)
+    response = getattr(error, 'response', None)
+    if status is None and response is not None:
+        status = getattr(response, 'status_code', None)
+    return status if isinstance(status, int) else None
+
+def is_skipped(error: Exception) -> bool:
+    """Errors listed in Config.SKIP_ERRORS are never retried"""
+    status = error_status(error)
+    return status is not None and str(status) in Config.SKIP_ERRORS
+
+def is_retryable(error: Exception) -> bool:
+    """Throttling and the transient error types named in Config.RETRYABLE_ERRORS"""
+    if error_status(error) == 429:
+        return True
+    if is_skipped(error):
+        return False
+    names = [cls.__name__ for cls in type(error).__mro__]
+    return any(retryable in name for retryable in Config.RETRYABLE_ERRORS for name in names)
+
+def is_failure(error: Exception) -> bool:
+    """Whether an error says the far end is unhealthy, client errors do not count"""
+    status = error_status(error)
+    if status is not None:
+        return is_failure_status(status)
+    return True
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """Full-jitter exponential backoff"""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+class CircuitBreaker:
+    """Opens after consecutive failures, lets one trial call through after a cool-down"""
+
+    def __init__(self, name: str, failure_threshold: int = None, recovery_timeout: float = None):
+        self.name = name
+        self.failure_threshold = failure_threshold or Config.BREAKER_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or Config.BREAKER_RECOVERY_SECONDS
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+        self.stats = {'calls': 0, 'failures': 0, 'rejected': 0, 'opened': 0}
+
+    def allow(self):
+        """Raise CircuitOpenError unless a call may go out now"""
+        with self._lock:
+            if self.state == OPEN:
+                waited = time.monotonic() - self.opened_at
+                if waited < self.recovery_timeout:
+                    self.stats['rejected'] += 1
+                    raise CircuitOpenError(self.name, self.recovery_timeout - waited)
+                self.state = HALF_OPEN
+
+            if self.state == HALF_OPEN:
+                if self._trial_in_flight:
+                    self.stats['rejected'] += 1
+                    raise CircuitOpenError(self.name, 0)
+                self._trial_in_flight = True
+
+            self.stats['calls'] += 1
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self._trial_in_flight = False
+            if self.state != CLOSED:
+                logger.info(f"🟢 Circuit for {self.name} closed")
+            self.state = CLOSED
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self.stats['failures'] += 1
+            self._trial_in_flight = False
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.stats['opened'] += 1
+                    logger.warning(f"🔴 Circuit for {self.name} opened after {self.failures} failures")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+
+    def release(self):
+        """End a call that said nothing about health, such as a client error"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def report(self) -> Dict:
+        with self._lock:
+            return {'state': self.state, 'consecutive_failures': self.failures, **self.stats}
+
+class RetryBudget:
+    """Retries are capped to a fraction of first attempts, plus a small steady allowance"""
+
+    def __init__(self, ratio: float = None, min_per_second: float = 1.0, capacity: float = 100.0):
+        self.ratio = ratio if ratio is not None else Config.RETRY_BUDGET_RATIO
+        self.min_per_second = min_per_second
+        self.capacity = capacity
+        self.tokens = min(capacity, 10.0)
+        self._refilled = time.monotonic()
+        self._lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'exhausted': 0}
+
+    def record_request(self):
+        with self._lock:
+            self.stats['requests'] += 1
+            self.tokens = min(self.capacity, self.tokens + self.ratio)
+
+    def try_retry(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self._refilled) * self.min_per_second)
+            self._refilled = now
+            if self.tokens < 1:
+                self.stats['exhausted'] += 1
+                return False
+            self.tokens -= 1
+            self.stats['retries'] += 1
+            return True
+
+    def report(self) -> Dict:
+        with self._lock:
+            return {'tokens': round(self.tokens, 1), **self.stats}
+
+class Resilience:
+    """Runs calls under source and host breakers with budgeted, jittered retries"""
+
+    def __init__(self, max_retries: int = None, budget: RetryBudget = None,
+                 base_delay: float = 0.5, max_delay: float = 30.0, sleep: Callable[[float], Any] = time.sleep):
+        self.max_retries = max_retries if max_retries is not None else Config.MAX_RETRIES
+        self.budget = budget or RetryBudget()
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name)
+            return breaker
+
+    def call(self, func: Callable, *args, source: str = None, host: str = None, **kwargs):
+        """Call func, retrying transient errors; open circuits fail fast with CircuitOpenError"""
+        breakers = [self.breaker(f"source:{source}")] if source else []
+        if host:
+            breakers.append(self.breaker(f"host:{host}"))
+
+        self.budget.record_request()
+        attempt = 0
+
+        while True:
+            allowed = []
+            try:
+                for breaker in breakers:
+                    breaker.allow()
+                    allowed.append(breaker)
+            except CircuitOpenError:
+                for breaker in allowed:
+                    breaker.release()
+                raise
+
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                for breaker in allowed:
+                    if is_failure(e):
+                        breaker.record_failure()
+                    else:
+                        breaker.release()
+
+                if not is_retryable(e) or attempt >= self.max_retries or not self.budget.try_retry():
+                    raise
+
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                retry_after = self._retry_after(e)
+                if retry_after:
+                    delay = min(self.max_delay, max(delay, retry_after))
+                attempt += 1
+                logger.debug(f"Retrying {source or host} in {delay:.2f}s after {type(e).__name__} (attempt {attempt})")
+                self.sleep(delay)
+                continue
+
+            for breaker in allowed:
+                breaker.record_success()
+            return result
+
+    @staticmethod
+    def _retry_after(error: Exception) -> float:
+        headers = getattr(error, 'headers', None) or getattr(getattr(error, 'response', None), 'headers', None)
+        try:
+            return float(headers.get('Retry-After', 0)) if headers else 0.0
+        except (TypeError, ValueError):
+            return 0.0
+
+    def report(self) -> Dict:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {
+            'breakers': {name: breaker.report() for name, breaker in sorted(breakers.items())},
+            'retry_budget': self.budget.report()
+        }
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Sharded LeadWave™ campaign execution
+A coordinator splits a campaign into work units on a shared SQLite queue,
+workers on any number of machines claim units under a renewable lease,
+and units held by dead workers are handed to live ones.
+"""
+
+import os
+import json
+import time
+import uuid
+import socket
+import sqlite3
+import logging
+import argparse
+import threading
+import multiprocessing
+from dataclasses import dataclass, field, asdict
+from typing import List, Dict, Optional, Iterable
+
+from leadwave import LeadWave
+from lead_pipeline import BusinessLead
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_SECONDS = 120
+# Attempts before a unit is parked as failed, including leases that expired mid-run
+DEFAULT_MAX_ATTEMPTS = 3
+
+@dataclass
+class WorkUnit:
+    """One industry x location x ZIP tile slice of a campaign"""
+    unit_id: str = ""
+    industry: str = ""
+    location: str = ""
+    zip_codes: List[str] = field(default_factory=list)
+    max_leads: int = 50
+
+def plan_campaign(industries: Iterable[str], locations: Iterable[str],
+                  zip_codes: Dict[str, List[str]] = None, tile_size: int = 5,
+                  max_leads: int = 50) -> List[WorkUnit]:
+    """Split a campaign into work units, tiling ZIP codes per location"""
+    zip_codes = zip_codes or {}
+    units = []
+
+    for industry in industries:
+        for location in locations:
+            location_zips = zip_codes.get(location) or []
+            tiles = [location_zips[i:i + tile_size] for i in range(0, len(location_zips), tile_size)] or [[]]
+
+            for tile_number, tile in enumerate(tiles):
+                unit_id = f"{industry}|{location}|{tile_number}".lower().replace(' ', '_')
+                units.append(WorkUnit(unit_id, industry, location, tile, max_leads))
+
+    return units
+
+class WorkQueue:
+    """SQLite-backed work queue shared by the coordinator and workers"""
+
+    def __init__(self, path: str, lease_seconds: int = DEFAULT_LEASE_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self._local = threading.local()
+        self._create_schema()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        # SQLite connections must not cross threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            self._local.connection = connection
+        return connection
+
+    def _create_schema(self):
+        self.db.executescript('''
+            CREATE TABLE IF NOT EXISTS units (
+                unit_id TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                worker_id TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                unit_id TEXT PRIMARY KEY,
+                worker_id TEXT NOT NULL,
+                leads TEXT NOT NULL,
+                stats TEXT NOT NULL,
+                completed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS units_status ON units (status, lease_expires);
+        ''')
+
+    def enqueue(self, units: Iterable[WorkUnit]) -> int:
+        """Add work units, ignoring ones already queued"""
+        rows = [(unit.unit_id, json.dumps(asdict(unit))) for unit in units]
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            before = self.db.total_changes
+            self.db.executemany('INSERT OR IGNORE INTO units (unit_id, payload) VALUES (?, ?)', rows)
+            added = self.db.total_changes - before
+            self.db.execute('COMMIT')
+        except Exception:
+            self.db.execute('ROLLBACK')
+            raise
+        return added
+
+    def claim(self, worker_id: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> Optional[WorkUnit]:
+        """Atomically lease the next pending or expired unit
+
+        A unit whose lease expired after max_attempts tries (its worker kept
+        dying before it could call fail) is parked as failed instead.
+        """
+        now = time.time()
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            self.db.execute(
+                "UPDATE units SET status = 'failed', worker_id = NULL, lease_expires = NULL, "
+                "error = COALESCE(error, 'Lease expired after ' || attempts || ' attempts') "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, max_attempts)
+            )
+            row = self.db.execute(
+                "SELECT unit_id, payload FROM units "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY attempts, unit_id LIMIT 1",
+                (now,)
+            ).fetchone()
+
+            if row is None:
+                self.db.execute('COMMIT')
+                return None
+
+            self.db.execute(
+                "UPDATE units SET status = 'leased', worker_id = ?, lease_expires = ?, "
+                "attempts = attempts + 1 WHERE unit_id = ?",
+                (worker_id, now + self.lease_seconds, row[0])
+            )
+            self.db.execute('COMMIT')
+        except Exception:
+            self.db.execute('ROLLBACK')
+            raise
+
+        return WorkUnit(**json.loads(row[1]))
+
+    def renew(self, unit_id: str, worker_id: str) -> bool:
+        """Extend a lease, returns False if the unit was reassigned"""
+        cursor = self.db.execute(
+            "UPDATE units SET lease_expires = ? WHERE unit_id = ? AND worker_id = ? AND status = 'leased'",
+            (time.time() + self.lease_seconds, unit_id, worker_id)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, unit_id: str, worker_id: str, leads: List[BusinessLead], stats: Dict) -> bool:
+        """Store a unit's output, ignored if another worker already finished it"""
+        self.db.execute('BEGIN IMMEDIATE')
+        try:
+            status = self.db.execute('SELECT status FROM units WHERE unit_id = ?', (unit_id,)).fetchone()
+            if not status or status[0] == 'done':
+                self.db.execute('COMMIT')
+                return False
+
+            self.db.execute(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)',
+                (unit_id, worker_id, json.dumps([asdict(lead) for lead in leads]),
+                 json.dumps(stats), time.time())
+            )
+            self.db.execute(
+                "UPDATE units SET status = 'done', worker_id = ?, lease_expires = NULL WHERE unit_id = ?",
+                (worker_id, unit_id)
+            )
+            self.db.execute('COMMIT')
+        except Exception:
+            self.db.execute('ROLLBACK')
+            raise
+        return True
+
+    def fail(self, unit_id: str, worker_id: str, error: str, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """Release a failed unit for retry, or park it after too many attempts"""
+        self.db.execute(
+            "UPDATE units SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "worker_id = NULL, lease_expires = NULL, error = ? WHERE unit_id = ? AND worker_id = ?",
+            (max_attempts, error, unit_id, worker_id)
+        )
+
+    def progress(self) -> Dict[str, int]:
+        """Count units by status, counting expired leases as pending"""
+        counts = {'pending': 0, 'leased': 0, 'done': 0, 'failed': 0}
+        now = time.time()
+        for status, expires in self.db.execute('SELECT status, lease_expires FROM units'):
+            if status == 'leased' and expires is not None and expires < now:
+                status = 'pending'
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+    def results(self) -> Iterable[tuple]:
+        """Yield (unit_id, worker_id, leads, stats) for every finished unit"""
+        for unit_id, worker_id, leads, stats in self.db.execute(
+            'SELECT unit_id, worker_id, leads, stats FROM results ORDER BY unit_id'
+        ):
+            yield unit_id, worker_id, json.loads(leads), json.loads(stats)
+
+class CampaignWorker:
+    """Claims units from the queue and runs them through a local LeadWave"""
+
+    def __init__(self, queue: WorkQueue, worker_id: str = None, max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        self.queue = queue
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.max_attempts = max_attempts
+        self.units_completed = 0
+
+    def run(self, idle_exit: bool = True, poll_interval: float = 2.0):
+        """Process units until the queue is drained"""
+        logger.info(f"👷 Worker {self.worker_id} started")
+
+        while True:
+            unit = self.queue.claim(self.worker_id, self.max_attempts)
+
+            if unit is None:
+                progress = self.queue.progress()
+                if idle_exit and not progress['pending'] and not progress['leased']:
+                    break
+                # Another worker holds the rest, wait in case its lease lapses
+                time.sleep(poll_interval)
+                continue
+
+            self.run_unit(unit)
+
+        logger.info(f"👷 Worker {self.worker_id} finished {self.units_completed} units")
+
+    def run_unit(self, unit: WorkUnit):
+        """Run a single unit while a heartbeat thread keeps its lease alive"""
+        stop = threading.Event()
+        heartbeat = threading.Thread(target=self._heartbeat, args=(unit.unit_id, stop), daemon=True)
+        heartbeat.start()
+
+        try:
+            leadwave = LeadWave()
+            locations = [f"{unit.location} {zip_code}" for zip_code in unit.zip_codes] or [unit.location]
+
+            for location in locations:
+                leadwave.generate_leads(unit.industry, location, unit.max_leads)
+
+            if self.queue.complete(unit.unit_id, self.worker_id, leadwave.leads, leadwave.session_stats):
+                self.units_completed += 1
+                logger.info(f"✅ Unit {unit.unit_id} done ({len(leadwave.leads)} leads)")
+
+        except Exception as e:
+            logger.error(f"Unit {unit.unit_id} failed on {self.worker_id}: {e}")
+            self.queue.fail(unit.unit_id, self.worker_id, str(e), self.max_attempts)
+
+        finally:
+            stop.set()
+            heartbeat.join()
+
+    def _heartbeat(self, unit_id: str, stop: threading.Event):
+        interval = max(self.queue.lease_seconds / 3, 0.1)
+        while not stop.wait(interval):
+            if not self.queue.renew(unit_id, self.worker_id):
+                logger.warning(f"Lease on {unit_id} lost by {self.worker_id}")
+                return
+
+class CampaignCoordinator:
+    """Plans campaigns, tracks progress and merges worker output"""
+
+    def __init__(self, queue: WorkQueue):
+        self.queue = queue
+
+    def submit(self, units: List[WorkUnit]) -> int:
+        added = self.queue.enqueue(units)
+        logger.info(f"📦 Queued {added} of {len(units)} work units")
+        return added
+
+    def wait(self, poll_interval: float = 5.0, timeout: float = None) -> Dict[str, int]:
+        """Block until no unit is pending or leased"""
+        deadline = time.time() + timeout if timeout else None
+
+        while True:
+            progress = self.queue.progress()
+            if not progress['pending'] and not progress['leased']:
+                return progress
+            if deadline and time.time() >= deadline:
+                return progress
+            time.sleep(poll_interval)
+
+    def merge(self) -> LeadWave:
+        """Combine worker leads and stats into one LeadWave for reporting and export"""
+        merged = LeadWave()
+        seen = set()
+
+        for unit_id, worker_id, leads, stats in self.queue.results():
+            for key, value in stats.items():
+                merged.session_stats[key] = merged.session_stats.get(key, 0) + value
+
+            for lead_data in leads:
+                lead = BusinessLead(**lead_data)
+                lead_key = (lead.business_name.lower(), lead.phone)
+                if lead_key in seen:
+                    continue
+                seen.add(lead_key)
+                merged.leads.append(lead)
+
+        logger.info(f"🔗 Merged {len(merged.leads)} leads from the campaign")
+        return merged
+
+def _worker_process(db_path: str, lease_seconds: int):
+    CampaignWorker(WorkQueue(db_path, lease_seconds)).run()
+
+def run_local(db_path: str, processes: int = 2, lease_seconds: int = DEFAULT_LEASE_SECONDS):
+    """Drain the queue with worker processes on this machine"""
+    workers = [
+        multiprocessing.Process(target=_worker_process, args=(db_path, lease_seconds))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+def main():
+    parser = argparse.ArgumentParser(description="LeadWave™ sharded campaign execution")
+    parser.add_argument('--db', required=True, help="Path to the shared SQLite queue")
+    parser.add_argument('--lease', type=int, default=DEFAULT_LEASE_SECONDS, help="Lease length in seconds")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plan = commands.add_parser('plan', help="Queue a campaign")
+    plan.add_argument('--industry', action='append', required=True)
+    plan.add_argument('--location', action='append', required=True)
+    plan.add_argument('--zips', action='append', default=[],
+                      help="LOCATION=ZIP,ZIP,... ZIP codes to tile for a location")
+    plan.add_argument('--tile-size', type=int, default=5)
+    plan.add_argument('--max-leads', type=int, default=50)
+
+    worker = commands.add_parser('worker', help="Process queued units")
+    worker.add_argument('--processes', type=int, default=1)
+
+    merge = commands.add_parser('merge', help="Merge finished units and save them")
+    merge.add_argument('--output', default=None)
+    merge.add_argument('--format', default='csv')
+
+    commands.add_parser('status', help="Show queue progress")
+
+    args = parser.parse_args()
+    queue = WorkQueue(args.db, args.lease)
+    coordinator = CampaignCoordinator(queue)
+
+    if args.command == 'plan':
+        zip_codes = {}
+        for entry in args.zips:
+            location, _, zips = entry.partition('=')
+            zip_codes[location] = [z.strip() for z in zips.split(',') if z.strip()]
+        coordinator.submit(plan_campaign(args.industry, args.location, zip_codes, args.tile_size, args.max_leads))
+
+    elif args.command == 'worker':
+        if args.processes > 1:
+            run_local(args.db, args.processes, args.lease)
+        else:
+            CampaignWorker(queue).run()
+
+    elif args.command == 'merge':
+        merged = coordinator.merge()
+        saved_file = merged.save_leads(args.output, args.format)
+        print(f"📁 Results saved to: {saved_file}")
+        print(json.dumps(merged.get_session_report(), indent=2))
+
+    elif args.command == 'status':
+        print(json.dumps(queue.progress(), indent=2))
+
+if __name__ == "__main__":
+    main()
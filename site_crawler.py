@@ -0,0 +1,332 @@
+"""
+Contact-page crawler for LeadWave™
+Bounded per-site crawl that visits likely contact pages first and stops
+as soon as the wanted fields are found
+"""
+
+import re
+import time
+import heapq
+import logging
+import itertools
+import threading
+import html.parser
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import urlopen, Request
+from urllib.parse import urljoin, urlsplit, urldefrag
+from urllib.robotparser import RobotFileParser
+from typing import List, Dict, Optional, Callable, Tuple
+
+from config import Config
+from utils import DataValidator, TextProcessor
+from resilience import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = 'Mozilla/5.0 (compatible; LeadWave/1.0)'
+
+REQUIRED_FIELDS = ('email', 'owner_name', 'address')
+
+# Lower ranks are fetched first, the first matching pattern wins
+PATH_PRIORITIES = [
+    (re.compile(r'contact|get-in-touch|reach-us|location', re.I), 0),
+    (re.compile(r'about|our-story|who-we-are', re.I), 1),
+    (re.compile(r'team|staff|people|owner|leadership|meet', re.I), 2),
+]
+DEFAULT_PRIORITY = 5
+SKIPPED_EXTENSIONS = re.compile(r'\.(?:jpe?g|png|gif|svg|webp|pdf|zip|mp4|mp3|css|js|ico|woff2?)$', re.I)
+
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'(?:\+?1[\s.-]?)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}')
+OWNER_PATTERNS = [
+    re.compile(r'(?:[Oo]wner|[Ff]ounder|[Pp]roprietor|[Pp]resident)\s*[:\-–]\s*((?:Dr\.\s)?[A-Z][a-z]+(?:\s[A-Z][a-z]+){1,2})'),
+    re.compile(r'(?:[Oo]wned|[Ff]ounded|[Rr]un)\s+by\s+((?:Dr\.\s)?[A-Z][a-z]+(?:\s[A-Z][a-z]+){1,2})'),
+    re.compile(r'((?:Dr\.\s)?[A-Z][a-z]+(?:\s[A-Z][a-z]+){1,2}),?\s+(?:Owner|Founder|Proprietor)'),
+]
+SITEMAP_LOC = re.compile(rb'<loc>\s*([^<\s]+)\s*</loc>', re.I)
+
+Fetcher = Callable[[str, int], Tuple[int, str, bytes]]
+
+def fetch_url(url: str, limit: int) -> Tuple[int, str, bytes]:
+    """GET a URL reading at most limit bytes, returns (status, content type, body)"""
+    request = Request(url, headers={'User-Agent': USER_AGENT})
+    with urlopen(request, timeout=Config.REQUEST_TIMEOUT) as response:
+        return response.status, response.headers.get('Content-Type', ''), response.read(limit)
+
+@dataclass
+class CrawlBudget:
+    """Per-domain limits
+
+    robots.txt and sitemaps are read up to max_robots_bytes in total when a
+    site is first seen, and those bytes also count against max_bytes.
+    """
+    max_pages: int = 8
+    max_bytes: int = 1500000
+    max_page_bytes: int = 300000
+    max_robots_bytes: int = 500000
+
+@dataclass
+class CrawlResult:
+    """Fields found on one site and what it cost to find them"""
+    website: str
+    fields: Dict[str, str] = field(default_factory=dict)
+    pages: List[str] = field(default_factory=list)
+    bytes_read: int = 0
+    stop_reason: str = ''
+
+class _PageParser(html.parser.HTMLParser):
+    """Collects links and visible text from one page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: List[Tuple[str, str]] = []
+        self.text: List[str] = []
+        self._skip = 0
+        self._href = None
+        self._anchor_text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style', 'noscript'):
+            self._skip += 1
+        elif tag == 'a':
+            self._href = dict(attrs).get('href')
+            self._anchor_text = []
+        elif tag in ('br', 'p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'address'):
+            self.text.append('\n')
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style', 'noscript'):
+            self._skip = max(0, self._skip - 1)
+        elif tag == 'a' and self._href:
+            self.links.append((self._href, ' '.join(self._anchor_text)))
+            self._href = None
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        self.text.append(data)
+        if self._href:
+            self._anchor_text.append(data.strip())
+
+def site_host(netloc: str) -> str:
+    """Host compared for same-site links, example.com and www.example.com are one site"""
+    host = netloc.lower()
+    return host[4:] if host.startswith('www.') else host
+
+def link_priority(url: str, anchor_text: str = '') -> int:
+    """Rank a same-site link, contact/about/team pages come first"""
+    path = urlsplit(url).path
+    for pattern, rank in PATH_PRIORITIES:
+        if pattern.search(path) or pattern.search(anchor_text or ''):
+            return rank
+    # Prefer shallow pages among the rest
+    return DEFAULT_PRIORITY + path.strip('/').count('/')
+
+def extract_contact_fields(text: str, links: List[Tuple[str, str]] = ()) -> Dict[str, str]:
+    """Pull email, phone, owner name and address out of page text"""
+    found = {}
+
+    emails = [href[7:].split('?')[0] for href, _ in links if href and href.lower().startswith('mailto:')]
+    emails += EMAIL_PATTERN.findall(text)
+    for email in emails:
+        if DataValidator.validate_email(email):
+            found['email'] = email.lower()
+            break
+
+    phones = [href[4:] for href, _ in links if href and href.lower().startswith('tel:')]
+    phones += PHONE_PATTERN.findall(text)
+    if phones:
+        found['phone'] = phones[0].strip()
+
+    for pattern in OWNER_PATTERNS:
+        match = pattern.search(text)
+        if match:
+            found['owner_name'] = match.group(1).strip()
+            break
+
+    addresses = TextProcessor.extract_addresses(' '.join(text.split('\n')))
+    if addresses:
+        found['address'] = min(addresses, key=len).strip()
+
+    return found
+
+class RobotsCache:
+    """robots.txt rules and sitemap URLs per site, fetched once per TTL"""
+
+    def __init__(self, fetcher: Fetcher = None, ttl: float = 86400):
+        self.fetcher = fetcher or fetch_url
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, RobotFileParser, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, origin: str, max_bytes: int) -> Tuple[RobotFileParser, List[str], int]:
+        parser = RobotFileParser()
+        sitemaps = []
+        bytes_read = 0
+        try:
+            status, _, body = self.fetcher(f"{origin}/robots.txt", min(200000, max_bytes))
+            bytes_read += len(body)
+            # Missing robots.txt allows everything, server errors are treated the same
+            parser.parse(body.decode('utf-8', 'replace').splitlines() if status == 200 else [])
+            sitemaps = parser.site_maps() or []
+        except Exception as e:
+            logger.debug(f"robots.txt unavailable for {origin}: {e}")
+            parser.parse([])
+
+        if not sitemaps:
+            sitemaps = [f"{origin}/sitemap.xml"]
+
+        urls = []
+        for sitemap in sitemaps[:3]:
+            remaining = max_bytes - bytes_read
+            if remaining <= 0:
+                break
+            try:
+                status, _, body = self.fetcher(sitemap, min(500000, remaining))
+                bytes_read += len(body)
+                if status == 200:
+                    urls.extend(match.decode('utf-8', 'replace') for match in SITEMAP_LOC.findall(body))
+            except Exception as e:
+                logger.debug(f"Sitemap unavailable {sitemap}: {e}")
+
+        return parser, urls, bytes_read
+
+    def get(self, origin: str, max_bytes: int = 500000) -> Tuple[RobotFileParser, List[str], int]:
+        """Rules, sitemap URLs and the bytes read to load them, 0 when cached"""
+        with self._lock:
+            entry = self._entries.get(origin)
+            if entry and entry[0] > time.monotonic():
+                return entry[1], entry[2], 0
+
+        parser, urls, bytes_read = self._load(origin, max_bytes)
+        with self._lock:
+            self._entries[origin] = (time.monotonic() + self.ttl, parser, urls)
+        return parser, urls, bytes_read
+
+    def allowed(self, origin: str, url: str) -> bool:
+        return self.get(origin)[0].can_fetch(USER_AGENT, url)
+
+class SiteCrawler:
+    """Priority-frontier crawler bounded by a per-domain page and byte budget"""
+
+    def __init__(self, budget: CrawlBudget = None, required_fields=REQUIRED_FIELDS,
+                 fetcher: Fetcher = None, robots: RobotsCache = None, max_workers: int = None,
+                 concurrency=None, resilience=None):
+        self.budget = budget or CrawlBudget()
+        self.required_fields = tuple(required_fields)
+        self.fetcher = fetcher or fetch_url
+        self.concurrency = concurrency
+        self.resilience = resilience
+        self.robots = robots or RobotsCache(self._fetch)
+        self.max_workers = max_workers or (concurrency.maximum if concurrency else Config.MAX_WORKERS)
+
+    def _fetch(self, url: str, limit: int) -> Tuple[int, str, bytes]:
+        if self.resilience:
+            return self.resilience.call(self._fetch_once, url, limit, host=urlsplit(url).netloc.lower())
+        return self._fetch_once(url, limit)
+
+    def _fetch_once(self, url: str, limit: int) -> Tuple[int, str, bytes]:
+        if not self.concurrency:
+            return self.fetcher(url, limit)
+        with self.concurrency.slot(urlsplit(url).netloc.lower()) as slot:
+            status, content_type, body = self.fetcher(url, limit)
+            slot.observe_status(status)
+            return status, content_type, body
+
+    def crawl(self, website: str, known: Dict[str, str] = None) -> CrawlResult:
+        """Crawl one site until the required fields are found or the budget runs out"""
+        if not website:
+            return CrawlResult(website='', stop_reason='no website')
+
+        if '://' not in website:
+            website = f"https://{website}"
+        result = CrawlResult(website=website)
+        wanted = {name for name in self.required_fields if not (known or {}).get(name)}
+        if not wanted:
+            # Nothing missing, not even robots.txt is worth a request
+            result.stop_reason = 'fields found'
+            return result
+
+        parts = urlsplit(website)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        host = site_host(parts.netloc)
+        robots, sitemap_urls, result.bytes_read = self.robots.get(
+            origin, min(self.budget.max_robots_bytes, self.budget.max_bytes)
+        )
+
+        frontier: List[Tuple[int, int, str]] = []
+        sequence = itertools.count()
+        seen = set()
+
+        def push(url: str, anchor_text: str = ''):
+            url = urldefrag(urljoin(origin + '/', url))[0]
+            link = urlsplit(url)
+            if link.scheme not in ('http', 'https') or site_host(link.netloc) != host:
+                return
+            if url in seen or SKIPPED_EXTENSIONS.search(link.path):
+                return
+            seen.add(url)
+            heapq.heappush(frontier, (link_priority(url, anchor_text), next(sequence), url))
+
+        push(website)
+        for url in sitemap_urls:
+            push(url)
+
+        while frontier:
+            if not wanted:
+                result.stop_reason = 'fields found'
+                break
+            if len(result.pages) >= self.budget.max_pages:
+                result.stop_reason = 'page budget'
+                break
+            remaining = self.budget.max_bytes - result.bytes_read
+            if remaining <= 0:
+                result.stop_reason = 'byte budget'
+                break
+
+            _, _, url = heapq.heappop(frontier)
+            if not robots.can_fetch(USER_AGENT, url):
+                continue
+
+            try:
+                status, content_type, body = self._fetch(url, min(remaining, self.budget.max_page_bytes))
+            except CircuitOpenError:
+                result.stop_reason = 'circuit open'
+                break
+            except Exception as e:
+                logger.debug(f"Crawl fetch failed for {url}: {e}")
+                result.pages.append(url)
+                continue
+
+            result.pages.append(url)
+            result.bytes_read += len(body)
+            if status != 200 or 'html' not in (content_type or 'text/html'):
+                continue
+
+            parser = _PageParser()
+            try:
+                parser.feed(body.decode('utf-8', 'replace'))
+            except Exception as e:
+                logger.debug(f"Could not parse {url}: {e}")
+                continue
+
+            for name, value in extract_contact_fields(''.join(parser.text), parser.links).items():
+                result.fields.setdefault(name, value)
+                wanted.discard(name)
+
+            for href, anchor_text in parser.links:
+                push(href, anchor_text)
+
+        if not result.stop_reason:
+            result.stop_reason = 'frontier exhausted' if wanted else 'fields found'
+
+        logger.debug(f"Crawled {website}: {len(result.pages)} pages, {result.bytes_read} bytes, {result.stop_reason}")
+        return result
+
+    def crawl_many(self, sites: List[Tuple[str, Dict]]) -> List[CrawlResult]:
+        """Crawl several (website, known fields) pairs concurrently, one worker per site"""
+        if not sites:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(sites))) as executor:
+            return list(executor.map(lambda site: self.crawl(*site), sites))
@@ -0,0 +1,227 @@
+"""
+Social profile verification for LeadWave™
+Lightweight HEAD checks over pooled keep-alive connections with caching
+"""
+
+import ssl
+import time
+import queue
+import logging
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urljoin
+from typing import List, Dict, Optional, Iterable, Tuple
+
+from config import Config
+from resilience import HTTPStatusError, is_failure_status
+
+logger = logging.getLogger(__name__)
+
+EXISTS = 'exists'
+MISSING = 'missing'
+UNKNOWN = 'unknown'
+
+MISSING_STATUSES = {404, 410}
+HEAD_REJECTED_STATUSES = {400, 403, 405, 501}
+MAX_REDIRECTS = 3
+
+USER_AGENT = 'Mozilla/5.0 (compatible; LeadWave/1.0)'
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections shared across threads, per host"""
+
+    def __init__(self, max_per_host: int = 4, timeout: float = None):
+        self.max_per_host = max_per_host
+        self.timeout = timeout or Config.REQUEST_TIMEOUT
+        self._idle: Dict[Tuple[str, str, int], queue.LifoQueue] = {}
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    def _queue(self, key: Tuple[str, str, int]) -> queue.LifoQueue:
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue(maxsize=self.max_per_host)
+            return self._idle[key]
+
+    def acquire(self, scheme: str, host: str, port: int) -> http.client.HTTPConnection:
+        try:
+            return self._queue((scheme, host, port)).get_nowait()
+        except queue.Empty:
+            if scheme == 'https':
+                return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl_context)
+            return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def release(self, scheme: str, host: str, port: int, connection: http.client.HTTPConnection):
+        try:
+            self._queue((scheme, host, port)).put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def request(self, method: str, url: str, headers: Dict = None) -> Tuple[int, http.client.HTTPMessage]:
+        """Send a body-less request and return (status, headers), header lookups ignore case"""
+        parts = urlsplit(url)
+        scheme = parts.scheme or 'https'
+        port = parts.port or (443 if scheme == 'https' else 80)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+
+        request_headers = {'User-Agent': USER_AGENT, 'Connection': 'keep-alive'}
+        request_headers.update(headers or {})
+
+        # A pooled connection may have been closed by the server, retry once on a fresh one
+        for attempt in range(2):
+            connection = self.acquire(scheme, parts.hostname, port)
+            try:
+                connection.request(method, path, headers=request_headers)
+                response = connection.getresponse()
+                response.read()  # drain so the connection can be reused
+                # The HTTPMessage itself, a dict would make 'location:' miss headers.get('Location')
+                status, response_headers = response.status, response.headers
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                connection.close()
+                raise
+
+            if response.will_close:
+                connection.close()
+            else:
+                self.release(scheme, parts.hostname, port, connection)
+            return status, response_headers
+
+    def close(self):
+        with self._lock:
+            for idle in self._idle.values():
+                while not idle.empty():
+                    idle.get_nowait().close()
+            self._idle.clear()
+
+class SocialProfileVerifier:
+    """Checks candidate profile URLs once each, concurrently, with TTL caching"""
+
+    def __init__(self, max_workers: int = None, ttl: float = 86400, negative_ttl: float = 86400,
+                 host_map: Dict[str, str] = None, pool: ConnectionPool = None, concurrency=None,
+                 resilience=None):
+        # With an autotuner the pool is sized to its ceiling and the tuner bounds in-flight checks
+        self.concurrency = concurrency
+        self.max_workers = max_workers or (concurrency.maximum if concurrency else Config.MAX_WORKERS)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # Hostname -> base URL rewrites, used to point checks at a local stub server
+        self.host_map = host_map or {}
+        self.pool = pool or ConnectionPool()
+        # Optional per-host circuit breakers and retry budget, an open circuit reads as unknown
+        self.resilience = resilience
+        self._cache: Dict[str, Tuple[float, str]] = {}
+        self._lock = threading.Lock()
+        self.stats = {'checked': 0, 'cache_hits': 0, 'exists': 0, 'missing': 0, 'unknown': 0}
+
+    def _target(self, url: str) -> str:
+        parts = urlsplit(url)
+        host = (parts.hostname or '').lower()
+        host = host[4:] if host.startswith('www.') else host
+        base = self.host_map.get(host)
+        if not base:
+            return url
+        return base.rstrip('/') + (parts.path or '/') + (f"?{parts.query}" if parts.query else '')
+
+    def _cached(self, url: str) -> Optional[str]:
+        with self._lock:
+            entry = self._cache.get(url)
+            if entry and entry[0] > time.monotonic():
+                self.stats['cache_hits'] += 1
+                return entry[1]
+        return None
+
+    def _store(self, url: str, status: str):
+        # Unknown results are not cached so transient failures get retried
+        if status == UNKNOWN:
+            return
+        ttl = self.ttl if status == EXISTS else self.negative_ttl
+        with self._lock:
+            self._cache[url] = (time.monotonic() + ttl, status)
+
+    def check(self, url: str) -> str:
+        """Classify one profile URL as exists, missing or unknown"""
+        cached = self._cached(url)
+        if cached:
+            return cached
+
+        target = self._target(url)
+        if self.concurrency:
+            with self.concurrency.slot(urlsplit(url).hostname or 'social') as slot:
+                status = self._probe(target, slot)
+        else:
+            status = self._probe(target)
+
+        with self._lock:
+            self.stats['checked'] += 1
+            self.stats[status] += 1
+        self._store(url, status)
+        return status
+
+    def _request(self, method: str, url: str, headers: Dict = None) -> Tuple[int, http.client.HTTPMessage]:
+        if not self.resilience:
+            return self.pool.request(method, url, headers)
+        try:
+            return self.resilience.call(self._checked_request, method, url, headers, host=urlsplit(url).netloc.lower())
+        except HTTPStatusError as e:
+            # Retries are used up, classify the last response as usual
+            return e.code, e.headers
+
+    def _checked_request(self, method: str, url: str, headers: Dict = None) -> Tuple[int, http.client.HTTPMessage]:
+        # The pool returns every status, server errors and 429s must reach the breaker as failures
+        code, response_headers = self.pool.request(method, url, headers)
+        if is_failure_status(code):
+            raise HTTPStatusError(code, response_headers)
+        return code, response_headers
+
+    def _probe(self, url: str, slot=None) -> str:
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                code, headers = self._request('HEAD', url)
+
+                if code in HEAD_REJECTED_STATUSES:
+                    # Some sites refuse HEAD, ask for a single byte instead
+                    code, headers = self._request('GET', url, {'Range': 'bytes=0-0'})
+
+                if slot:
+                    slot.observe_status(code)
+
+                if 300 <= code < 400 and headers.get('Location'):
+                    url = urljoin(url, headers['Location'])
+                    continue
+
+                if code in MISSING_STATUSES:
+                    return MISSING
+                if 200 <= code < 300:
+                    return EXISTS
+                return UNKNOWN
+
+            return UNKNOWN
+
+        except Exception as e:
+            if slot:
+                slot.observe_exception(e)
+            logger.debug(f"Profile check failed for {url}: {e}")
+            return UNKNOWN
+
+    def check_many(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Check distinct URLs concurrently, identical slugs are requested once"""
+        unique = list(dict.fromkeys(url for url in urls if url))
+        if not unique:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique))) as executor:
+            results = dict(zip(unique, executor.map(self.check, unique)))
+
+        logger.info(f"🔎 Checked {len(unique)} distinct profile URLs ({self.stats['cache_hits']} cache hits)")
+        return results
+
+    def close(self):
+        self.pool.close()
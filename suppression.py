@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Persistent suppression list for LeadWave™
+An on-disk, memory-mapped Bloom filter of business keys already delivered
+"""
+
+import os
+import re
+import sys
+import math
+import mmap
+import struct
+import hashlib
+import logging
+from typing import List, Dict, Optional, Iterable
+
+from config import Config
+from canonical import dedup_key
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'LWBLOOM1'
+# magic, bit count, capacity, hash count, inserted keys, target error rate
+HEADER = struct.Struct('<8sQQIQd')
+HEADER_SIZE = 64
+MERGE_CHUNK = 1 << 20
+
+def _digits(value: str) -> str:
+    return re.sub(r'[^\d]', '', value or '')
+
+def _domain(url: str) -> str:
+    domain = re.sub(r'^[a-z]+://', '', (url or '').strip().lower()).split('/')[0]
+    return domain[4:] if domain.startswith('www.') else domain
+
+def business_keys(business: Dict) -> List[str]:
+    """Normalized phone, domain and name+zip keys for a raw record or lead dict"""
+    keys = []
+
+    phone = _digits(business.get('phone', ''))[-10:]
+    if len(phone) == 10:
+        keys.append(f"phone:{phone}")
+
+    domain = _domain(business.get('website', ''))
+    if domain:
+        keys.append(f"domain:{domain}")
+
+    name_zip = dedup_key(business.get('name') or business.get('business_name', ''), business.get('zip_code'))
+    if name_zip:
+        keys.append(name_zip)
+
+    return keys
+
+class BloomFilter:
+    """Fixed-size Bloom filter over a bytearray or a shared memory map"""
+
+    def __init__(self, bits, bit_count: int, hash_count: int, capacity: int,
+                 error_rate: float, count: int = 0, path: str = None, writable: bool = True, handle=None):
+        self._bits = bits
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.count = count
+        self.path = path
+        self.writable = writable
+        self._file = handle
+
+    @staticmethod
+    def optimal_size(capacity: int, error_rate: float) -> tuple:
+        """Bit and hash counts for the target capacity and false-positive rate"""
+        bit_count = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        hash_count = max(1, int(round(bit_count / capacity * math.log(2))))
+        return bit_count, hash_count
+
+    @classmethod
+    def create(cls, path: str = None, capacity: int = 1000000, error_rate: float = 0.001) -> 'BloomFilter':
+        """New empty filter, in memory or backed by a file"""
+        bit_count, hash_count = cls.optimal_size(capacity, error_rate)
+        byte_count = (bit_count + 7) // 8
+
+        if not path:
+            return cls(bytearray(byte_count), bit_count, hash_count, capacity, error_rate)
+
+        with open(path, 'wb') as f:
+            header = HEADER.pack(MAGIC, bit_count, capacity, hash_count, 0, error_rate)
+            f.write(header.ljust(HEADER_SIZE, b'\0'))
+            f.truncate(HEADER_SIZE + byte_count)
+
+        logger.info(f"🛡️  Created suppression filter {path} ({byte_count / 1e6:.1f} MB, k={hash_count})")
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: str, readonly: bool = False) -> 'BloomFilter':
+        """Map an existing filter file, read-only maps can be shared by many workers"""
+        handle = open(path, 'rb' if readonly else 'r+b')
+        access = mmap.ACCESS_READ if readonly else mmap.ACCESS_WRITE
+        mapped = mmap.mmap(handle.fileno(), 0, access=access)
+
+        magic, bit_count, capacity, hash_count, count, error_rate = HEADER.unpack_from(mapped, 0)
+        if magic != MAGIC:
+            mapped.close()
+            handle.close()
+            raise ValueError(f"{path} is not a LeadWave suppression filter")
+
+        bits = memoryview(mapped)[HEADER_SIZE:]
+        filter_ = cls(bits, bit_count, hash_count, capacity, error_rate, count, path, not readonly, handle)
+        filter_._mmap = mapped
+        return filter_
+
+    def _positions(self, key: str):
+        # Kirsch-Mitzenmacher double hashing from one 128-bit digest
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.bit_count
+
+    def add(self, key: str) -> bool:
+        """Insert a key, returns False if it was (probably) already present"""
+        if not self.writable:
+            raise PermissionError("Suppression filter was opened read-only")
+
+        bits = self._bits
+        added = False
+        for position in self._positions(key):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def merge(self, other: 'BloomFilter'):
+        """OR another filter with identical geometry into this one"""
+        if (other.bit_count, other.hash_count) != (self.bit_count, self.hash_count):
+            raise ValueError("Only filters with the same size and hash count can be merged")
+        if not self.writable:
+            raise PermissionError("Suppression filter was opened read-only")
+
+        length = len(self._bits)
+        for start in range(0, length, MERGE_CHUNK):
+            end = min(start + MERGE_CHUNK, length)
+            mine = int.from_bytes(self._bits[start:end], 'little')
+            theirs = int.from_bytes(other._bits[start:end], 'little')
+            self._bits[start:end] = (mine | theirs).to_bytes(end - start, 'little')
+
+        # Union size is unknown, the sum is an upper bound for fill estimates
+        self.count = min(self.count + other.count, self.bit_count)
+
+    @property
+    def estimated_error_rate(self) -> float:
+        """False-positive rate implied by the current fill"""
+        return (1 - math.exp(-self.hash_count * self.count / self.bit_count)) ** self.hash_count
+
+    def flush(self):
+        if self.path and self.writable:
+            struct.pack_into('<Q', self._mmap, 8 + 8 + 8 + 4, self.count)
+            self._mmap.flush()
+
+    def close(self):
+        self.flush()
+        if self.path:
+            self._bits.release()
+            self._mmap.close()
+            self._file.close()
+            self.path = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class SuppressionList:
+    """Business-level suppression backed by a Bloom filter"""
+
+    def __init__(self, bloom: BloomFilter):
+        self.bloom = bloom
+
+    @classmethod
+    def open(cls, path: str = None, capacity: int = None, error_rate: float = None,
+             readonly: bool = False) -> 'SuppressionList':
+        """Open the filter at path, creating it on first use"""
+        path = path or Config.SUPPRESSION_PATH
+        if path and os.path.exists(path):
+            return cls(BloomFilter.open(path, readonly))
+        return cls(BloomFilter.create(
+            path or None,
+            capacity or Config.SUPPRESSION_CAPACITY,
+            error_rate or Config.SUPPRESSION_ERROR_RATE
+        ))
+
+    def is_suppressed(self, business: Dict) -> bool:
+        """True if any key of the business was delivered before"""
+        return any(key in self.bloom for key in business_keys(business))
+
+    def add(self, business: Dict) -> int:
+        """Record a delivered business, returns how many new keys were set"""
+        return sum(self.bloom.add(key) for key in business_keys(business))
+
+    def add_many(self, businesses: Iterable[Dict]) -> int:
+        added = sum(self.add(business) for business in businesses)
+        self.bloom.flush()
+        return added
+
+    def merge(self, other: 'SuppressionList'):
+        self.bloom.merge(other.bloom)
+        self.bloom.flush()
+
+    def close(self):
+        self.bloom.close()
+
+def main():
+    if len(sys.argv) < 4 or sys.argv[1] != 'merge':
+        print("Usage: python suppression.py merge <target> <source> [<source> ...]")
+        sys.exit(1)
+
+    target = SuppressionList.open(sys.argv[2])
+    for source_path in sys.argv[3:]:
+        source = SuppressionList(BloomFilter.open(source_path, readonly=True))
+        target.merge(source)
+        source.close()
+    print(f"Merged {len(sys.argv) - 3} filters into {sys.argv[2]} (~{target.bloom.count} keys)")
+    target.close()
+
+if __name__ == "__main__":
+    main()
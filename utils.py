@@ -9,6 +9,8 @@ from urllib.parse import urlparse, urljoin
 import phonenumbers
 from phonenumbers import NumberParseException
 
+from canonical import clean_name
+
 logger = logging.getLogger(__name__)
 
 class DataValidator:
@@ -64,21 +66,8 @@ class DataValidator:
     def clean_business_name(name: str) -> str:
         """Clean and normalize business name"""
         try:
-            if not name:
-                return ""
-            
-            # Remove common suffixes from title tags
-            suffixes_to_remove = [
-                ' - Home', ' | Home', ' - Welcome', ' | Welcome',
-                ' - Official Site', ' | Official Site'
-            ]
-            
-            cleaned = name.strip()
-            for suffix in suffixes_to_remove:
-                if cleaned.endswith(suffix):
-                    cleaned = cleaned[:-len(suffix)]
-            
-            return cleaned.strip()
+            # Memoized, title suffixes such as ' - Home' are stripped once per distinct name
+            return clean_name(name)
             
         except Exception as e:
             logger.error(f"Business name cleaning error: {e}")
@@ -141,23 +130,131 @@ class URLProcessor:
             logger.error(f"URL validation error: {e}")
             return False
 
+# Pattern for US addresses
+ADDRESS_PATTERNS = [
+    r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct|Place|Pl)\s*,?\s*[A-Za-z\s]+,?\s*[A-Z]{2}\s*\d{5}',
+    r'\d+\s+[A-Za-z\s]+,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s*\d{5}'
+]
+# US ZIP codes (12345 or 12345-6789) and Canadian postal codes
+ZIP_PATTERNS = [
+    r'\b\d{5}(?:-\d{4})?\b',
+    r'\b[A-Z]\d[A-Z]\s*\d[A-Z]\d\b'
+]
+
+# The patterns are ASCII, so the bytes versions match the same spans in any ASCII-compatible encoding
+_TEXT_PATTERNS = {
+    'addresses': [re.compile(pattern, re.IGNORECASE) for pattern in ADDRESS_PATTERNS],
+    'zip_codes': [re.compile(pattern) for pattern in ZIP_PATTERNS],
+}
+_BYTES_PATTERNS = {
+    'addresses': [re.compile(pattern.encode('ascii'), re.IGNORECASE) for pattern in ADDRESS_PATTERNS],
+    'zip_codes': [re.compile(pattern.encode('ascii')) for pattern in ZIP_PATTERNS],
+}
+
+# Bytes kept from the end of one streamed chunk for matches crossing into the next
+STREAM_OVERLAP = 512
+_WIDE_BOMS = ((b'\xff\xfe\x00\x00', 'utf-32'), (b'\x00\x00\xfe\xff', 'utf-32'),
+              (b'\xff\xfe', 'utf-16'), (b'\xfe\xff', 'utf-16'))
+
+def _wide_encoding(head) -> Optional[str]:
+    """UTF-16/32 pages are not ASCII-compatible and have to be decoded before matching"""
+    head = bytes(head[:64])
+    for bom, encoding in _WIDE_BOMS:
+        if head.startswith(bom):
+            return encoding
+    if head.count(b'\x00') * 4 > len(head):
+        return 'utf-16-le' if head[1:2] == b'\x00' else 'utf-16-be'
+    return None
+
+def _decode_span(raw: bytes, encoding: Optional[str] = None) -> str:
+    try:
+        return raw.decode('utf-8')
+    except UnicodeDecodeError:
+        return raw.decode(encoding or 'cp1252', 'replace')
+
+class StreamingExtractor:
+    """Incremental bytes-level extraction over a body that arrives in chunks
+
+    Matches are found in the raw bytes and only their spans are decoded. The
+    last STREAM_OVERLAP bytes of each chunk are held back until the next one,
+    so a match crossing a boundary is found whole (matches longer than the
+    overlap can be missed).
+    """
+
+    def __init__(self, kinds=('addresses', 'zip_codes'), overlap: int = STREAM_OVERLAP,
+                 encoding: Optional[str] = None):
+        self.patterns = [(kind, pattern) for kind in kinds for pattern in _BYTES_PATTERNS[kind]]
+        self.overlap = overlap
+        self.encoding = encoding
+        self.results: Dict[str, set] = {kind: set() for kind in kinds}
+        self._buffer = bytearray()
+        self._base = 0
+        self._resume = [0] * len(self.patterns)
+        self._wide: Optional[str] = None
+        self._started = False
+
+    def feed(self, chunk) -> 'StreamingExtractor':
+        if not self._started:
+            self._started = True
+            self._wide = _wide_encoding(chunk)
+        self._buffer += chunk
+        if not self._wide:
+            self._scan(final=False)
+        return self
+
+    def close(self) -> Dict[str, List[str]]:
+        if self._wide:
+            # Rare on the web, decode the whole page and use the text patterns
+            text = self._buffer.decode(self._wide, 'replace')
+            for kind in self.results:
+                for pattern in _TEXT_PATTERNS[kind]:
+                    self.results[kind].update(pattern.findall(text))
+        else:
+            self._scan(final=True)
+        self._buffer = bytearray()
+        return {kind: list(values) for kind, values in self.results.items()}
+
+    def _scan(self, final: bool):
+        buffer = self._buffer
+        limit = len(buffer) if final else len(buffer) - self.overlap
+        if limit <= 0:
+            return
+
+        for index, (kind, pattern) in enumerate(self.patterns):
+            resume = limit
+            for match in pattern.finditer(buffer, self._resume[index] - self._base):
+                if match.end() > limit:
+                    # May still grow with the next chunk, look again from its start
+                    resume = min(match.start(), limit)
+                    break
+                # Spans are decoded at once, the buffer is trimmed below
+                self.results[kind].add(_decode_span(match.group(), self.encoding))
+                resume = max(limit, match.end())
+            self._resume[index] = self._base + resume
+
+        # Keep a little context before the earliest resume point for \b and lookbehinds
+        cut = max(0, min(self._resume) - self._base - 16)
+        if cut:
+            del buffer[:cut]
+            self._base += cut
+
 class TextProcessor:
-    """Text processing utilities with error handling"""
+    """Text processing utilities with error handling
+    
+    Extraction accepts str, or bytes-like page buffers (bytes, bytearray,
+    memoryview, mmap) which are matched without decoding the whole page.
+    """
     
     @staticmethod
-    def extract_addresses(text: str) -> List[str]:
-        """Extract potential addresses from text"""
+    def extract_addresses(text) -> List[str]:
+        """Extract potential addresses from text or a raw page buffer"""
         try:
-            # Pattern for US addresses
-            address_patterns = [
-                r'\d+\s+[A-Za-z\s]+(?:Street|St|Avenue|Ave|Road|Rd|Boulevard|Blvd|Drive|Dr|Lane|Ln|Way|Court|Ct|Place|Pl)\s*,?\s*[A-Za-z\s]+,?\s*[A-Z]{2}\s*\d{5}',
-                r'\d+\s+[A-Za-z\s]+,\s*[A-Za-z\s]+,\s*[A-Z]{2}\s*\d{5}'
-            ]
+            if not isinstance(text, str):
+                return TextProcessor.extract_from_buffer(text, ('addresses',))['addresses']
             
             addresses = []
-            for pattern in address_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
-                addresses.extend(matches)
+            for pattern in _TEXT_PATTERNS['addresses']:
+                addresses.extend(pattern.findall(text))
             
             return list(set(addresses))
             
@@ -166,25 +263,42 @@ class TextProcessor:
             return []
     
     @staticmethod
-    def extract_zip_codes(text: str) -> List[str]:
-        """Extract ZIP codes from text"""
+    def extract_zip_codes(text) -> List[str]:
+        """Extract ZIP codes from text or a raw page buffer"""
         try:
-            # US ZIP code patterns
-            zip_patterns = [
-                r'\b\d{5}(?:-\d{4})?\b',  # 12345 or 12345-6789
-                r'\b[A-Z]\d[A-Z]\s*\d[A-Z]\d\b'  # Canadian postal codes
-            ]
+            if not isinstance(text, str):
+                return TextProcessor.extract_from_buffer(text, ('zip_codes',))['zip_codes']
             
             zip_codes = []
-            for pattern in zip_patterns:
-                matches = re.findall(pattern, text)
-                zip_codes.extend(matches)
+            for pattern in _TEXT_PATTERNS['zip_codes']:
+                zip_codes.extend(pattern.findall(text))
             
             return list(set(zip_codes))
             
         except Exception as e:
             logger.error(f"ZIP code extraction error: {e}")
             return []
+    
+    @staticmethod
+    def extract_from_buffer(buffer, kinds=('addresses', 'zip_codes'),
+                            encoding: Optional[str] = None) -> Dict[str, List[str]]:
+        """Run the bytes patterns over a whole buffer, decoding only matched spans
+        
+        encoding is used for spans that are not valid UTF-8 (cp1252 by default).
+        """
+        view = memoryview(buffer).cast('B')
+        wide = _wide_encoding(view)
+        if wide:
+            extractor = StreamingExtractor(kinds, encoding=encoding)
+            return extractor.feed(view).close()
+        
+        results = {}
+        for kind in kinds:
+            found = set()
+            for pattern in _BYTES_PATTERNS[kind]:
+                found.update(_decode_span(raw, encoding) for raw in pattern.findall(view))
+            results[kind] = list(found)
+        return results
 
 def safe_get_text(element, default: str = "") -> str:
     """Safely extract text from BeautifulSoup element"""